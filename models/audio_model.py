@@ -25,7 +25,7 @@
 创建时间: 2024
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, asdict
 from typing import Optional, Dict, Any, List
 from pydub import AudioSegment
 
@@ -264,6 +264,54 @@ class VoiceConfig:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class SubtitleStyle:
+    """
+    字幕样式模型
+    
+    ASS/SSA字幕的样式参数，不可变。输出配置中以字典形式保存，
+    键名与字幕转换器的样式键一致。
+    
+    Attributes:
+        fontname (str): 字体名称
+        fontsize (int): 字体大小
+        primarycolor (str): 主颜色（&HAABBGGRR）
+        secondarycolor (str): 次颜色
+        outlinecolor (str): 边框颜色
+        backcolor (str): 阴影颜色
+        bold (int): 粗体（0或1）
+        italic (int): 斜体（0或1）
+        underline (int): 下划线（0或1）
+        alignment (int): 对齐方式（小键盘位置1-9）
+        margin_l (int): 左边距
+        margin_r (int): 右边距
+        margin_v (int): 垂直边距
+    """
+    fontname: str = 'Arial'
+    fontsize: int = 20
+    primarycolor: str = '&H00FFFFFF'
+    secondarycolor: str = '&H000000FF'
+    outlinecolor: str = '&H00000000'
+    backcolor: str = '&H80000000'
+    bold: int = 0
+    italic: int = 0
+    underline: int = 0
+    alignment: int = 2
+    margin_l: int = 10
+    margin_r: int = 10
+    margin_v: int = 10
+    
+    def to_dict(self) -> dict:
+        """转换为字典格式（用于保存到输出配置）"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SubtitleStyle':
+        """从字典创建字幕样式，忽略未知的键，缺少的键使用默认值"""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in (data or {}).items() if key in names})
+
+
 @dataclass
 class OutputConfig:
     """
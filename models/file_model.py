@@ -25,12 +25,16 @@
 创建时间: 2024
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
 
+# 界面显示时间格式
+TIME_DISPLAY_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
 @dataclass
 class FileModel:
     """
@@ -47,6 +51,9 @@ class FileModel:
         created_time (datetime): 创建时间
         modified_time (datetime): 修改时间
         content (Optional[str]): 文件内容（可选）
+        size_mb_text (str): 格式化后的文件大小（MB，两位小数），创建时计算
+        created_time_text (str): 格式化后的创建时间，创建时计算
+        modified_time_text (str): 格式化后的修改时间，创建时计算
     """
     file_path: str
     file_name: str
@@ -55,15 +62,22 @@ class FileModel:
     created_time: datetime
     modified_time: datetime
     content: Optional[str] = None
+    size_mb_text: str = field(init=False, repr=False, compare=False)
+    created_time_text: str = field(init=False, repr=False, compare=False)
+    modified_time_text: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """
         初始化后处理
         
-        在对象创建后自动执行，如果文件名为空则从路径中提取。
+        在对象创建后自动执行，如果文件名为空则从路径中提取，
+        并预先格式化文件大小和时间供界面直接使用。
         """
         if not self.file_name:
             self.file_name = Path(self.file_path).name
+        self.size_mb_text = f"{self.get_size_mb():.2f}"
+        self.created_time_text = self.created_time.strftime(TIME_DISPLAY_FORMAT)
+        self.modified_time_text = self.modified_time.strftime(TIME_DISPLAY_FORMAT)
     
     @classmethod
     def from_path(cls, file_path: str) -> 'FileModel':
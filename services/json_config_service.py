@@ -11,22 +11,39 @@ from models.config_model import AppConfig
 from models.audio_model import VoiceConfig, OutputConfig
 from utils.log_manager import LogManager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class JsonConfigService:
     """JSON配置管理服务"""
     
+    # 共享实例（默认配置文件），由 instance() 创建
+    _instance = None
+    
+    @classmethod
+    def instance(cls) -> 'JsonConfigService':
+        """获取使用默认配置文件的共享实例（只在界面线程中使用）"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def __init__(self, config_file: str = 'config.json'):
         self.logger = LogManager().get_logger("JsonConfigService")
         self.config_file = Path(config_file)
         self.config_data = {}
         self._default_config = self._create_default_config()
+        # 最近写入的文件：路径 -> (内容, 写入后的(修改时间, 大小))，内容和文件都未变化时不再重写
+        self._written_files = {}
     
     def load_config(self) -> AppConfig:
         """加载配置"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config_data = json.load(f)
+                self.config_data = self._read_json(self.config_file)
                 self.logger.info(f"配置文件加载成功: {self.config_file}")
             else:
                 self.logger.info("配置文件不存在，创建默认配置")
@@ -47,8 +64,7 @@ class JsonConfigService:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
             # 保存配置文件
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            self._write_json(self.config_file, self.config_data)
             
             self.logger.info(f"配置保存成功: {self.config_file}")
             
@@ -81,8 +97,7 @@ class JsonConfigService:
             export_path = Path(export_path)
             export_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            self._write_json(export_path, self.config_data)
             
             self.logger.info(f"配置导出成功: {export_path}")
             
@@ -90,13 +105,12 @@ class JsonConfigService:
             self.logger.error(f"配置导出失败: {e}")
             raise ConfigurationError(f"配置导出失败: {e}")
     
-    def import_config(self, import_path: str):
-        """导入配置"""
+    def import_config(self, import_path: str) -> Dict[str, Any]:
+        """导入配置，返回导入文件中解析出的配置数据"""
         try:
             import_path = Path(import_path)
             
-            with open(import_path, 'r', encoding='utf-8') as f:
-                imported_data = json.load(f)
+            imported_data = self._read_json(import_path)
             
             # 合并配置
             self.config_data.update(imported_data)
@@ -105,6 +119,7 @@ class JsonConfigService:
             self.save_config(self._parse_config())
             
             self.logger.info(f"配置导入成功: {import_path}")
+            return imported_data
             
         except Exception as e:
             self.logger.error(f"配置导入失败: {e}")
@@ -138,9 +153,8 @@ class JsonConfigService:
             # 尝试从configs文件夹加载引擎特定的配置文件
             engine_config_path = Path(f"configs/{engine}.json")
             if engine_config_path.exists():
-                with open(engine_config_path, 'r', encoding='utf-8') as f:
-                    engine_config_data = json.load(f)
-                    
+                engine_config_data = self._read_json(engine_config_path)
+                
                 # 合并引擎特定的参数到voice_config
                 voice_config.voice_name = engine_config_data.get('voice_name', voice_config.voice_name)
                 voice_config.output_format = engine_config_data.get('output_format', 'wav')
@@ -182,8 +196,7 @@ class JsonConfigService:
             
             # 保存到文件
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            self._write_json(self.config_file, self.config_data)
             
             self.logger.info("语音配置保存成功")
             
@@ -266,8 +279,7 @@ class JsonConfigService:
             
             # 保存到文件
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            self._write_json(self.config_file, self.config_data)
             
             self.logger.info("输出配置保存成功")
             
@@ -275,6 +287,41 @@ class JsonConfigService:
             self.logger.error(f"保存输出配置失败: {e}")
             raise ConfigurationError(f"保存输出配置失败: {e}")
     
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        """读取JSON文件（可用时使用 orjson 解析）"""
+        if ORJSON_AVAILABLE:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write_json(self, path: Path, data: Dict[str, Any]):
+        """写入JSON文件（可用时使用 orjson 序列化）
+        
+        orjson 与 json.dump 同样缩进2格、不转义非ASCII字符，非字符串键同样转换为字符串，
+        但浮点数的指数写法不同（如 1e-7 与 1e-07），两者输出不保证逐字节一致。
+        内容与上次写入相同且文件之后未被修改（修改时间和大小都未变）时跳过写入。
+        """
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        
+        key = str(Path(path).resolve())
+        written = self._written_files.get(key)
+        if written is not None and written[0] == content:
+            try:
+                stat = os.stat(path)
+                if (stat.st_mtime_ns, stat.st_size) == written[1]:
+                    return
+            except OSError:
+                pass
+        
+        with open(path, 'wb') as f:
+            f.write(content)
+        stat = os.stat(path)
+        self._written_files[key] = (content, (stat.st_mtime_ns, stat.st_size))
+    
     def _create_default_config(self) -> AppConfig:
         """创建默认配置"""
         return AppConfig()
@@ -5,6 +5,7 @@
 """
 
 import json
+import marshal
 import sys
 from pathlib import Path
 from typing import Dict, Any, Callable
@@ -12,6 +13,10 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from utils.log_manager import LogManager
 
 
+# 已解析UI文本的磁盘缓存目录
+UI_TEXT_CACHE_DIR = Path.home() / ".cache" / "play-ebook-tts"
+
+
 class LanguageService(QObject):
     """语言服务类"""
     
@@ -23,6 +28,7 @@ class LanguageService(QObject):
         self.current_language = "zh-CN"
         self.language_config = {}
         self.ui_texts = {}
+        self._text_cache = {}  # 键路径 -> (文本, 是否可格式化)，切换语言时清空
         self.language_change_callbacks = []
         
         self._load_language_config()
@@ -130,30 +136,63 @@ class LanguageService(QObject):
                 # 开发环境
                 ui_config_path = Path(__file__).parent.parent / "configs" / "dicts" / ui_config_file
             
-            with open(ui_config_path, "r", encoding="utf-8") as f:
-                self.ui_texts = json.load(f)
+            self.ui_texts = self._read_ui_texts(ui_config_path)
+            self._text_cache.clear()
             self.logger.info(f"UI文本加载成功: {self.current_language}")
         except Exception as e:
             self.logger.error(f"加载UI文本失败: {e}")
     
+    def _read_ui_texts(self, ui_config_path: Path) -> dict:
+        """读取UI文本文件，源文件未改变时使用磁盘缓存（marshal格式）"""
+        stat = ui_config_path.stat()
+        source_key = (stat.st_mtime_ns, stat.st_size)
+        cache_path = UI_TEXT_CACHE_DIR / f"tr_{self.current_language}.marshal"
+        
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, cached_path, ui_texts = marshal.load(f)
+            if cached_key == source_key and cached_path == str(ui_config_path):
+                return ui_texts
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        
+        with open(ui_config_path, "r", encoding="utf-8") as f:
+            ui_texts = json.load(f)
+        
+        try:
+            UI_TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                marshal.dump((source_key, str(ui_config_path), ui_texts), f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"写入UI文本缓存失败: {e}")
+        return ui_texts
+    
     def get_text(self, key_path: str, **kwargs) -> str:
         """获取UI文本"""
         try:
-            keys = key_path.split(".")
-            value = self.ui_texts
-            for key in keys:
-                if isinstance(value, dict) and key in value:
-                    value = value[key]
-                else:
-                    return key_path
+            cached = self._text_cache.get(key_path)
+            if cached is None:
+                cached = self._resolve_text(key_path)
+                self._text_cache[key_path] = cached
             
-            if isinstance(value, str) and kwargs:
-                return value.format(**kwargs)
-            return str(value)
+            text, formattable = cached
+            if formattable and kwargs:
+                return text.format(**kwargs)
+            return text
         except Exception as e:
             self.logger.error(f"获取UI文本失败: {e}")
             return key_path
     
+    def _resolve_text(self, key_path: str) -> tuple:
+        """按键路径在当前语言的UI文本中查找，返回 (文本, 是否可格式化)"""
+        value = self.ui_texts
+        for key in key_path.split("."):
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                return key_path, False
+        return str(value), isinstance(value, str)
+    
     def get_current_language(self) -> str:
         """获取当前语言"""
         return self.current_language
@@ -1,13 +1,20 @@
 """
 UI界面层
+
+各界面类在首次访问时才导入，导入 ui 包本身不会加载全部界面及其依赖。
 """
 
-from .main_window import MainWindow
-from .file_manager import FileManagerWidget
-from .text_processor import TextProcessorWidget
-from .voice_settings import VoiceSettingsWidget
-from .batch_processor import BatchProcessorWidget
-from .settings import SettingsWidget
+import importlib
+
+# 公共类名 -> 所在子模块
+_LAZY_EXPORTS = {
+    'MainWindow': '.main_window',
+    'FileManagerWidget': '.file_manager',
+    'TextProcessorWidget': '.text_processor',
+    'VoiceSettingsWidget': '.voice_settings',
+    'BatchProcessorWidget': '.batch_processor',
+    'SettingsWidget': '.settings',
+}
 
 __all__ = [
     'MainWindow',
@@ -17,3 +24,13 @@ __all__ = [
     'BatchProcessorWidget',
     'SettingsWidget'
 ]
+
+
+def __getattr__(name):
+    """按需导入界面类"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
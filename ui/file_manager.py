@@ -2,18 +2,207 @@
 文件管理界面
 """
 
+import os
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QListWidget, QListWidgetItem, QFileDialog,
+    QPushButton, QListView, QFileDialog, QFileIconProvider,
     QMessageBox, QProgressBar, QFrame, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QMimeData
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QThread, QMimeData, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QPersistentModelIndex, QTimer, QFileInfo
+)
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QIcon, QPixmap
 
 from controllers.file_controller import FileController
 from models.file_model import FileModel
 from utils.log_manager import LogManager
-from services.language_service import get_text as tr
+from utils.icon_utils import get_icon
+from services.language_service import get_language_service, get_text as tr
+
+
+# 导入中占位行使用的共享图标
+PLACEHOLDER_ICON = "file.svg"
+
+
+class FileImportSignals(QObject):
+    """文件导入任务信号"""
+    
+    imported = pyqtSignal(str, FileModel)  # 文件路径, 导入成功的文件模型
+    failed = pyqtSignal(str, str)  # 文件路径, 错误信息
+
+
+class FileImportTask(QRunnable):
+    """文件导入任务（在线程池中执行）"""
+    
+    def __init__(self, file_controller: FileController, file_path: str):
+        super().__init__()
+        self.file_controller = file_controller
+        self.file_path = file_path
+        self.signals = FileImportSignals()
+    
+    def run(self):
+        """执行导入"""
+        try:
+            file_model = self.file_controller.import_file(self.file_path)
+            self.signals.imported.emit(self.file_path, file_model)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+
+
+class FilePreviewSignals(QObject):
+    """文件预览任务信号"""
+    
+    ready = pyqtSignal(str)  # 预览文本
+
+
+class FilePreviewTask(QRunnable):
+    """文件预览任务（在线程池中执行）"""
+    
+    def __init__(self, file_controller: FileController, file_path: str):
+        super().__init__()
+        self.file_controller = file_controller
+        self.file_path = file_path
+        self.signals = FilePreviewSignals()
+    
+    def run(self):
+        """生成预览"""
+        # get_file_preview 内部已处理异常并返回提示文本
+        self.signals.ready.emit(self.file_controller.get_file_preview(self.file_path))
+
+
+class FileListModel(QAbstractListModel):
+    """
+    文件列表模型
+    
+    直接以FileModel列表作为数据源，视图只为可见行请求显示数据，
+    图标和工具提示在Qt请求时才生成。
+    
+    正在导入的文件先以路径字符串作为占位行插入，导入完成后原位替换为FileModel。
+    """
+    
+    def __init__(self, files: list, icon_getter, labels: dict, parent=None):
+        super().__init__(parent)
+        self._files = files
+        self._icon_getter = icon_getter
+        self._labels = labels  # 由FileManagerWidget维护的翻译标签缓存
+        self.pending_count = 0  # 占位行数量
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._files)
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._files):
+            return None
+        
+        file_model = self._files[index.row()]
+        if isinstance(file_model, str):
+            return self._placeholder_data(file_model, role)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return file_model.file_name
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon_getter(file_model)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # 悬停时才生成工具提示
+            labels = self._labels
+            return "\n".join((
+                f"{labels['file']}: {file_model.file_name}",
+                f"{labels['size']}: {file_model.size_mb_text} {labels['mb']}",
+                f"{labels['type']}: {file_model.file_type}",
+                f"{labels['path']}: {file_model.file_path}",
+            ))
+        if role == Qt.ItemDataRole.UserRole:
+            return file_model
+        return None
+    
+    def _placeholder_data(self, file_path: str, role):
+        """占位行数据"""
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{Path(file_path).name} ({self._labels['loading']})"
+        if role == Qt.ItemDataRole.DecorationRole:
+            return get_icon(PLACEHOLDER_ICON)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return file_path
+        return None
+    
+    def add_file(self, file_model: FileModel):
+        """追加文件"""
+        row = len(self._files)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._files.append(file_model)
+        self.endInsertRows()
+    
+    def add_placeholders(self, file_paths: list) -> int:
+        """批量追加占位行（只发送一次插入通知），返回首行行号"""
+        first_row = len(self._files)
+        if file_paths:
+            self.beginInsertRows(QModelIndex(), first_row, first_row + len(file_paths) - 1)
+            self._files.extend(file_paths)
+            self.pending_count += len(file_paths)
+            self.endInsertRows()
+        return first_row
+    
+    def set_file(self, row: int, file_model: FileModel):
+        """用导入完成的文件替换占位行"""
+        if isinstance(self._files[row], str):
+            self.pending_count -= 1
+        self._files[row] = file_model
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+    
+    def remove_row(self, row: int):
+        """按行号移除文件"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        if isinstance(self._files[row], str):
+            self.pending_count -= 1
+        del self._files[row]
+        self.endRemoveRows()
+    
+    def clear(self):
+        """清空文件"""
+        self.beginResetModel()
+        self._files.clear()
+        self.pending_count = 0
+        self.endResetModel()
+
+
+class FileModelsView(Sequence):
+    """
+    文件列表的只读视图
+    
+    直接引用文件列表而不复制，列表变化后视图随之变化；
+    导入中的占位行不计入，没有占位行时按下标访问为 O(1)。
+    """
+    
+    def __init__(self, files: list, list_model: FileListModel):
+        self._files = files
+        self._list_model = list_model
+    
+    def _loaded_files(self) -> list:
+        """没有占位行时返回列表本身，否则返回过滤后的文件"""
+        if not self._list_model.pending_count:
+            return self._files
+        return [file_model for file_model in self._files if isinstance(file_model, FileModel)]
+    
+    def __len__(self) -> int:
+        return len(self._files) - self._list_model.pending_count
+    
+    def __getitem__(self, index):
+        items = self._loaded_files()[index]
+        return tuple(items) if isinstance(index, slice) else items
+    
+    def __iter__(self) -> Iterator[FileModel]:
+        if not self._list_model.pending_count:
+            return iter(self._files)
+        return (file_model for file_model in self._files if isinstance(file_model, FileModel))
 
 
 class FileManagerWidget(QWidget):
@@ -23,14 +212,54 @@ class FileManagerWidget(QWidget):
     file_selected = pyqtSignal(str)  # 文件选择信号
     file_imported = pyqtSignal(str)  # 文件导入信号
     
+    # 预览缓存最大条目数
+    PREVIEW_CACHE_SIZE = 32
+    
+    # 选择防抖间隔（毫秒）
+    SELECTION_DEBOUNCE_MS = 120
+    
+    # 文件图标缓存（类型 -> QIcon），首次使用时填充
+    _icon_cache = {}
+    
     def __init__(self, file_controller: FileController):
         super().__init__()
         self.file_controller = file_controller
         self.logger = LogManager().get_logger("FileManagerWidget")
         
-        # 文件列表
+        # 文件列表（导入中的文件以路径字符串占位）
         self.file_models = []
         
+        # 系统文件图标提供器（使用系统缓存的类型图标）
+        self.icon_provider = QFileIconProvider()
+        
+        # 正在后台导入的文件：路径 -> 占位行索引（也用于重复检查）
+        self.importing_paths = {}
+        
+        # 后台导入进度（所有未完成批次合计）
+        self.import_total = 0
+        self.import_done = 0
+        
+        # 后台导入中跳过或失败的文件：消息键 -> 条目列表，全部完成后汇总提示一次
+        self.import_issues = {"file_exists": [], "unsupported_format": [], "add_file_failed": []}
+        
+        # 选择防抖：键盘快速切换时只处理最后一次选择
+        self.pending_selection = QPersistentModelIndex()
+        self.selection_timer = QTimer(self)
+        self.selection_timer.setSingleShot(True)
+        self.selection_timer.setInterval(self.SELECTION_DEBOUNCE_MS)
+        self.selection_timer.timeout.connect(self.apply_file_selection)
+        
+        # 代码修改模型时当前行会被Qt移动，这期间的当前行变化不是用户选择
+        self.updating_file_list = False
+        
+        # 文件预览缓存：(路径, 修改时间ns, 大小) -> 预览文本
+        self.preview_cache = OrderedDict()
+        
+        # 文件信息翻译标签缓存（工具提示和信息面板共用）
+        self.file_info_labels = {}
+        self.refresh_file_info_labels()
+        get_language_service().language_changed.connect(self.refresh_file_info_labels)
+        
         # 初始化UI
         self.setup_ui()
         self.setup_connections()
@@ -54,7 +283,7 @@ class FileManagerWidget(QWidget):
         
         # 导入文件按钮
         self.import_button = QPushButton(tr("file_manager.import_file"))
-        self.import_button.setIcon(QIcon("resources/icons/upload.svg"))
+        self.import_button.setIcon(get_icon("upload.svg"))
         self.import_button.clicked.connect(self.import_file)
         button_layout.addWidget(self.import_button)
         
@@ -66,9 +295,12 @@ class FileManagerWidget(QWidget):
         layout.addLayout(button_layout)
         
         # 文件列表
-        self.file_list = QListWidget()
+        self.file_list_model = FileListModel(self.file_models, self.get_file_icon, self.file_info_labels, self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_list_model)
         self.file_list.setAlternatingRowColors(True)
-        self.file_list.itemClicked.connect(self.on_file_clicked)
+        self.file_list.clicked.connect(self.on_file_clicked)
+        self.file_list.selectionModel().currentChanged.connect(self.on_current_file_changed)
         layout.addWidget(self.file_list)
         
         # 进度条
@@ -112,6 +344,20 @@ class FileManagerWidget(QWidget):
         
         info_layout.addLayout(button_layout)
     
+    def refresh_file_info_labels(self, *_):
+        """缓存文件信息相关的翻译标签（语言改变时刷新）"""
+        self.file_info_labels.update({
+            'file': tr('file_manager.file_info.file'),
+            'size': tr('file_manager.file_info.size'),
+            'mb': tr('file_manager.file_info.mb'),
+            'type': tr('file_manager.file_info.type'),
+            'path': tr('file_manager.file_info.path'),
+            'file_name': tr('file_manager.file_info.file_name'),
+            'created': tr('file_manager.file_info.created_time'),
+            'modified': tr('file_manager.file_info.modified_time'),
+            'loading': tr('common.loading'),
+        })
+    
     def setup_connections(self):
         """设置信号槽连接"""
         pass
@@ -126,11 +372,9 @@ class FileManagerWidget(QWidget):
     def dropEvent(self, event: QDropEvent):
         """拖拽放下事件"""
         try:
-            urls = event.mimeData().urls()
-            file_paths = [url.toLocalFile() for url in urls if url.isLocalFile()]
-            
-            for file_path in file_paths:
-                self.add_file(file_path)
+            # 生成器逐个产出本地文件路径，跳过非本地URL和空路径
+            file_paths = (url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile())
+            self.import_files(file_path for file_path in file_paths if file_path)
             
             event.acceptProposedAction()
             
@@ -165,8 +409,11 @@ class FileManagerWidget(QWidget):
     def add_file(self, file_path: str):
         """添加文件"""
         try:
-            # 检查文件是否已存在
-            for file_model in self.file_models:
+            # 检查文件是否已存在（包括正在导入的文件）
+            if file_path in self.importing_paths:
+                QMessageBox.information(self, tr("file_manager.messages.info"), tr("file_manager.messages.file_exists"))
+                return
+            for file_model in self.iter_files():
                 if file_model.file_path == file_path:
                     QMessageBox.information(self, tr("file_manager.messages.info"), tr("file_manager.messages.file_exists"))
                     return
@@ -176,69 +423,170 @@ class FileManagerWidget(QWidget):
                 QMessageBox.warning(self, tr("file_manager.messages.warning"), tr("file_manager.messages.unsupported_format"))
                 return
             
-            # 显示进度条
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)  # 不确定进度
-            
             # 导入文件
             file_model = self.file_controller.import_file(file_path)
-            self.file_models.append(file_model)
             
             # 添加到列表
             self.add_file_to_list(file_model)
             
-            # 隐藏进度条
-            self.progress_bar.setVisible(False)
-            
             # 发送信号
             self.file_imported.emit(file_path)
             
             self.logger.info(f"文件添加成功: {file_path}")
             
         except Exception as e:
-            self.progress_bar.setVisible(False)
             self.logger.error(f"添加文件失败: {e}")
             QMessageBox.critical(self, tr("file_manager.messages.error"), tr("file_manager.messages.add_file_failed", error=str(e)))
     
+    def import_files(self, file_paths: Iterable[str]):
+        """批量导入文件（一次性提交到线程池，按文件更新进度）"""
+        existing_paths = {file_model.file_path for file_model in self.iter_files()}
+        existing_paths.update(self.importing_paths)
+        pending_paths = []
+        for file_path in file_paths:
+            if file_path in existing_paths:
+                self.logger.info(f"文件已存在，跳过: {file_path}")
+                self.import_issues["file_exists"].append(os.path.basename(file_path))
+                continue
+            if not self.file_controller.validate_file(file_path):
+                self.logger.warning(f"不支持的文件格式，跳过: {file_path}")
+                self.import_issues["unsupported_format"].append(os.path.basename(file_path))
+                continue
+            existing_paths.add(file_path)
+            pending_paths.append(file_path)
+        
+        if not pending_paths:
+            # 没有其他批次在导入时立即提示，否则等全部完成后一起提示
+            if not self.import_total:
+                self.show_import_summary()
+            return
+        
+        # 确定进度：连续的多次拖放共用同一个进度条，每个文件完成后前进一格
+        self.import_total += len(pending_paths)
+        self.progress_bar.setRange(0, self.import_total)
+        self.progress_bar.setValue(self.import_done)
+        if not self.progress_bar.isVisible():
+            self.progress_bar.setVisible(True)
+        
+        # 先一次性插入占位行，列表立即显示所有文件
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            first_row = self.update_file_list(self.file_list_model.add_placeholders, pending_paths)
+        finally:
+            self.file_list.setUpdatesEnabled(True)
+            self.file_list.viewport().update()
+        
+        thread_pool = QThreadPool.globalInstance()
+        for row, file_path in enumerate(pending_paths, first_row):
+            self.importing_paths[file_path] = QPersistentModelIndex(self.file_list_model.index(row, 0))
+            task = FileImportTask(self.file_controller, file_path)
+            task.signals.imported.connect(self.on_file_import_finished)
+            task.signals.failed.connect(self.on_file_import_failed)
+            thread_pool.start(task)
+    
+    def on_file_import_finished(self, file_path: str, file_model: FileModel):
+        """线程池导入完成，原位替换占位行"""
+        try:
+            placeholder = self.importing_paths.pop(file_path, None)
+            if placeholder is None or not placeholder.isValid():
+                # 占位行已被移除或列表已清空
+                self.logger.info(f"导入完成但占位行已移除，忽略: {file_path}")
+                return
+            
+            self.update_file_list(self.file_list_model.set_file, placeholder.row(), file_model)
+            self.file_imported.emit(file_model.file_path)
+            self.logger.info(f"文件添加成功: {file_model.file_path}")
+        finally:
+            self.advance_import_progress()
+    
+    def on_file_import_failed(self, file_path: str, error: str):
+        """线程池导入失败，移除占位行"""
+        placeholder = self.importing_paths.pop(file_path, None)
+        if placeholder is not None and placeholder.isValid():
+            self.update_file_list(self.file_list_model.remove_row, placeholder.row())
+        self.logger.error(f"添加文件失败: {file_path}, 错误: {error}")
+        self.import_issues["add_file_failed"].append(f"{os.path.basename(file_path)}: {error}")
+        self.advance_import_progress()
+    
+    def advance_import_progress(self):
+        """推进批量导入进度，全部完成后隐藏进度条"""
+        self.import_done += 1
+        if self.import_done >= self.import_total:
+            self.import_total = 0
+            self.import_done = 0
+            self.progress_bar.setVisible(False)
+            self.show_import_summary()
+        else:
+            self.progress_bar.setValue(self.import_done)
+    
+    def show_import_summary(self):
+        """汇总提示批量导入中已存在、格式不支持和导入失败的文件"""
+        issues = self.import_issues
+        if not any(issues.values()):
+            return
+        
+        lines = []
+        for key in ("file_exists", "unsupported_format"):
+            if issues[key]:
+                lines.append(f"{tr(f'file_manager.messages.{key}')}: {', '.join(issues[key])}")
+        lines.extend(tr("file_manager.messages.add_file_failed", error=entry) for entry in issues["add_file_failed"])
+        
+        # 按最严重的问题选择提示级别
+        if issues["add_file_failed"]:
+            show_message, title_key = QMessageBox.critical, "error"
+        elif issues["unsupported_format"]:
+            show_message, title_key = QMessageBox.warning, "warning"
+        else:
+            show_message, title_key = QMessageBox.information, "info"
+        
+        for entries in issues.values():
+            entries.clear()
+        show_message(self, tr(f"file_manager.messages.{title_key}"), "\n".join(lines))
+    
     def add_file_to_list(self, file_model: FileModel):
         """添加文件到列表"""
         try:
-            item = QListWidgetItem()
-            item.setText(file_model.file_name)
-            item.setData(Qt.ItemDataRole.UserRole, file_model)
-            
-            # 设置图标
-            icon = self.get_file_icon(file_model.file_type)
-            if icon:
-                item.setIcon(icon)
-            
-            # 设置工具提示
-            tooltip = f"{tr('file_manager.file_info.file')}: {file_model.file_name}\n"
-            tooltip += f"{tr('file_manager.file_info.size')}: {file_model.get_size_mb():.2f} {tr('file_manager.file_info.mb')}\n"
-            tooltip += f"{tr('file_manager.file_info.type')}: {file_model.file_type}\n"
-            tooltip += f"{tr('file_manager.file_info.path')}: {file_model.file_path}"
-            item.setToolTip(tooltip)
-            
-            self.file_list.addItem(item)
+            self.update_file_list(self.file_list_model.add_file, file_model)
             
         except Exception as e:
             self.logger.error(f"添加文件到列表失败: {e}")
     
-    def get_file_icon(self, file_type: str) -> QIcon:
-        """获取文件图标"""
-        icon_map = {
-            '.txt': QIcon("resources/icons/file.svg"),
-            '.pdf': QIcon("resources/icons/file.svg"),
-            '.epub': QIcon("resources/icons/file.svg"),
-            '.docx': QIcon("resources/icons/file.svg"),
-            '.md': QIcon("resources/icons/file.svg")
-        }
-        return icon_map.get(file_type, QIcon("resources/icons/file.svg"))
-    
-    def on_file_clicked(self, item: QListWidgetItem):
-        """文件点击事件"""
+    def get_file_icon(self, file_model: FileModel) -> QIcon:
+        """获取文件图标（按类型缓存，所有实例共享）"""
+        file_type = file_model.file_type
+        icon = FileManagerWidget._icon_cache.get(file_type)
+        if icon is None:
+            # 优先使用系统类型图标，取不到时回退到内置SVG
+            icon = self.icon_provider.icon(QFileInfo(file_model.file_path))
+            if icon.isNull():
+                icon = get_icon("file.svg")
+            FileManagerWidget._icon_cache[file_type] = icon
+        return icon
+    
+    def on_file_clicked(self, index: QModelIndex):
+        """文件点击事件（防抖后处理）"""
+        self.pending_selection = QPersistentModelIndex(index)
+        self.selection_timer.start()
+    
+    def on_current_file_changed(self, current: QModelIndex, previous: QModelIndex):
+        """当前文件改变事件（覆盖键盘导航，忽略模型修改引起的变化）"""
+        if current.isValid() and not self.updating_file_list:
+            self.on_file_clicked(current)
+    
+    def update_file_list(self, change, *args):
+        """修改文件列表模型，期间的当前行变化不当作文件选择"""
+        self.updating_file_list = True
+        try:
+            return change(*args)
+        finally:
+            self.updating_file_list = False
+    
+    def apply_file_selection(self):
+        """处理最后一次文件选择"""
         try:
-            file_model = item.data(Qt.ItemDataRole.UserRole)
+            if not self.pending_selection.isValid():
+                return
+            file_model = self.pending_selection.data(Qt.ItemDataRole.UserRole)
             if file_model:
                 self.show_file_info(file_model)
                 self.file_selected.emit(file_model.file_path)
@@ -264,12 +612,15 @@ class FileManagerWidget(QWidget):
     def show_file_info(self, file_model: FileModel):
         """显示文件信息"""
         try:
-            info_text = f"{tr('file_manager.file_info.file_name')}: {file_model.file_name}\n"
-            info_text += f"{tr('file_manager.file_info.size')}: {file_model.get_size_mb():.2f} {tr('file_manager.file_info.mb')}\n"
-            info_text += f"{tr('file_manager.file_info.type')}: {file_model.file_type}\n"
-            info_text += f"{tr('file_manager.file_info.created_time')}: {file_model.created_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            info_text += f"{tr('file_manager.file_info.modified_time')}: {file_model.modified_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            info_text += f"{tr('file_manager.file_info.path')}: {file_model.file_path}"
+            labels = self.file_info_labels
+            info_text = "\n".join((
+                f"{labels['file_name']}: {file_model.file_name}",
+                f"{labels['size']}: {file_model.size_mb_text} {labels['mb']}",
+                f"{labels['type']}: {file_model.file_type}",
+                f"{labels['created']}: {file_model.created_time_text}",
+                f"{labels['modified']}: {file_model.modified_time_text}",
+                f"{labels['path']}: {file_model.file_path}",
+            ))
             
             self.file_details.setText(info_text)
             self.file_info_frame.setVisible(True)
@@ -280,20 +631,17 @@ class FileManagerWidget(QWidget):
     def preview_file(self):
         """预览文件"""
         try:
-            current_item = self.file_list.currentItem()
-            if not current_item:
+            current_index = self.file_list.currentIndex()
+            if not current_index.isValid():
                 QMessageBox.information(self, tr("file_manager.messages.info"), tr("file_manager.messages.select_file_first"))
                 return
             
-            file_model = current_item.data(Qt.ItemDataRole.UserRole)
+            file_model = current_index.data(Qt.ItemDataRole.UserRole)
             if not file_model:
                 return
             
-            # 获取文件预览
-            preview_text = self.file_controller.get_file_preview(file_model.file_path)
-            
-            # 显示预览对话框
-            from PyQt6.QtWidgets import QDialog, QTextEdit, QVBoxLayout, QPushButton
+            # 显示预览对话框（内容在后台线程生成）
+            from PyQt6.QtWidgets import QDialog, QPlainTextEdit, QVBoxLayout, QPushButton
             
             dialog = QDialog(self)
             dialog.setWindowTitle(tr("file_manager.preview.title", file_name=file_model.file_name))
@@ -302,26 +650,64 @@ class FileManagerWidget(QWidget):
             
             layout = QVBoxLayout(dialog)
             
-            text_edit = QTextEdit()
-            text_edit.setPlainText(preview_text)
+            # 纯文本预览使用QPlainTextEdit，并限制最大行数控制内存
+            text_edit = QPlainTextEdit()
             text_edit.setReadOnly(True)
+            text_edit.setMaximumBlockCount(5000)
+            text_edit.setPlainText(tr("common.loading"))
             layout.addWidget(text_edit)
             
             close_button = QPushButton(tr("file_manager.close"))
             close_button.clicked.connect(dialog.accept)
             layout.addWidget(close_button)
             
+            cache_key = self.get_preview_cache_key(file_model.file_path)
+            cached_text = self.preview_cache.get(cache_key) if cache_key else None
+            preview_signals = None
+            if cached_text is not None:
+                self.preview_cache.move_to_end(cache_key)
+                text_edit.setPlainText(cached_text)
+            else:
+                task = FilePreviewTask(self.file_controller, file_model.file_path)
+                preview_signals = task.signals
+                preview_signals.ready.connect(text_edit.setPlainText)
+                if cache_key:
+                    preview_signals.ready.connect(partial(self.cache_preview, cache_key))
+                QThreadPool.globalInstance().start(task)
+            
             dialog.exec()
             
+            # 对话框关闭后断开信号，避免预览完成时更新已关闭的控件
+            if preview_signals is not None:
+                try:
+                    preview_signals.ready.disconnect(text_edit.setPlainText)
+                except TypeError:
+                    pass
+            
         except Exception as e:
             self.logger.error(f"预览文件失败: {e}")
             QMessageBox.critical(self, tr("file_manager.messages.error"), tr("file_manager.messages.preview_failed", error=str(e)))
     
+    def get_preview_cache_key(self, file_path: str):
+        """获取预览缓存键（文件变化后键随之变化）"""
+        try:
+            stat = os.stat(file_path)
+            return (file_path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def cache_preview(self, cache_key: tuple, preview_text: str):
+        """缓存预览文本，超出容量时淘汰最久未使用的条目"""
+        self.preview_cache[cache_key] = preview_text
+        self.preview_cache.move_to_end(cache_key)
+        while len(self.preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self.preview_cache.popitem(last=False)
+    
     def remove_file(self):
         """移除文件"""
         try:
-            current_item = self.file_list.currentItem()
-            if not current_item:
+            current_index = self.file_list.currentIndex()
+            if not current_index.isValid():
                 QMessageBox.information(self, tr("file_manager.messages.info"), tr("file_manager.messages.select_file_first"))
                 return
             
@@ -332,11 +718,10 @@ class FileManagerWidget(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                file_model = current_item.data(Qt.ItemDataRole.UserRole)
-                if file_model:
-                    self.file_models.remove(file_model)
+                file_model = current_index.data(Qt.ItemDataRole.UserRole)
+                self.selection_timer.stop()
+                self.update_file_list(self.file_list_model.remove_row, current_index.row())
                 
-                self.file_list.takeItem(self.file_list.row(current_item))
                 self.file_info_frame.setVisible(False)
                 
                 self.logger.info(f"文件移除成功: {file_model.file_name if file_model else 'Unknown'}")
@@ -359,8 +744,9 @@ class FileManagerWidget(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.file_models.clear()
-                self.file_list.clear()
+                self.selection_timer.stop()
+                self.update_file_list(self.file_list_model.clear)
+                self.importing_paths.clear()
                 self.file_info_frame.setVisible(False)
                 
                 self.logger.info("所有文件已清除")
@@ -372,18 +758,22 @@ class FileManagerWidget(QWidget):
     def get_selected_file(self) -> FileModel:
         """获取选中的文件"""
         try:
-            current_item = self.file_list.currentItem()
-            if current_item:
-                return current_item.data(Qt.ItemDataRole.UserRole)
+            current_index = self.file_list.currentIndex()
+            if current_index.isValid():
+                return current_index.data(Qt.ItemDataRole.UserRole)
             return None
         except Exception as e:
             self.logger.error(f"获取选中文件失败: {e}")
             return None
     
-    def get_all_files(self) -> list:
-        """获取所有文件"""
-        return self.file_models.copy()
+    def get_all_files(self) -> FileModelsView:
+        """获取所有文件（只读视图，不复制列表）"""
+        return FileModelsView(self.file_models, self.file_list_model)
+    
+    def iter_files(self) -> Iterator[FileModel]:
+        """遍历所有文件（只读遍历时无需复制，跳过导入中的占位行）"""
+        return iter(self.get_all_files())
     
     def get_file_count(self) -> int:
         """获取文件数量"""
-        return len(self.file_models)
+        return len(self.file_models) - self.file_list_model.pending_count
@@ -0,0 +1,43 @@
+"""
+轻量列表模型
+
+供选项较多的下拉框使用：数据保存在Python列表中，视图只为可见行请求数据，
+整体替换选项时只触发一次模型重置，不会逐项插入。
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class LazyListModel(QAbstractListModel):
+    """
+    列表模型
+    
+    每一项为 (显示文本, 用户数据)，用户数据通过 UserRole 提供，
+    与 QComboBox.addItem(text, data) 的取值方式一致（currentData、findData 可直接使用）。
+    """
+    
+    def __init__(self, items=None, parent=None):
+        super().__init__(parent)
+        self._items = list(items or [])
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        
+        label, user_data = self._items[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return label
+        if role == Qt.ItemDataRole.UserRole:
+            return user_data
+        return None
+    
+    def set_items(self, items):
+        """整体替换列表项"""
+        self.beginResetModel()
+        self._items = list(items)
+        self.endResetModel()
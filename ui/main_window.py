@@ -14,34 +14,90 @@ TTS应用程序的主窗口界面，提供：
 """
 
 import sys
+from functools import cached_property, wraps
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QTabWidget, QMenuBar, QStatusBar, QMessageBox,
-    QApplication, QSplitter, QFrame, QToolBar
+    QApplication, QSplitter, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QIcon, QAction, QKeySequence
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QAction, QKeySequence, QFont
 
 from models.config_model import AppConfig
-from controllers.file_controller import FileController
-from controllers.text_controller import TextController
-from controllers.audio_controller import AudioController
-from controllers.batch_controller import BatchController
-from controllers.settings_controller import SettingsController
-from .file_manager import FileManagerWidget
-from .text_processor import TextProcessorWidget
-from .voice_settings import VoiceSettingsWidget
-from .output_settings import OutputSettingsWidget
-from .conversion_control import ConversionControlWidget
-from .batch_processor import BatchProcessorWidget
-from .settings import SettingsWidget
-from .config_manager import ConfigManagerWidget
 from utils.log_manager import LogManager
+from utils.icon_utils import get_icon, prewarm_icons
+from utils.ui_config import UI_CONFIG_FILE, read_ui_config
 from services.theme_service import theme_service
 from services.language_service import get_language_service, get_text as tr
 
 
+def log_errors(message: str):
+    """装饰器：捕获方法中的异常并记录为 "message: 异常" 日志"""
+    def decorator(func):
+        # 与普通槽函数一致，丢弃多出的信号参数（例如 triggered 的 checked）
+        arg_count = func.__code__.co_argcount - 1
+        
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args[:arg_count], **kwargs)
+            except Exception as e:
+                self.logger.error(f"{message}: {e}")
+        return wrapper
+    return decorator
+
+
+# 主窗口样式表（模块级常量，只构建一次）
+MAIN_WINDOW_STYLE = """
+QMainWindow {
+    background-color: #f5f5f5;
+}
+
+QTabWidget::pane {
+    border: 1px solid #c0c0c0;
+    background-color: white;
+}
+
+QTabBar::tab {
+    background-color: #e0e0e0;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+
+QTabBar::tab:selected {
+    background-color: white;
+    border-bottom: 2px solid #0078d4;
+}
+
+QPushButton {
+    background-color: #0078d4;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+}
+
+QPushButton:hover {
+    background-color: #106ebe;
+}
+
+QPushButton:pressed {
+    background-color: #005a9e;
+}
+
+QLineEdit, QTextEdit, QComboBox {
+    border: 1px solid #c0c0c0;
+    padding: 4px;
+    border-radius: 4px;
+}
+
+QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+    border-color: #0078d4;
+}
+"""
+
+
 class MainWindow(QMainWindow):
     """
     主窗口类
@@ -58,10 +114,26 @@ class MainWindow(QMainWindow):
     - 信号槽机制：实现模块间的松耦合通信
     """
     
-    # 信号定义 - 用于模块间通信
-    file_imported = pyqtSignal(str)      # 文件导入完成信号
-    text_processed = pyqtSignal(str)     # 文本处理完成信号
-    audio_generated = pyqtSignal(str)    # 音频生成完成信号
+    # 标签页定义：(属性名, 标题翻译键)，顺序即显示顺序
+    TAB_SPECS = (
+        ("text_processor", "tabs.text_processing"),
+        ("voice_settings", "tabs.voice_settings"),
+        ("output_settings", "tabs.output_settings"),
+        ("conversion_control", "tabs.conversion_control"),
+        ("batch_processor", "tabs.batch_processing"),
+        ("settings_widget", "tabs.settings"),
+        ("config_manager", "tabs.config_management"),
+    )
+    
+    # 状态栏消息合并间隔（毫秒）
+    STATUS_UPDATE_INTERVAL_MS = 50
+    
+    # 工具栏图标
+    TOOLBAR_ICONS = ("upload.svg", "play.svg", "pause.svg", "stop.svg")
+    
+    # 菜单快捷键
+    SHORTCUT_OPEN = QKeySequence.StandardKey.Open
+    SHORTCUT_QUIT = QKeySequence.StandardKey.Quit
     
     def __init__(self, config):
         """
@@ -80,13 +152,17 @@ class MainWindow(QMainWindow):
         self.debug_mode = config.get('debug_mode', False)
         self.logger = LogManager().get_logger("MainWindow")
         
-        # 初始化所有控制器
-        # 控制器负责处理业务逻辑，与UI分离
-        self.file_controller = FileController()        # 文件操作控制器
-        self.text_controller = TextController()        # 文本处理控制器
-        self.audio_controller = AudioController()      # 音频处理控制器
-        self.batch_controller = BatchController()      # 批量处理控制器
-        self.settings_controller = SettingsController() # 设置管理控制器
+        # 语言服务及各语言的显示名称，例如 "简体中文 (zh-CN)"
+        self.language_service = get_language_service()
+        self.language_display_names = {
+            code: f"{info.get('name', code)} ({code})"
+            for code, info in self.language_service.language_config.get("language_info", {}).items()
+        }
+        
+        # 需要随语言切换更新的文本：(设置文本的方法, 翻译键)
+        self.translatable_texts = []
+        
+        # 控制器负责处理业务逻辑，与UI分离；在首次被界面使用时才创建（见下方各 *_controller 属性）
         
         # 先加载设置，确保语言服务正确初始化
         self.load_settings()         # 加载用户设置
@@ -95,15 +171,41 @@ class MainWindow(QMainWindow):
         self.setup_ui()              # 创建和布局UI组件
         self.setup_connections()     # 设置信号槽连接
         
-        # 应用界面样式和语言
-        self.apply_theme()           # 应用主题样式
-        self.apply_language(recreate_menu=False)  # 应用语言设置（初始化时不重新创建菜单）
-        
-        # 监听语言改变信号
-        self.setup_language_signal_connection()
+        # 应用界面样式和语言，并监听语言改变
+        self.bootstrap_appearance()
         
         self.logger.info("主窗口初始化完成")
     
+    @cached_property
+    def file_controller(self):
+        """文件操作控制器"""
+        from controllers.file_controller import FileController
+        return FileController()
+    
+    @cached_property
+    def text_controller(self):
+        """文本处理控制器"""
+        from controllers.text_controller import TextController
+        return TextController()
+    
+    @cached_property
+    def audio_controller(self):
+        """音频处理控制器"""
+        from controllers.audio_controller import AudioController
+        return AudioController()
+    
+    @cached_property
+    def batch_controller(self):
+        """批量处理控制器"""
+        from controllers.batch_controller import BatchController
+        return BatchController()
+    
+    @cached_property
+    def settings_controller(self):
+        """设置管理控制器"""
+        from controllers.settings_controller import SettingsController
+        return SettingsController()
+    
     def setup_ui(self):
         """
         设置用户界面
@@ -149,105 +251,95 @@ class MainWindow(QMainWindow):
         self.setup_styles()
     
     def create_menu_bar(self):
-        """创建菜单栏"""
-        from services.language_service import get_text as tr
+        """创建菜单栏（只创建一次，语言切换时由 retranslate_ui 更新文本）"""
         menubar = self.menuBar()
         
         # 文件菜单
-        file_menu = menubar.addMenu(tr("menu.file"))
+        file_menu = self.add_translatable_menu(menubar, "menu.file")
         
         # 导入文件
-        import_action = QAction(tr("menu.import_file"), self)
-        import_action.setShortcut(QKeySequence.StandardKey.Open)
+        import_action = self.create_translatable_action("menu.import_file")
+        import_action.setShortcut(self.SHORTCUT_OPEN)
         import_action.triggered.connect(self.import_file)
         file_menu.addAction(import_action)
         
         file_menu.addSeparator()
         
         # 退出
-        exit_action = QAction(tr("menu.exit"), self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
+        exit_action = self.create_translatable_action("menu.exit")
+        exit_action.setShortcut(self.SHORTCUT_QUIT)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
         # 编辑菜单
-        edit_menu = menubar.addMenu(tr("menu.edit"))
+        edit_menu = self.add_translatable_menu(menubar, "menu.edit")
         
         # 设置
-        settings_action = QAction(tr("menu.settings"), self)
+        settings_action = self.create_translatable_action("menu.settings")
         settings_action.triggered.connect(self.show_settings)
         edit_menu.addAction(settings_action)
         
         # 帮助菜单
-        help_menu = menubar.addMenu(tr("menu.help"))
+        help_menu = self.add_translatable_menu(menubar, "menu.help")
         
         # 关于
-        about_action = QAction(tr("menu.about"), self)
+        about_action = self.create_translatable_action("menu.about")
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
-    def recreate_menu_bar(self):
-        """重新创建菜单栏和工具栏（用于语言切换）"""
-        try:
-            # 清除现有菜单
-            menubar = self.menuBar()
-            menubar.clear()
-            
-            # 清除现有工具栏
-            for toolbar in self.findChildren(QToolBar):
-                toolbar.clear()
-                self.removeToolBar(toolbar)
-            
-            # 重新创建菜单和工具栏
-            self.create_menu_bar()
-            self.create_toolbar()
-            self.logger.info("菜单栏和工具栏已重新创建")
-            
-        except Exception as e:
-            self.logger.error(f"重新创建菜单栏和工具栏失败: {e}")
-    
-    def recreate_menu_bar_only(self):
-        """仅重新创建菜单栏（用于语言切换）"""
-        try:
-            # 清除现有菜单
-            menubar = self.menuBar()
-            menubar.clear()
-            
-            # 重新创建菜单
-            self.create_menu_bar()
-            self.logger.info("菜单栏已重新创建")
-            
-        except Exception as e:
-            self.logger.error(f"重新创建菜单栏失败: {e}")
+    def add_translatable_menu(self, menubar, key: str):
+        """添加菜单并登记其标题的翻译键"""
+        menu = menubar.addMenu(tr(key))
+        self.translatable_texts.append((menu.setTitle, key))
+        return menu
+    
+    def create_translatable_action(self, key: str) -> QAction:
+        """创建动作并登记其文本的翻译键"""
+        action = QAction(tr(key), self)
+        self.translatable_texts.append((action.setText, key))
+        return action
+    
+    @log_errors("更新界面文本失败")
+    def retranslate_ui(self):
+        """按当前语言更新窗口标题、菜单、工具栏和标签页文本"""
+        self.setWindowTitle(tr("app.title"))
+        for set_text, key in self.translatable_texts:
+            set_text(tr(key))
+        for index, (_, title_key) in enumerate(self.TAB_SPECS):
+            self.tab_widget.setTabText(index, tr(title_key))
+        self.logger.info("界面文本已按当前语言更新")
     
     def create_toolbar(self):
         """创建工具栏"""
-        from services.language_service import get_text as tr
-        toolbar = self.addToolBar(tr("toolbar.main"))
+        toolbar = self.main_toolbar = self.addToolBar(tr("toolbar.main"))
+        self.translatable_texts.append((toolbar.setWindowTitle, "toolbar.main"))
+        
+        # 按工具栏尺寸预先渲染图标
+        prewarm_icons(self.TOOLBAR_ICONS, toolbar.iconSize())
         
         # 导入文件
-        import_action = QAction(tr("toolbar.import_file"), self)
-        import_action.setIcon(QIcon('resources/icons/upload.svg'))
+        import_action = self.create_translatable_action("toolbar.import_file")
+        import_action.setIcon(get_icon("upload.svg"))
         import_action.triggered.connect(self.import_file)
         toolbar.addAction(import_action)
         
         toolbar.addSeparator()
         
         # 播放
-        play_action = QAction(tr("toolbar.play"), self)
-        play_action.setIcon(QIcon('resources/icons/play.svg'))
+        play_action = self.create_translatable_action("toolbar.play")
+        play_action.setIcon(get_icon("play.svg"))
         play_action.triggered.connect(self.play_audio)
         toolbar.addAction(play_action)
         
         # 暂停
-        pause_action = QAction(tr("toolbar.pause"), self)
-        pause_action.setIcon(QIcon('resources/icons/pause.svg'))
+        pause_action = self.create_translatable_action("toolbar.pause")
+        pause_action.setIcon(get_icon("pause.svg"))
         pause_action.triggered.connect(self.pause_audio)
         toolbar.addAction(pause_action)
         
         # 停止
-        stop_action = QAction(tr("toolbar.stop"), self)
-        stop_action.setIcon(QIcon('resources/icons/stop.svg'))
+        stop_action = self.create_translatable_action("toolbar.stop")
+        stop_action.setIcon(get_icon("stop.svg"))
         stop_action.triggered.connect(self.stop_audio)
         toolbar.addAction(stop_action)
     
@@ -264,6 +356,9 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(Qt.Orientation.Horizontal)
         main_layout.addWidget(splitter)
         
+        # 构建期间暂停重绘，面板全部加入后统一布局一次
+        central_widget.setUpdatesEnabled(False)
+        
         # 左侧面板（文件管理）
         left_panel = self.create_left_panel()
         splitter.addWidget(left_panel)
@@ -274,6 +369,8 @@ class MainWindow(QMainWindow):
         
         # 设置分割器比例
         splitter.setSizes([300, 700])
+        
+        central_widget.setUpdatesEnabled(True)
     
     def create_left_panel(self):
         """创建左侧面板"""
@@ -285,53 +382,130 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(5, 5, 5, 5)
         
         # 文件管理组件
+        from .file_manager import FileManagerWidget
         self.file_manager = FileManagerWidget(self.file_controller)
         layout.addWidget(self.file_manager)
         
         return panel
     
     def create_right_panel(self):
-        """创建右侧面板"""
+        """创建右侧面板（各标签页在首次切换到时才创建）"""
         # 创建标签页
         self.tab_widget = QTabWidget()
         
-        # 文本处理标签页
-        self.text_processor = TextProcessorWidget(self.text_controller)
-        self.tab_widget.addTab(self.text_processor, tr("tabs.text_processing"))
-        
-        # 语音设置标签页
-        self.voice_settings = VoiceSettingsWidget(self.audio_controller)
-        self.tab_widget.addTab(self.voice_settings, tr("tabs.voice_settings"))
-        
-        # 输出设置标签页
-        self.output_settings = OutputSettingsWidget()
-        self.tab_widget.addTab(self.output_settings, tr("tabs.output_settings"))
-        
-        # 建立页面间的关联
-        self.voice_settings.set_output_settings_widget(self.output_settings)
-        self.text_processor.set_output_settings_widget(self.output_settings)
-        
-        # 转换控制标签页
-        self.conversion_control = ConversionControlWidget()
-        self.conversion_control.set_output_settings_widget(self.output_settings)
-        self.conversion_control.set_voice_settings_widget(self.voice_settings)
-        self.tab_widget.addTab(self.conversion_control, tr("tabs.conversion_control"))
-        
-        # 批量处理标签页
-        self.batch_processor = BatchProcessorWidget(self.batch_controller)
-        self.tab_widget.addTab(self.batch_processor, tr("tabs.batch_processing"))
-        
-        # 设置标签页
-        self.settings_widget = SettingsWidget(self.settings_controller)
-        self.settings_widget.set_main_window(self)  # 设置主窗口引用
-        self.tab_widget.addTab(self.settings_widget, tr("tabs.settings"))
+        # 标签页创建函数：属性名 -> 创建方法
+        self.tab_builders = {
+            "text_processor": self.build_text_processor_tab,
+            "voice_settings": self.build_voice_settings_tab,
+            "output_settings": self.build_output_settings_tab,
+            "conversion_control": self.build_conversion_control_tab,
+            "batch_processor": self.build_batch_processor_tab,
+            "settings_widget": self.build_settings_tab,
+            "config_manager": self.build_config_manager_tab,
+        }
         
-        # 配置管理标签页
-        self.config_manager = ConfigManagerWidget()
-        self.tab_widget.addTab(self.config_manager, tr("tabs.config_management"))
+        # 先添加空的占位页，真正的界面在 ensure_tab 中创建
+        self.tab_pages = {}
+        self.tab_indexes = {}
+        self.tab_widget.setUpdatesEnabled(False)
+        for key, title_key in self.TAB_SPECS:
+            setattr(self, key, None)
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_pages[key] = page
+            self.tab_indexes[key] = self.tab_widget.addTab(page, tr(title_key))
+        self.tab_widget.setUpdatesEnabled(True)
+        
+        # 当前标签页立即创建，其余在切换时创建
+        self.ensure_tab(self.TAB_SPECS[0][0])
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         return self.tab_widget
     
+    def on_tab_changed(self, index: int):
+        """标签页切换事件"""
+        if 0 <= index < len(self.TAB_SPECS):
+            self.ensure_tab(self.TAB_SPECS[index][0])
+    
+    def ensure_tab(self, key: str):
+        """确保标签页界面已创建，返回界面组件"""
+        widget = getattr(self, key)
+        if widget is None:
+            try:
+                widget = self.tab_builders[key]()
+            except Exception as e:
+                self.logger.error(f"创建标签页失败: {key}, 错误: {e}")
+                return None
+            setattr(self, key, widget)
+            self.tab_pages[key].layout().addWidget(widget)
+            self.link_tab_widgets()
+            self.logger.info(f"标签页已创建: {key}")
+        return widget
+    
+    def show_tab(self, key: str):
+        """切换到指定标签页"""
+        self.tab_widget.setCurrentIndex(self.tab_indexes[key])
+    
+    def link_tab_widgets(self):
+        """在已创建的标签页之间建立关联（每次创建标签页后补齐）"""
+        if self.output_settings is not None:
+            for widget in (self.voice_settings, self.text_processor, self.conversion_control):
+                if widget is not None:
+                    widget.set_output_settings_widget(self.output_settings)
+        if self.conversion_control is not None and self.voice_settings is not None:
+            self.conversion_control.set_voice_settings_widget(self.voice_settings)
+    
+    def build_text_processor_tab(self):
+        """创建文本处理标签页"""
+        from .text_processor import TextProcessorWidget
+        text_processor = TextProcessorWidget(self.text_controller)
+        text_processor.text_processed.connect(self.on_text_processed, Qt.ConnectionType.QueuedConnection)
+        text_processor.conversion_requested.connect(self.switch_to_conversion_tab)
+        text_processor.start_conversion_signal.connect(self.start_conversion)
+        return text_processor
+    
+    def build_voice_settings_tab(self):
+        """创建语音设置标签页"""
+        from .voice_settings import VoiceSettingsWidget
+        from services.json_config_service import JsonConfigService
+        voice_settings = VoiceSettingsWidget(self.audio_controller)
+        voice_settings.voice_changed.connect(self.on_voice_changed)
+        voice_settings.set_voice_config(JsonConfigService.instance().load_voice_config())
+        return voice_settings
+    
+    def build_output_settings_tab(self):
+        """创建输出设置标签页"""
+        from .output_settings import OutputSettingsWidget
+        output_settings = OutputSettingsWidget()  # 输出配置由组件自行读取
+        output_settings.output_changed.connect(self.on_output_changed)
+        output_settings.status_message.connect(self.set_status)
+        return output_settings
+    
+    def build_conversion_control_tab(self):
+        """创建转换控制标签页"""
+        from .conversion_control import ConversionControlWidget
+        return ConversionControlWidget()
+    
+    def build_batch_processor_tab(self):
+        """创建批量处理标签页"""
+        from .batch_processor import BatchProcessorWidget
+        batch_processor = BatchProcessorWidget(self.batch_controller)
+        batch_processor.task_completed.connect(self.on_task_completed, Qt.ConnectionType.QueuedConnection)
+        return batch_processor
+    
+    def build_settings_tab(self):
+        """创建设置标签页"""
+        from .settings import SettingsWidget
+        settings_widget = SettingsWidget(self.settings_controller)
+        settings_widget.language_change_requested.connect(self.change_language)
+        return settings_widget
+    
+    def build_config_manager_tab(self):
+        """创建配置管理标签页"""
+        from .config_manager import ConfigManagerWidget
+        return ConfigManagerWidget()
+    
     def create_status_bar(self):
         """创建状态栏"""
         self.status_bar = QStatusBar()
@@ -340,11 +514,30 @@ class MainWindow(QMainWindow):
         # 状态信息
         self.status_bar.showMessage(tr("common.ready"))
         
+        # 状态消息合并：短时间内的多次更新只显示最后一条
+        self.pending_status = None
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(self.STATUS_UPDATE_INTERVAL_MS)
+        self.status_timer.timeout.connect(self.flush_status)
+        
         # 进度条
         self.progress_bar = self.status_bar.addPermanentWidget(
             QWidget(), 1
         )
     
+    def set_status(self, message: str):
+        """更新状态栏消息（合并短时间内的连续更新）"""
+        self.pending_status = message
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+    
+    def flush_status(self):
+        """显示最新的状态栏消息"""
+        if self.pending_status is not None:
+            self.status_bar.showMessage(self.pending_status)
+            self.pending_status = None
+    
     def center_window(self):
         """将窗口居中显示"""
         try:
@@ -370,207 +563,104 @@ class MainWindow(QMainWindow):
     
     def setup_styles(self):
         """设置样式"""
-        style = """
-        QMainWindow {
-            background-color: #f5f5f5;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #c0c0c0;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #e0e0e0;
-            padding: 8px 16px;
-            margin-right: 2px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            border-bottom: 2px solid #0078d4;
-        }
-        
-        QPushButton {
-            background-color: #0078d4;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 4px;
-        }
-        
-        QPushButton:hover {
-            background-color: #106ebe;
-        }
-        
-        QPushButton:pressed {
-            background-color: #005a9e;
-        }
-        
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #c0c0c0;
-            padding: 4px;
-            border-radius: 4px;
-        }
-        
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-            border-color: #0078d4;
-        }
-        """
-        
-        self.setStyleSheet(style)
+        self.setStyleSheet(MAIN_WINDOW_STYLE)
     
     def setup_connections(self):
         """设置信号槽连接"""
         # 文件管理信号
         self.file_manager.file_selected.connect(self.on_file_selected)
-        self.file_manager.file_imported.connect(self.on_file_imported)
-        
-        # 文本处理信号
-        self.text_processor.text_processed.connect(self.on_text_processed)
-        self.text_processor.conversion_requested.connect(self.switch_to_conversion_tab)
-        self.text_processor.start_conversion_signal.connect(self.start_conversion)
-        
-        # 语音设置信号
-        self.voice_settings.voice_changed.connect(self.on_voice_changed)
-        
-        # 输出设置信号
-        self.output_settings.output_changed.connect(self.on_output_changed)
+        self.file_manager.file_imported.connect(self.on_file_imported, Qt.ConnectionType.QueuedConnection)
         
-        # 加载配置到各个界面
-        self.load_config_to_widgets()
-        
-        # 批量处理信号
-        self.batch_processor.task_completed.connect(self.on_task_completed)
+        # 各标签页的信号在 build_*_tab 中创建标签页时连接
+        # 导入完成、文本处理完成、任务完成等通知使用队列连接，由事件循环稍后处理，不阻塞发送方
     
+    @log_errors("加载设置失败")
     def load_settings(self):
         """加载设置"""
-        try:
-            self.logger.info("设置加载完成")
-            
-        except Exception as e:
-            self.logger.error(f"加载设置失败: {e}")
+        self.logger.info("设置加载完成")
     
+    @log_errors("初始化界面外观失败")
+    def bootstrap_appearance(self):
+        """启动时应用主题（含字体）和语言，并连接语言改变信号"""
+        self.apply_theme()
+        self.apply_language(retranslate=False)  # 初始化时界面文本已是当前语言
+        self.language_service.language_changed.connect(self.on_language_changed)
+        self.logger.info("语言改变信号连接已设置")
+    
+    @log_errors("应用主题失败")
     def apply_theme(self):
-        """应用主题"""
-        try:
-            # 优先使用主题服务中的当前主题
-            current_theme = theme_service.get_current_theme()
-            if self.app_config and current_theme and current_theme != self.app_config.ui.theme:
-                # 如果主题服务中的主题与配置不同，更新配置
-                self.app_config.ui.theme = current_theme
-                self.logger.info(f"主题已同步: {current_theme}")
-            
-            # 使用全局主题服务应用主题
-            theme = self.app_config.ui.theme if self.app_config else "light"
-            theme_service.apply_theme(theme)
-            self.logger.info(f"已应用主题: {theme}")
-            
-            # 重新应用字体设置
-            self.apply_font_settings()
-            
-        except Exception as e:
-            self.logger.error(f"应用主题失败: {e}")
+        """应用主题（以主题服务中的当前主题为准，关闭窗口时再同步到应用配置）"""
+        theme = theme_service.get_current_theme() or (self.app_config.ui.theme if self.app_config else "light")
+        theme_service.apply_theme(theme)
+        self.logger.info(f"已应用主题: {theme}")
+        
+        # 重新应用字体设置
+        self.apply_font_settings()
     
+    @log_errors("应用字体设置失败")
     def apply_font_settings(self):
         """应用字体设置"""
-        try:
-            from PyQt6.QtGui import QFont
-            from PyQt6.QtWidgets import QApplication
-            import os
-            import json
-            
-            # 从UI配置获取字体设置
-            ui_config_file = "configs/app/ui.json"
-            if os.path.exists(ui_config_file):
-                with open(ui_config_file, 'r', encoding='utf-8') as f:
-                    ui_config = json.load(f)
-                    font_size = ui_config.get('font_size', 12)
-                    font_family = ui_config.get('font_family', 'Microsoft YaHei')
-                    
-                    # 创建字体对象
-                    font = QFont(font_family, font_size)
-                    
-                    # 应用到整个应用程序
-                    app = QApplication.instance()
-                    if app:
-                        app.setFont(font)
-                        self.logger.info(f"已应用字体设置: {font_family}, 大小: {font_size}")
-            
-        except Exception as e:
-            self.logger.error(f"应用字体设置失败: {e}")
-    
-    def apply_language(self, recreate_menu=True):
+        # 从UI配置获取字体设置（文件未被改动时直接使用内存中的配置）
+        ui_config = read_ui_config(UI_CONFIG_FILE)
+        if ui_config:
+            font_size = ui_config.get('font_size', 12)
+            font_family = ui_config.get('font_family', 'Microsoft YaHei')
+            
+            # 应用到整个应用程序（当前字体相同时不重复设置）
+            app = QApplication.instance()
+            if app:
+                current_font = app.font()
+                if current_font.family() == font_family and current_font.pointSize() == font_size:
+                    return
+                app.setFont(QFont(font_family, font_size))
+                self.logger.info(f"已应用字体设置: {font_family}, 大小: {font_size}")
+    
+    @log_errors("应用语言失败")
+    def apply_language(self, retranslate=True):
         """应用语言"""
-        try:
-            # 获取当前语言
-            current_language = get_language_service().get_current_language()
-            self.logger.info(f"当前语言: {current_language}")
-            
-            # 更新应用配置中的语言设置（如果存在）
-            if self.app_config and hasattr(self.app_config, 'ui'):
-                # 获取语言显示名称
-                language_service = get_language_service()
-                lang_info = language_service.language_config.get("language_info", {}).get(current_language, {})
-                lang_name = lang_info.get("name", current_language)
-                language_display = f"{lang_name} ({current_language})"
-                
-                # 更新应用配置
-                self.app_config.ui.language = language_display
-                self.logger.info(f"已更新应用配置语言: {language_display}")
-            
-            # 只有在需要时才重新创建菜单
-            if recreate_menu:
-                self.recreate_menu_bar_only()
-            
-        except Exception as e:
-            self.logger.error(f"应用语言失败: {e}")
-    
-    def setup_language_signal_connection(self):
-        """设置语言改变信号连接"""
-        try:
-            from services.language_service import get_language_service
-            language_service = get_language_service()
-            
-            # 连接语言改变信号
-            language_service.language_changed.connect(self.on_language_changed)
-            self.logger.info("语言改变信号连接已设置")
+        # 获取当前语言
+        current_language = self.language_service.get_current_language()
+        self.logger.info(f"当前语言: {current_language}")
+        
+        # 更新应用配置中的语言设置（如果存在）
+        if self.app_config and hasattr(self.app_config, 'ui'):
+            # 获取语言显示名称
+            language_display = self.language_display_names.get(
+                current_language, f"{current_language} ({current_language})"
+            )
             
-        except Exception as e:
-            self.logger.error(f"设置语言信号连接失败: {e}")
+            # 更新应用配置
+            self.app_config.ui.language = language_display
+            self.logger.info(f"已更新应用配置语言: {language_display}")
+        
+        # 只有在需要时才更新界面文本
+        if retranslate:
+            self.retranslate_ui()
     
+    @log_errors("处理语言改变事件失败")
     def on_language_changed(self, language):
         """语言改变事件处理"""
-        try:
-            self.logger.info(f"收到语言改变信号: {language}")
-            
-            # 更新应用配置
-            if self.app_config:
-                self.app_config.ui.language = language
-            
-            # 重新应用语言
-            self.apply_language()
-            
-        except Exception as e:
-            self.logger.error(f"处理语言改变事件失败: {e}")
+        self.logger.info(f"收到语言改变信号: {language}")
+        
+        # 更新应用配置
+        if self.app_config:
+            self.app_config.ui.language = language
+        
+        # 重新应用语言
+        self.apply_language()
+    
+    @log_errors("切换语言失败")
+    def change_language(self, language: str):
+        """切换界面语言（切换成功后由 language_changed 信号重新应用语言）"""
+        if not self.language_service.set_language(language):
+            self.logger.warning(f"语言切换失败: {language}")
     
+    @log_errors("同步主题和语言失败")
     def sync_theme_and_language(self):
-        """同步主题和语言设置"""
-        try:
-            # 从主题服务获取当前主题
-            current_theme = theme_service.get_current_theme()
-            if self.app_config and current_theme and current_theme != self.app_config.ui.theme:
-                self.app_config.ui.theme = current_theme
-                self.logger.info(f"主题已同步: {current_theme}")
-            
-            # 从语言服务获取当前语言
-            current_language = get_language_service().get_current_language()
-            if self.app_config and current_language and current_language != self.app_config.ui.language:
-                self.app_config.ui.language = current_language
-                self.logger.info(f"语言已同步: {current_language}")
-            
-        except Exception as e:
-            self.logger.error(f"同步主题和语言失败: {e}")
+        """将主题服务和语言服务中的当前设置同步到应用配置"""
+        if self.app_config:
+            self.app_config.ui.theme = theme_service.get_current_theme() or self.app_config.ui.theme
+            self.app_config.ui.language = self.language_service.get_current_language() or self.app_config.ui.language
     
     def import_file(self):
         """导入文件"""
@@ -580,36 +670,28 @@ class MainWindow(QMainWindow):
             self.logger.error(f"导入文件失败: {e}")
             QMessageBox.critical(self, tr("common.error"), tr("main_window.messages.import_file_failed", error=str(e)))
     
+    @log_errors("播放音频失败")
     def play_audio(self):
         """播放音频"""
-        try:
-            # 实现音频播放逻辑
-            self.status_bar.showMessage(tr("main_window.status.playing_audio"))
-        except Exception as e:
-            self.logger.error(f"播放音频失败: {e}")
+        # 实现音频播放逻辑
+        self.set_status(tr("main_window.status.playing_audio"))
     
+    @log_errors("暂停音频失败")
     def pause_audio(self):
         """暂停音频"""
-        try:
-            # 实现音频暂停逻辑
-            self.status_bar.showMessage(tr("main_window.status.paused_audio"))
-        except Exception as e:
-            self.logger.error(f"暂停音频失败: {e}")
+        # 实现音频暂停逻辑
+        self.set_status(tr("main_window.status.paused_audio"))
     
+    @log_errors("停止音频失败")
     def stop_audio(self):
         """停止音频"""
-        try:
-            # 实现音频停止逻辑
-            self.status_bar.showMessage(tr("main_window.status.stopped_audio"))
-        except Exception as e:
-            self.logger.error(f"停止音频失败: {e}")
+        # 实现音频停止逻辑
+        self.set_status(tr("main_window.status.stopped_audio"))
     
+    @log_errors("显示设置失败")
     def show_settings(self):
         """显示设置"""
-        try:
-            self.tab_widget.setCurrentWidget(self.settings_widget)
-        except Exception as e:
-            self.logger.error(f"显示设置失败: {e}")
+        self.show_tab("settings_widget")
     
     def show_about(self):
         """显示关于对话框"""
@@ -619,104 +701,68 @@ class MainWindow(QMainWindow):
             tr("main_window.about.content")
         )
     
+    @log_errors("处理文件选择事件失败")
     def on_file_selected(self, file_path: str):
         """文件选择事件"""
-        try:
-            self.status_bar.showMessage(tr("main_window.status.file_selected", file_path=file_path))
-            self.logger.info(f"文件选择: {file_path}")
-            
-            # 获取文件内容并加载到文本处理器
-            file_model = self.file_manager.get_selected_file()
-            if file_model and file_model.content:
-                self.text_processor.set_text(file_model.content)
+        self.set_status(tr("main_window.status.file_selected", file_path=file_path))
+        self.logger.info(f"文件选择: {file_path}")
+        
+        # 获取文件内容并加载到文本处理器
+        file_model = self.file_manager.get_selected_file()
+        if file_model and file_model.content:
+            text_processor = self.ensure_tab("text_processor")
+            if text_processor:
+                text_processor.set_text(file_model.content)
                 # 切换到文本处理标签页
-                self.tab_widget.setCurrentWidget(self.text_processor)
-                
-        except Exception as e:
-            self.logger.error(f"处理文件选择事件失败: {e}")
+                self.show_tab("text_processor")
     
+    @log_errors("处理文件导入事件失败")
     def on_file_imported(self, file_path: str):
         """文件导入事件"""
-        try:
-            self.status_bar.showMessage(tr("main_window.status.file_imported", file_path=file_path))
-            self.file_imported.emit(file_path)
-            self.logger.info(f"文件导入: {file_path}")
-        except Exception as e:
-            self.logger.error(f"处理文件导入事件失败: {e}")
+        self.set_status(tr("main_window.status.file_imported", file_path=file_path))
+        self.logger.info(f"文件导入: {file_path}")
     
+    @log_errors("处理文本处理事件失败")
     def on_text_processed(self, text: str):
         """文本处理事件"""
-        try:
-            self.status_bar.showMessage(tr("main_window.status.text_processed"))
-            self.text_processed.emit(text)
-            self.logger.info("文本处理完成")
-        except Exception as e:
-            self.logger.error(f"处理文本处理事件失败: {e}")
+        self.set_status(tr("main_window.status.text_processed"))
+        self.logger.info("文本处理完成")
     
+    @log_errors("处理语音设置改变事件失败")
     def on_voice_changed(self, voice_config):
         """语音设置改变事件"""
-        try:
-            # 将语音配置传递给text_processor
-            if hasattr(self.text_processor, 'set_voice_config'):
-                self.text_processor.set_voice_config(voice_config)
-            
-            self.status_bar.showMessage(tr("main_window.status.voice_settings_updated"))
-            self.logger.info("语音设置已更新")
-        except Exception as e:
-            self.logger.error(f"处理语音设置改变事件失败: {e}")
+        # 将语音配置传递给text_processor
+        if self.text_processor is not None:
+            self.text_processor.set_voice_config(voice_config)
+        
+        self.set_status(tr("main_window.status.voice_settings_updated"))
+        self.logger.info("语音设置已更新")
     
+    @log_errors("处理输出设置改变事件失败")
     def on_output_changed(self, output_config):
         """输出设置改变事件"""
-        try:
-            # 将输出配置传递给text_processor
-            if hasattr(self.text_processor, 'set_output_config'):
-                self.text_processor.set_output_config(output_config)
-            
-            self.status_bar.showMessage(tr("main_window.status.output_settings_updated"))
-            self.logger.info("输出设置已更新")
-        except Exception as e:
-            self.logger.error(f"处理输出设置改变事件失败: {e}")
+        # 将输出配置传递给text_processor
+        if self.text_processor is not None:
+            self.text_processor.set_output_config(output_config)
+        
+        self.set_status(tr("main_window.status.output_settings_updated"))
+        self.logger.info("输出设置已更新")
     
+    @log_errors("处理任务完成事件失败")
     def on_task_completed(self, task_id: str):
         """任务完成事件"""
-        try:
-            self.status_bar.showMessage(tr("main_window.status.task_completed", task_id=task_id))
-            self.logger.info(f"任务完成: {task_id}")
-        except Exception as e:
-            self.logger.error(f"处理任务完成事件失败: {e}")
+        self.set_status(tr("main_window.status.task_completed", task_id=task_id))
+        self.logger.info(f"任务完成: {task_id}")
     
     def switch_to_conversion_tab(self):
         """切换到转换控制标签页"""
-        # 找到转换控制标签页的索引
-        conversion_tab_text = tr("tabs.conversion_control")
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == conversion_tab_text:
-                self.tab_widget.setCurrentIndex(i)
-                break
+        self.show_tab("conversion_control")
     
     def start_conversion(self, segments, voice_config, output_config, chapters=None):
         """开始转换"""
-        self.conversion_control.start_conversion(segments, voice_config, output_config, chapters)
-    
-    def load_config_to_widgets(self):
-        """加载配置到各个界面"""
-        try:
-            # 加载语音配置
-            from services.json_config_service import JsonConfigService
-            config_service = JsonConfigService()
-            
-            # 加载语音设置
-            voice_config = config_service.load_voice_config()
-            self.voice_settings.set_voice_config(voice_config)
-            
-            # 加载输出设置
-            output_config = config_service.load_output_config()
-            self.output_settings.set_output_config(output_config)
-            
-            self.logger.info("配置已加载到各个界面")
-            
-        except Exception as e:
-            self.logger.error(f"加载配置到界面失败: {e}")
+        conversion_control = self.ensure_tab("conversion_control")
+        if conversion_control:
+            conversion_control.start_conversion(segments, voice_config, output_config, chapters)
     
     def closeEvent(self, event):
         """窗口关闭事件"""
@@ -731,6 +777,10 @@ class MainWindow(QMainWindow):
             # 同步主题和语言设置
             self.sync_theme_and_language()
             
+            # 写入输出设置中尚未执行的延迟保存
+            if self.output_settings is not None:
+                self.output_settings.flush_pending_save()
+            
             # 保存应用程序配置
             if self.app_config:
                 from services.config.app_config_service import AppConfigService
@@ -2,43 +2,238 @@
 输出设置界面
 """
 
+import atexit
+import copy
+import logging
+import os
+import queue
+from dataclasses import fields
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QComboBox, QSpinBox, QCheckBox, QLineEdit,
     QPushButton, QGroupBox, QFormLayout, QMessageBox,
-    QFileDialog, QSlider, QTextEdit, QProgressBar,
-    QScrollArea
+    QFileDialog, QSlider, QScrollArea, QDialog, QDialogButtonBox, QColorDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, pyqtSignal, QRegularExpression
+from PyQt6.QtGui import QRegularExpressionValidator, QColor
 from services.language_service import get_text as tr
 
-from models.audio_model import OutputConfig
+from models.audio_model import OutputConfig, SubtitleStyle
 from utils.log_manager import LogManager
 
 
+# 界面上没有对应控件的输出配置字段，使用 OutputConfig 的默认值
+HIDDEN_FIELD_DEFAULTS = {
+    f.name: f.default for f in fields(OutputConfig)
+    if f.name in ('normalize', 'noise_reduction', 'concurrent_workers', 'cleanup_temp')
+}
+
+# ASS颜色格式：&H + AABBGGRR 八位十六进制
+ASS_COLOR_PATTERN = QRegularExpression(r"&H[0-9A-Fa-f]{8}")
+
+
+def ass_to_qcolor(ass_color: str) -> QColor:
+    """ASS颜色（&HAABBGGRR，透明度 00 为不透明）转换为 QColor"""
+    value = int(ass_color[2:], 16)
+    return QColor(value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF, 255 - ((value >> 24) & 0xFF))
+
+
+def qcolor_to_ass(color: QColor) -> str:
+    """QColor 转换为ASS颜色（&HAABBGGRR）"""
+    return f"&H{255 - color.alpha():02X}{color.blue():02X}{color.green():02X}{color.red():02X}"
+
+
+# 输出设置预览模板
+PREVIEW_TEMPLATE = (
+    "输出格式: {format}\n"
+    "编码器: {encoder}\n"
+    "比特率: {bitrate} kbps\n"
+    "采样率: {sample_rate}\n"
+    "声道: {channels}\n"
+    "输出目录: {output_dir}\n"
+    "命名模式: {naming_mode}\n"
+    "合并文件: {merge_files}\n"
+    "字幕输出: {generate_subtitle}\n"
+    "字幕格式: {subtitle_format}\n"
+    "字幕编码: {subtitle_encoding}\n"
+    "时间偏移: {subtitle_offset} 秒"
+)
+
+
 class OutputSettingsWidget(QWidget):
     """输出设置界面"""
     
     # 信号定义
     output_changed = pyqtSignal(object)  # 输出设置改变信号
+    status_message = pyqtSignal(str)  # 状态栏提示信号（操作成功等非阻塞提示）
+    
+    # 设置改变后更新预览的合并间隔（毫秒）
+    PREVIEW_DEBOUNCE_MS = 50
+    
+    # 日志队列监听器（所有输出设置界面共用，首次创建界面时启动）
+    _log_listener = None
+    
+    # 保存配置的合并间隔（毫秒），短时间内多次保存只写一次文件
+    SAVE_DEBOUNCE_MS = 500
+    
+    # 命名模式 -> 显示文本（使用固定的中文文本，暂时不支持多语言）
+    NAMING_OPTIONS = {
+        "chapter_number_title": "章节序号 + 标题",
+        "sequence_title": "顺序号 + 标题",
+        "title_only": "仅标题",
+        "sequence_only": "仅顺序号",
+        "original_filename": "原始文件名",
+        "custom": "自定义"
+    }
     
-    def __init__(self):
+    # 显示文本 -> 命名模式键值
+    NAMING_DISPLAY_TO_KEY = {value: key for key, value in NAMING_OPTIONS.items()}
+    
+    # ASS对齐方式（小键盘位置：1-3 底部、4-6 中部、7-9 顶部）-> 下拉框选项的文本键，按显示顺序
+    ALIGNMENT_TEXT_KEYS = {
+        1: "bottom_left", 2: "bottom_center", 3: "bottom_right",
+        7: "top_left", 8: "top_center", 9: "top_right",
+        4: "left_center", 5: "center", 6: "right_center",
+    }
+    
+    # 各输出格式可用的编码器
+    ENCODERS_BY_FORMAT = {
+        'WAV': ('FFmpeg', 'PCM'),
+        'MP3': ('FFmpeg', 'LAME'),
+        'OGG': ('FFmpeg', 'Vorbis'),
+        'M4A': ('FFmpeg', 'AAC'),
+    }
+    
+    # 字幕格式 -> 下拉框选项的文本键（按显示顺序）
+    SUBTITLE_FORMAT_TEXT_KEYS = {
+        'lrc': 'lrc_format',
+        'srt': 'srt_format',
+        'vtt': 'vtt_format',
+        'ass': 'ass_format',
+    }
+    
+    # 界面构建用到的文本键（output_settings 下）
+    TEXT_KEYS = (
+        "title", "audio_format", "output_format", "encoder", "quality_settings",
+        "bitrate", "sample_rate", "mono", "stereo", "channels", "subtitle_output",
+        "generate_subtitle", "lrc_format", "srt_format", "vtt_format", "ass_format",
+        "subtitle_format", "subtitle_encoding", "seconds", "time_offset",
+        "subtitle_style", "set_style", "output_directory", "select_output_dir",
+        "browse", "output_dir", "create_subdir", "project_name", "subdir_name",
+        "file_naming", "naming_mode", "custom_template", "name_length_limit",
+        "merge_settings", "merge_all_chapters", "merge_name_placeholder",
+        "merge_filename", "add_chapter_markers", "chapter_interval",
+        "config_management", "save_config", "load_config", "export_config",
+        "import_config", "config_status", "not_saved", "loaded", "saved",
+        # 字幕样式对话框
+        "subtitle_style_dialog", "font_name", "font_size", "primary_color",
+        "secondary_color", "outline_color", "back_color", "bold", "italic",
+        "underline", "alignment", "bottom_left", "bottom_center", "bottom_right",
+        "top_left", "top_center", "top_right", "left_center", "center",
+        "right_center", "left_margin", "right_margin", "vertical_margin",
+    )
+    
+    def __init__(self, advanced: bool = False):
         super().__init__()
-        self.logger = LogManager().get_logger("OutputSettingsWidget")
+        self.logger = self.setup_logger()
+        
+        # 是否显示高级设置和预览测试组（默认隐藏，不创建对应控件）
+        self.advanced = advanced
         
         # 配置服务
         from services.json_config_service import JsonConfigService
-        self.config_service = JsonConfigService()
+        self.config_service = JsonConfigService.instance()
         
         # 当前输出配置
         self.current_output_config = OutputConfig()
         
+        # 当前语言的界面文本，以及需要随语言切换更新的文本：(设置方法, 文本键, 格式)
+        self.refresh_texts()
+        self.translatable_texts = []
+        
+        # 字幕样式配置，以及首次打开时才创建的样式设置对话框
+        self.subtitle_style = SubtitleStyle()
+        self.subtitle_style_dialog = None
+        
+        # 上次导入/导出配置文件所在目录
+        self.last_config_dir = str(Path.home())
+        
+        # 预览更新定时器：连续的设置改变只触发一次预览更新
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        self.preview_timer.timeout.connect(self.update_preview)
+        
+        # 保存定时器：连续的保存请求合并为一次写入
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self.save_timer.timeout.connect(self.write_config)
+        
         # 初始化UI
         self.setup_ui()
         self.setup_connections()
         self.load_config()
     
+    def setup_logger(self) -> logging.Logger:
+        """获取日志记录器：日志只放入队列，由后台线程交给根日志处理器写入，界面线程不等待文件写入"""
+        logger = LogManager().get_logger("OutputSettingsWidget")
+        root_handlers = logging.getLogger().handlers
+        if OutputSettingsWidget._log_listener is None and root_handlers:
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *root_handlers, respect_handler_level=True)
+            listener.start()
+            # 退出时停止监听线程，写完队列中剩余的日志
+            atexit.register(listener.stop)
+            logger.addHandler(QueueHandler(log_queue))
+            logger.propagate = False
+            OutputSettingsWidget._log_listener = listener
+        return logger
+    
+    def refresh_texts(self):
+        """按当前语言缓存界面文本"""
+        self.texts = {key: tr(f'output_settings.{key}') for key in self.TEXT_KEYS}
+    
+    def track_text(self, setter, key: str, template: str = "{}"):
+        """登记需要随语言切换更新的文本"""
+        self.translatable_texts.append((setter, key, template))
+    
+    def track_combo_items(self, combo: QComboBox, keys):
+        """登记下拉框各选项的文本键"""
+        for index, key in enumerate(keys):
+            self.track_text(partial(combo.setItemText, index), key)
+    
+    def select_combo_data(self, combo: QComboBox, data):
+        """选中数据为 data 的选项（不存在时保持当前选项）"""
+        index = combo.findData(data)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+    
+    def create_spin_box(self, minimum: int, maximum: int, value: int = None) -> QSpinBox:
+        """创建整数输入框（设置范围和初始值期间屏蔽信号）"""
+        spin = QSpinBox()
+        blocker = QSignalBlocker(spin)
+        spin.setRange(minimum, maximum)
+        if value is not None:
+            spin.setValue(value)
+        blocker.unblock()
+        return spin
+    
+    def add_form_row(self, layout: QFormLayout, key: str, field):
+        """添加表单行（使用文本重载，由表单布局创建行标签），并登记行标签的文本键"""
+        layout.addRow(self.texts[key], field)
+        self.track_text(layout.labelForField(field).setText, key)
+    
+    def retranslate_ui(self):
+        """按当前语言更新界面文本"""
+        for setter, key, template in self.translatable_texts:
+            setter(template.format(self.texts[key]))
+        self.update_config_status_label()
+    
     def setup_ui(self):
         """设置用户界面"""
         layout = QVBoxLayout(self)
@@ -46,7 +241,8 @@ class OutputSettingsWidget(QWidget):
         layout.setSpacing(10)
         
         # 标题
-        title_label = QLabel(tr('output_settings.title'))
+        title_label = QLabel(self.texts['title'])
+        self.track_text(title_label.setText, 'title')
         title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
         layout.addWidget(title_label)
         
@@ -81,37 +277,38 @@ class OutputSettingsWidget(QWidget):
         # 合并设置
         self.create_merge_group(content_layout)
         
-        # 高级设置（隐藏）
-        # self.create_advanced_group(content_layout)
-        
-        # 预览和测试（隐藏）
-        # self.create_preview_group(content_layout)
+        # 高级设置、预览和测试（仅高级模式下创建）
+        if self.advanced:
+            self.create_advanced_group(content_layout)
+            self.create_preview_group(content_layout)
         
         scroll_area.setWidget(content_widget)
         layout.addWidget(scroll_area)
     
     def create_audio_format_group(self, parent_layout):
         """创建音频格式设置组"""
-        group = QGroupBox(tr('output_settings.audio_format'))
+        group = QGroupBox(self.texts['audio_format'])
+        self.track_text(group.setTitle, 'audio_format')
         layout = QFormLayout(group)
         
         # 输出格式
         self.format_combo = QComboBox()
         self.format_combo.addItems(["WAV", "MP3", "OGG", "M4A"])
         self.format_combo.setCurrentText("WAV")
-        layout.addRow(tr('output_settings.output_format'), self.format_combo)
+        self.add_form_row(layout, 'output_format', self.format_combo)
         
         # 编码器
         self.encoder_combo = QComboBox()
         self.encoder_combo.addItems(["FFmpeg", "LAME", "系统默认"])
         self.encoder_combo.setCurrentText("FFmpeg")
-        layout.addRow(tr('output_settings.encoder'), self.encoder_combo)
+        self.add_form_row(layout, 'encoder', self.encoder_combo)
         
         parent_layout.addWidget(group)
     
     def create_quality_group(self, parent_layout):
         """创建质量设置组"""
-        group = QGroupBox(tr('output_settings.quality_settings'))
+        group = QGroupBox(self.texts['quality_settings'])
+        self.track_text(group.setTitle, 'quality_settings')
         layout = QFormLayout(group)
         
         # 比特率
@@ -129,59 +326,62 @@ class OutputSettingsWidget(QWidget):
         
         bitrate_layout.addWidget(self.bitrate_slider)
         bitrate_layout.addWidget(self.bitrate_label)
-        layout.addRow(tr('output_settings.bitrate'), bitrate_layout)
+        self.add_form_row(layout, 'bitrate', bitrate_layout)
         
         # 采样率
         self.sample_rate_combo = QComboBox()
-        self.sample_rate_combo.addItems(["22050 Hz", "44100 Hz", "48000 Hz"])
-        self.sample_rate_combo.setCurrentText("44100 Hz")
-        layout.addRow(tr('output_settings.sample_rate'), self.sample_rate_combo)
+        for rate in (22050, 44100, 48000):
+            self.sample_rate_combo.addItem(f"{rate} Hz", rate)
+        self.select_combo_data(self.sample_rate_combo, 44100)
+        self.add_form_row(layout, 'sample_rate', self.sample_rate_combo)
         
         # 声道
         self.channels_combo = QComboBox()
-        self.channels_combo.addItems([tr('output_settings.mono'), tr('output_settings.stereo')])
-        self.channels_combo.setCurrentText(tr('output_settings.stereo'))
-        layout.addRow(tr('output_settings.channels'), self.channels_combo)
+        self.channels_combo.addItem(self.texts['mono'], 1)
+        self.channels_combo.addItem(self.texts['stereo'], 2)
+        self.track_combo_items(self.channels_combo, ('mono', 'stereo'))
+        self.select_combo_data(self.channels_combo, 2)
+        self.add_form_row(layout, 'channels', self.channels_combo)
         
         parent_layout.addWidget(group)
     
     def create_subtitle_group(self, parent_layout):
         """创建字幕输出设置组"""
-        group = QGroupBox(tr('output_settings.subtitle_output'))
+        group = QGroupBox(self.texts['subtitle_output'])
+        self.track_text(group.setTitle, 'subtitle_output')
         layout = QFormLayout(group)
         
         # 是否生成字幕文件
-        self.generate_subtitle_check = QCheckBox(tr('output_settings.generate_subtitle'))
+        self.generate_subtitle_check = QCheckBox(self.texts['generate_subtitle'])
+        self.track_text(self.generate_subtitle_check.setText, 'generate_subtitle')
         self.generate_subtitle_check.setChecked(False)
         layout.addRow("", self.generate_subtitle_check)
         
         # 字幕文件类型选择
         self.subtitle_format_combo = QComboBox()
-        self.subtitle_format_combo.addItems([
-            tr('output_settings.lrc_format'),
-            tr('output_settings.srt_format'),
-            tr('output_settings.vtt_format'),
-            tr('output_settings.ass_format')
-        ])
-        self.subtitle_format_combo.setCurrentText(tr('output_settings.lrc_format'))
-        layout.addRow(tr('output_settings.subtitle_format'), self.subtitle_format_combo)
+        for subtitle_format, text_key in self.SUBTITLE_FORMAT_TEXT_KEYS.items():
+            self.subtitle_format_combo.addItem(self.texts[text_key], subtitle_format)
+        self.track_combo_items(self.subtitle_format_combo, tuple(self.SUBTITLE_FORMAT_TEXT_KEYS.values()))
+        self.select_combo_data(self.subtitle_format_combo, 'lrc')
+        self.add_form_row(layout, 'subtitle_format', self.subtitle_format_combo)
         
         # 字幕编码
         self.subtitle_encoding_combo = QComboBox()
         self.subtitle_encoding_combo.addItems(["UTF-8", "GBK", "GB2312"])
         self.subtitle_encoding_combo.setCurrentText("UTF-8")
-        layout.addRow(tr('output_settings.subtitle_encoding'), self.subtitle_encoding_combo)
+        self.add_form_row(layout, 'subtitle_encoding', self.subtitle_encoding_combo)
         
         # 时间偏移
-        self.subtitle_offset_spin = QSpinBox()
-        self.subtitle_offset_spin.setRange(-60, 60)
-        self.subtitle_offset_spin.setValue(0)
-        self.subtitle_offset_spin.setSuffix(f" {tr('output_settings.seconds')}")
-        layout.addRow(tr('output_settings.time_offset'), self.subtitle_offset_spin)
+        self.subtitle_offset_spin = self.create_spin_box(-60, 60, 0)
+        self.subtitle_offset_spin.setSuffix(f" {self.texts['seconds']}")
+        self.track_text(self.subtitle_offset_spin.setSuffix, 'seconds', " {}")
+        self.add_form_row(layout, 'time_offset', self.subtitle_offset_spin)
         
         # 字幕样式设置（仅ASS格式显示）
-        self.subtitle_style_label = QLabel(tr('output_settings.subtitle_style'))
-        self.subtitle_style_button = QPushButton(tr('output_settings.set_style'))
+        self.subtitle_style_label = QLabel(self.texts['subtitle_style'])
+        self.track_text(self.subtitle_style_label.setText, 'subtitle_style')
+        self.subtitle_style_button = QPushButton(self.texts['set_style'])
+        self.track_text(self.subtitle_style_button.setText, 'set_style')
         self.subtitle_style_button.setEnabled(False)
         self.subtitle_style_button.clicked.connect(self.open_subtitle_style_dialog)
         layout.addRow(self.subtitle_style_label, self.subtitle_style_button)
@@ -191,60 +391,57 @@ class OutputSettingsWidget(QWidget):
         self.subtitle_style_button.hide()
         
         # 根据字幕格式启用/禁用样式设置
-        self.subtitle_format_combo.currentTextChanged.connect(self.update_subtitle_style_visibility)
+        self.subtitle_format_combo.currentIndexChanged.connect(self.update_subtitle_style_visibility)
         
         parent_layout.addWidget(group)
     
     def create_output_directory_group(self, parent_layout):
         """创建输出目录设置组"""
-        group = QGroupBox(tr('output_settings.output_directory'))
+        group = QGroupBox(self.texts['output_directory'])
+        self.track_text(group.setTitle, 'output_directory')
         layout = QFormLayout(group)
         
         # 输出目录选择
         dir_layout = QHBoxLayout()
         self.output_dir_edit = QLineEdit()
-        self.output_dir_edit.setPlaceholderText(tr('output_settings.select_output_dir'))
+        self.output_dir_edit.setPlaceholderText(self.texts['select_output_dir'])
+        self.track_text(self.output_dir_edit.setPlaceholderText, 'select_output_dir')
         self.output_dir_edit.setText("./output")
         
-        self.browse_dir_button = QPushButton(tr('output_settings.browse'))
+        self.browse_dir_button = QPushButton(self.texts['browse'])
+        self.track_text(self.browse_dir_button.setText, 'browse')
         self.browse_dir_button.clicked.connect(self.browse_output_directory)
         
         dir_layout.addWidget(self.output_dir_edit)
         dir_layout.addWidget(self.browse_dir_button)
-        layout.addRow(tr('output_settings.output_dir'), dir_layout)
+        self.add_form_row(layout, 'output_dir', dir_layout)
         
         # 创建子目录
-        self.create_subdir_check = QCheckBox(tr('output_settings.create_subdir'))
+        self.create_subdir_check = QCheckBox(self.texts['create_subdir'])
+        self.track_text(self.create_subdir_check.setText, 'create_subdir')
         self.create_subdir_check.setChecked(True)
         layout.addRow("", self.create_subdir_check)
         
         # 子目录命名
         self.subdir_name_edit = QLineEdit()
-        self.subdir_name_edit.setPlaceholderText(tr('output_settings.project_name'))
+        self.subdir_name_edit.setPlaceholderText(self.texts['project_name'])
+        self.track_text(self.subdir_name_edit.setPlaceholderText, 'project_name')
         self.subdir_name_edit.setText("{project_name}")
-        layout.addRow(tr('output_settings.subdir_name'), self.subdir_name_edit)
+        self.add_form_row(layout, 'subdir_name', self.subdir_name_edit)
         
         parent_layout.addWidget(group)
     
     def create_naming_group(self, parent_layout):
         """创建文件命名设置组"""
-        group = QGroupBox(tr('output_settings.file_naming'))
+        group = QGroupBox(self.texts['file_naming'])
+        self.track_text(group.setTitle, 'file_naming')
         layout = QFormLayout(group)
         
         # 文件命名模式
         self.naming_combo = QComboBox()
-        # 使用固定的中文文本，暂时不支持多语言
-        self.naming_options = {
-            "chapter_number_title": "章节序号 + 标题",
-            "sequence_title": "顺序号 + 标题",
-            "title_only": "仅标题",
-            "sequence_only": "仅顺序号",
-            "original_filename": "原始文件名",
-            "custom": "自定义"
-        }
-        self.naming_combo.addItems(list(self.naming_options.values()))
-        self.naming_combo.setCurrentText(self.naming_options["chapter_number_title"])
-        layout.addRow(tr('output_settings.naming_mode'), self.naming_combo)
+        self.naming_combo.addItems(list(self.NAMING_OPTIONS.values()))
+        self.naming_combo.setCurrentText(self.NAMING_OPTIONS["chapter_number_title"])
+        self.add_form_row(layout, 'naming_mode', self.naming_combo)
         
         # 自定义命名模板
         self.custom_name_edit = QLineEdit()
@@ -253,7 +450,8 @@ class OutputSettingsWidget(QWidget):
         self.custom_name_edit.setEnabled(False)
         
         # 创建自定义模板标签
-        self.custom_template_label = QLabel(tr('output_settings.custom_template'))
+        self.custom_template_label = QLabel(self.texts['custom_template'])
+        self.track_text(self.custom_template_label.setText, 'custom_template')
         
         # 将自定义模板添加到布局中，但初始时隐藏
         self.custom_template_row = layout.rowCount()
@@ -267,58 +465,49 @@ class OutputSettingsWidget(QWidget):
         self.naming_combo.currentTextChanged.connect(self.on_naming_mode_changed)
         
         # 文件名长度限制
-        self.name_length_spin = QSpinBox()
-        self.name_length_spin.setRange(10, 200)
-        self.name_length_spin.setValue(50)
-        layout.addRow(tr('output_settings.name_length_limit'), self.name_length_spin)
+        self.name_length_spin = self.create_spin_box(10, 200, 50)
+        self.add_form_row(layout, 'name_length_limit', self.name_length_spin)
         
         parent_layout.addWidget(group)
     
     def get_naming_mode_key(self, display_text):
         """根据显示文本获取命名模式键值"""
-        try:
-            if not hasattr(self, 'naming_options') or not self.naming_options:
-                return "chapter_number_title"  # 默认值
-            
-            for key, value in self.naming_options.items():
-                if value == display_text:
-                    return key
-            return "chapter_number_title"  # 默认值
-        except:
-            return "chapter_number_title"  # 默认值
-    
+        return self.NAMING_DISPLAY_TO_KEY.get(display_text, "chapter_number_title")
     
     def create_merge_group(self, parent_layout):
         """创建合并设置组"""
-        group = QGroupBox(tr('output_settings.merge_settings'))
+        group = QGroupBox(self.texts['merge_settings'])
+        self.track_text(group.setTitle, 'merge_settings')
         layout = QFormLayout(group)
         
         # 是否合并
-        self.merge_check = QCheckBox(tr('output_settings.merge_all_chapters'))
+        self.merge_check = QCheckBox(self.texts['merge_all_chapters'])
+        self.track_text(self.merge_check.setText, 'merge_all_chapters')
         self.merge_check.setChecked(False)
         layout.addRow("", self.merge_check)
         
         # 合并文件名
         self.merge_name_edit = QLineEdit()
-        self.merge_name_edit.setPlaceholderText(tr('output_settings.merge_name_placeholder'))
+        self.merge_name_edit.setPlaceholderText(self.texts['merge_name_placeholder'])
+        self.track_text(self.merge_name_edit.setPlaceholderText, 'merge_name_placeholder')
         self.merge_name_edit.setText("完整音频")
         self.merge_name_edit.setEnabled(False)
-        layout.addRow(tr('output_settings.merge_filename'), self.merge_name_edit)
+        self.add_form_row(layout, 'merge_filename', self.merge_name_edit)
         
         # 启用合并文件名编辑
         self.merge_check.toggled.connect(self.merge_name_edit.setEnabled)
         
         # 章节标记
-        self.chapter_markers_check = QCheckBox(tr('output_settings.add_chapter_markers'))
+        self.chapter_markers_check = QCheckBox(self.texts['add_chapter_markers'])
+        self.track_text(self.chapter_markers_check.setText, 'add_chapter_markers')
         self.chapter_markers_check.setChecked(True)
         layout.addRow("", self.chapter_markers_check)
         
         # 章节间隔
-        self.chapter_interval_spin = QSpinBox()
-        self.chapter_interval_spin.setRange(0, 10)
-        self.chapter_interval_spin.setValue(2)
-        self.chapter_interval_spin.setSuffix(f" {tr('output_settings.seconds')}")
-        layout.addRow(tr('output_settings.chapter_interval'), self.chapter_interval_spin)
+        self.chapter_interval_spin = self.create_spin_box(0, 10, 2)
+        self.chapter_interval_spin.setSuffix(f" {self.texts['seconds']}")
+        self.track_text(self.chapter_interval_spin.setSuffix, 'seconds', " {}")
+        self.add_form_row(layout, 'chapter_interval', self.chapter_interval_spin)
         
         parent_layout.addWidget(group)
     
@@ -337,9 +526,7 @@ class OutputSettingsWidget(QWidget):
         # layout.addRow("", self.noise_reduction_check)
         
         # 并发处理
-        self.concurrent_spin = QSpinBox()
-        self.concurrent_spin.setRange(1, 8)
-        self.concurrent_spin.setValue(2)
+        self.concurrent_spin = self.create_spin_box(1, 8, 2)
         layout.addRow("并发处理数:", self.concurrent_spin)
         
         # 临时文件清理
@@ -351,6 +538,8 @@ class OutputSettingsWidget(QWidget):
     
     def create_preview_group(self, parent_layout):
         """创建预览和测试组"""
+        from PyQt6.QtWidgets import QTextEdit
+        
         group = QGroupBox("预览和测试")
         layout = QFormLayout(group)
         
@@ -374,56 +563,67 @@ class OutputSettingsWidget(QWidget):
     
     def create_config_group(self, parent_layout):
         """创建配置管理组"""
-        group = QGroupBox(tr('output_settings.config_management'))
+        group = QGroupBox(self.texts['config_management'])
+        self.track_text(group.setTitle, 'config_management')
         layout = QVBoxLayout(group)
         
         # 配置管理按钮
         config_button_layout = QHBoxLayout()
         
-        self.save_config_button = QPushButton(tr('output_settings.save_config'))
+        self.save_config_button = QPushButton(self.texts['save_config'])
+        self.track_text(self.save_config_button.setText, 'save_config')
         self.save_config_button.clicked.connect(self.save_config)
         config_button_layout.addWidget(self.save_config_button)
         
-        self.load_config_button = QPushButton(tr('output_settings.load_config'))
+        self.load_config_button = QPushButton(self.texts['load_config'])
+        self.track_text(self.load_config_button.setText, 'load_config')
         self.load_config_button.clicked.connect(self.load_config)
         config_button_layout.addWidget(self.load_config_button)
         
-        self.export_config_button = QPushButton(tr('output_settings.export_config'))
+        self.export_config_button = QPushButton(self.texts['export_config'])
+        self.track_text(self.export_config_button.setText, 'export_config')
         self.export_config_button.clicked.connect(self.export_config)
         config_button_layout.addWidget(self.export_config_button)
         
-        self.import_config_button = QPushButton(tr('output_settings.import_config'))
+        self.import_config_button = QPushButton(self.texts['import_config'])
+        self.track_text(self.import_config_button.setText, 'import_config')
         self.import_config_button.clicked.connect(self.import_config)
         config_button_layout.addWidget(self.import_config_button)
         
         layout.addLayout(config_button_layout)
         
         # 配置状态显示
-        self.config_status_label = QLabel(f"{tr('output_settings.config_status')} {tr('output_settings.not_saved')}")
+        self.config_status_key = 'not_saved'
+        self.config_status_label = QLabel()
         self.config_status_label.setStyleSheet("color: #666; font-size: 12px;")
+        self.update_config_status_label()
         layout.addWidget(self.config_status_label)
         
         parent_layout.addWidget(group)
     
+    def update_config_status_label(self):
+        """更新配置状态显示"""
+        self.config_status_label.setText(f"{self.texts['config_status']} {self.texts[self.config_status_key]}")
+    
     def setup_connections(self):
         """设置信号连接"""
         # 格式改变时更新编码器选项
         self.format_combo.currentTextChanged.connect(self.update_encoder_options)
         
         # 设置改变时更新预览
-        self.format_combo.currentTextChanged.connect(self.update_preview)
-        self.bitrate_slider.valueChanged.connect(self.update_preview)
-        self.sample_rate_combo.currentTextChanged.connect(self.update_preview)
-        self.channels_combo.currentTextChanged.connect(self.update_preview)
-        self.output_dir_edit.textChanged.connect(self.update_preview)
-        self.naming_combo.currentTextChanged.connect(self.update_preview)
-        self.merge_check.toggled.connect(self.update_preview)
+        self.format_combo.currentTextChanged.connect(self.schedule_preview)
+        self.bitrate_slider.valueChanged.connect(self.schedule_preview)
+        self.sample_rate_combo.currentTextChanged.connect(self.schedule_preview)
+        self.channels_combo.currentTextChanged.connect(self.schedule_preview)
+        self.output_dir_edit.textChanged.connect(self.schedule_preview)
+        self.naming_combo.currentTextChanged.connect(self.schedule_preview)
+        self.merge_check.toggled.connect(self.schedule_preview)
         
         # 字幕设置改变时更新预览
-        self.generate_subtitle_check.toggled.connect(self.update_preview)
-        self.subtitle_format_combo.currentTextChanged.connect(self.update_preview)
-        self.subtitle_encoding_combo.currentTextChanged.connect(self.update_preview)
-        self.subtitle_offset_spin.valueChanged.connect(self.update_preview)
+        self.generate_subtitle_check.toggled.connect(self.schedule_preview)
+        self.subtitle_format_combo.currentTextChanged.connect(self.schedule_preview)
+        self.subtitle_encoding_combo.currentTextChanged.connect(self.schedule_preview)
+        self.subtitle_offset_spin.valueChanged.connect(self.schedule_preview)
         
         # 语言切换支持
         from services.language_service import get_language_service
@@ -433,149 +633,119 @@ class OutputSettingsWidget(QWidget):
     def on_language_changed(self):
         """语言切换事件"""
         try:
-            # 重新创建UI以更新翻译
-            self.recreate_ui()
-        except Exception as e:
+            # 刷新文本缓存后原地更新界面文本
+            self.refresh_texts()
+            self.retranslate_ui()
+        except (AttributeError, KeyError, RuntimeError) as e:
             self.logger.error(f"语言切换失败: {e}")
     
-    def recreate_ui(self):
-        """重新创建UI"""
-        try:
-            # 保存当前状态（在删除UI之前）
-            current_naming_mode = "chapter_number_title"  # 默认值
-            if hasattr(self, 'naming_combo') and self.naming_combo is not None:
-                try:
-                    current_naming_mode = self.get_naming_mode_key(self.naming_combo.currentText())
-                except:
-                    current_naming_mode = "chapter_number_title"
-            
-            # 清除现有UI
-            layout = self.layout()
-            if layout:
-                while layout.count():
-                    child = layout.takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
-            
-            # 重新创建UI
-            self.setup_ui()
-            self.setup_connections()
-            
-            # 重新设置命名选项（使用固定的中文文本）
-            self.naming_options = {
-                "chapter_number_title": "章节序号 + 标题",
-                "sequence_title": "顺序号 + 标题",
-                "title_only": "仅标题",
-                "sequence_only": "仅顺序号",
-                "original_filename": "原始文件名",
-                "custom": "自定义"
-            }
-            
-            # 恢复状态
-            if hasattr(self, 'naming_combo') and self.naming_combo is not None:
-                try:
-                    self.naming_combo.setCurrentText(self.naming_options.get(current_naming_mode, self.naming_options["chapter_number_title"]))
-                except:
-                    pass  # 如果设置失败，使用默认值
-            
-        except Exception as e:
-            self.logger.error(f"重新创建UI失败: {e}")
-    
     def on_naming_mode_changed(self, naming_mode):
         """命名模式改变事件"""
         try:
-            naming_mode_key = self.get_naming_mode_key(naming_mode)
-            if naming_mode_key == "custom":
-                # 显示自定义模板
-                self.custom_template_label.show()
-                self.custom_name_edit.show()
-                self.custom_name_edit.setEnabled(True)
-            else:
-                # 隐藏自定义模板
-                self.custom_template_label.hide()
-                self.custom_name_edit.hide()
-                self.custom_name_edit.setEnabled(False)
+            # 仅自定义模式显示自定义模板
+            is_custom = self.get_naming_mode_key(naming_mode) == "custom"
+            self.custom_template_label.setVisible(is_custom)
+            self.custom_name_edit.setVisible(is_custom)
+            self.custom_name_edit.setEnabled(is_custom)
             
             # 更新预览
-            self.update_preview()
+            self.schedule_preview()
             
-        except Exception as e:
+        except (AttributeError, RuntimeError) as e:  # RuntimeError: 控件对应的C++对象已删除
             self.logger.error(tr('output_settings.messages.naming_mode_changed_failed', error=str(e)))
     
     def update_encoder_options(self, format_text):
-        """更新编码器选项"""
-        self.encoder_combo.clear()
-        
-        if format_text == "WAV":
-            self.encoder_combo.addItems(["FFmpeg", "PCM"])
-        elif format_text == "MP3":
-            self.encoder_combo.addItems(["FFmpeg", "LAME"])
-        elif format_text == "OGG":
-            self.encoder_combo.addItems(["FFmpeg", "Vorbis"])
-        elif format_text == "M4A":
-            self.encoder_combo.addItems(["FFmpeg", "AAC"])
+        """更新编码器选项（选项未变化时不重建）"""
+        encoders = self.ENCODERS_BY_FORMAT.get(format_text, ())
+        current = tuple(self.encoder_combo.itemText(i) for i in range(self.encoder_combo.count()))
+        if current == encoders:
+            return
         
+        blocker = QSignalBlocker(self.encoder_combo)
+        self.encoder_combo.clear()
+        self.encoder_combo.addItems(encoders)
         self.encoder_combo.setCurrentIndex(0)
+        blocker.unblock()
+    
+    def schedule_preview(self):
+        """安排预览更新（重新计时，合并连续的设置改变）"""
+        self.preview_timer.start()
     
     def update_preview(self):
-        """更新预览"""
-        preview_text = f"""
-输出格式: {self.format_combo.currentText()}
-编码器: {self.encoder_combo.currentText()}
-比特率: {self.bitrate_slider.value()} kbps
-采样率: {self.sample_rate_combo.currentText()}
-声道: {self.channels_combo.currentText()}
-输出目录: {self.output_dir_edit.text()}
-命名模式: {self.naming_combo.currentText()}
-合并文件: {'是' if self.merge_check.isChecked() else '否'}
-字幕输出: {'是' if self.generate_subtitle_check.isChecked() else '否'}
-字幕格式: {self.subtitle_format_combo.currentText()}
-字幕编码: {self.subtitle_encoding_combo.currentText()}
-时间偏移: {self.subtitle_offset_spin.value()} 秒
-        """.strip()
-        
-        # 检查预览文本组件是否存在
-        if hasattr(self, 'preview_text') and self.preview_text:
-            self.preview_text.setPlainText(preview_text)
-        
-        # 更新当前配置并发送信号
+        """更新预览并发送当前配置"""
+        self.rebuild_preview_text()
+        self.emit_current_config()
+    
+    def rebuild_preview_text(self):
+        """重新生成预览文本（预览组未创建时直接跳过）"""
+        if getattr(self, 'preview_text', None) is None:
+            return
+        
+        self.preview_text.setPlainText(PREVIEW_TEMPLATE.format_map({
+            'format': self.format_combo.currentText(),
+            'encoder': self.encoder_combo.currentText(),
+            'bitrate': self.bitrate_slider.value(),
+            'sample_rate': self.sample_rate_combo.currentText(),
+            'channels': self.channels_combo.currentText(),
+            'output_dir': self.output_dir_edit.text(),
+            'naming_mode': self.naming_combo.currentText(),
+            'merge_files': '是' if self.merge_check.isChecked() else '否',
+            'generate_subtitle': '是' if self.generate_subtitle_check.isChecked() else '否',
+            'subtitle_format': self.subtitle_format_combo.currentText(),
+            'subtitle_encoding': self.subtitle_encoding_combo.currentText(),
+            'subtitle_offset': self.subtitle_offset_spin.value(),
+        }))
+    
+    def emit_current_config(self):
+        """更新当前配置并发送输出设置改变信号"""
         self.update_current_config()
         self.output_changed.emit(self.current_output_config)
     
-    def update_current_config(self):
-        """更新当前输出配置"""
-        try:
-            # 更新当前配置
-            self.current_output_config.output_dir = self.output_dir_edit.text()
-            self.current_output_config.format = self.format_combo.currentText().lower()
-            self.current_output_config.bitrate = self.bitrate_slider.value()
-            self.current_output_config.sample_rate = int(self.sample_rate_combo.currentText().replace(' Hz', ''))
-            self.current_output_config.channels = 2 if self.channels_combo.currentText() == "立体声" else 1
-            self.current_output_config.merge_files = self.merge_check.isChecked()
-            self.current_output_config.merge_filename = self.merge_name_edit.text()
-            self.current_output_config.chapter_markers = self.chapter_markers_check.isChecked()
-            self.current_output_config.chapter_interval = self.chapter_interval_spin.value()
-            # 音频预处理设置（已隐藏，使用默认值）
-            self.current_output_config.normalize = True  # 默认启用音频标准化
-            self.current_output_config.noise_reduction = False  # 默认禁用降噪处理
-            # 高级设置（已隐藏，使用默认值）
-            self.current_output_config.concurrent_workers = 2  # 默认并发处理数
-            self.current_output_config.cleanup_temp = True  # 默认清理临时文件
-            
+    def collect_fields(self) -> dict:
+        """从界面控件收集输出配置字段"""
+        return {
+            'output_dir': self.output_dir_edit.text().strip() or "./output",
+            'format': self.format_combo.currentText().lower(),
+            'bitrate': self.bitrate_slider.value(),
+            'sample_rate': self.sample_rate_combo.currentData(),
+            'channels': self.channels_combo.currentData(),
+            'merge_files': self.merge_check.isChecked(),
+            'merge_filename': self.merge_name_edit.text(),
+            'chapter_markers': self.chapter_markers_check.isChecked(),
+            'chapter_interval': self.chapter_interval_spin.value(),
+            # 音频预处理和高级设置
+            **self.get_hidden_field_values(),
             # 文件命名设置
-            self.current_output_config.naming_mode = self.get_naming_mode_key(self.naming_combo.currentText())
-            self.current_output_config.custom_template = self.custom_name_edit.text()
-            self.current_output_config.name_length_limit = self.name_length_spin.value()
-            
+            'naming_mode': self.get_naming_mode_key(self.naming_combo.currentText()),
+            'custom_template': self.custom_name_edit.text(),
+            'name_length_limit': self.name_length_spin.value(),
             # 字幕设置
-            self.current_output_config.generate_subtitle = self.generate_subtitle_check.isChecked()
-            self.current_output_config.subtitle_format = self.subtitle_format_combo.currentText().lower()
-            self.current_output_config.subtitle_encoding = self.subtitle_encoding_combo.currentText()
-            self.current_output_config.subtitle_offset = self.subtitle_offset_spin.value()
-            
+            'generate_subtitle': self.generate_subtitle_check.isChecked(),
+            'subtitle_format': self.subtitle_format_combo.currentData() or 'lrc',
+            'subtitle_encoding': self.subtitle_encoding_combo.currentText().lower(),
+            'subtitle_offset': float(self.subtitle_offset_spin.value()),
+            'subtitle_style': self.subtitle_style.to_dict(),
+        }
+    
+    def update_current_config(self):
+        """更新当前输出配置（生成新的配置对象，已发出的配置不会被修改）"""
+        try:
+            # 不重新构造 OutputConfig：__post_init__ 会为输入中途的目录路径创建目录
+            config = copy.copy(self.current_output_config)
+            for name, value in self.collect_fields().items():
+                setattr(config, name, value)
+            self.current_output_config = config
         except Exception as e:
             self.logger.error(tr('output_settings.messages.update_config_failed', error=str(e)))
     
+    def get_hidden_field_values(self) -> dict:
+        """获取界面上隐藏的配置字段（高级模式下并发数和临时文件清理取自控件）"""
+        values = dict(HIDDEN_FIELD_DEFAULTS)
+        if self.advanced:
+            values['concurrent_workers'] = self.concurrent_spin.value()
+            values['cleanup_temp'] = self.cleanup_check.isChecked()
+        return values
+    
     def browse_output_directory(self):
         """浏览输出目录"""
         directory = QFileDialog.getExistingDirectory(
@@ -587,143 +757,126 @@ class OutputSettingsWidget(QWidget):
     def preview_settings(self):
         """预览输出设置"""
         self.update_preview()
-        QMessageBox.information(self, tr('output_settings.preview'), tr('output_settings.messages.preview_updated'))
+        self.notify_success('preview_updated')
     
     def test_output(self):
         """测试输出"""
         # 这里可以添加实际的输出测试逻辑
-        QMessageBox.information(self, tr('output_settings.test_output'), tr('output_settings.messages.test_pending'))
+        self.notify_success('test_pending')
     
     def get_output_config(self):
         """获取输出配置"""
-        # 获取输出目录路径
-        output_dir = self.output_dir_edit.text().strip()
-        if not output_dir:
-            output_dir = "./output"
-        
-        # 获取字幕格式
-        subtitle_format_text = self.subtitle_format_combo.currentText()
-        if "LRC" in subtitle_format_text:
-            subtitle_format = "lrc"
-        elif "SRT" in subtitle_format_text:
-            subtitle_format = "srt"
-        elif "VTT" in subtitle_format_text:
-            subtitle_format = "vtt"
-        elif "ASS" in subtitle_format_text:
-            subtitle_format = "ass"
-        else:
-            subtitle_format = "lrc"
-        
-        # 获取字幕编码
-        subtitle_encoding = self.subtitle_encoding_combo.currentText().lower()
-        
-        # 创建配置对象，路径转换会在__post_init__中自动处理
-        config = OutputConfig(
-            output_dir=output_dir,
-            format=self.format_combo.currentText().lower(),
-            bitrate=self.bitrate_slider.value(),
-            sample_rate=int(self.sample_rate_combo.currentText().split()[0]),
-            channels=2 if self.channels_combo.currentText() == "立体声" else 1,
-            merge_files=self.merge_check.isChecked(),
-            merge_filename=self.merge_name_edit.text(),
-            chapter_markers=self.chapter_markers_check.isChecked(),
-            chapter_interval=self.chapter_interval_spin.value(),
-            normalize=True,  # 默认启用音频标准化
-            noise_reduction=False,  # 默认禁用降噪处理
-            concurrent_workers=2,  # 默认并发处理数
-            cleanup_temp=True,  # 默认清理临时文件
-            # 文件命名设置
-            naming_mode=self.get_naming_mode_key(self.naming_combo.currentText()),
-            custom_template=self.custom_name_edit.text(),
-            name_length_limit=self.name_length_spin.value(),
-            # 字幕设置
-            generate_subtitle=self.generate_subtitle_check.isChecked(),
-            subtitle_format=subtitle_format,
-            subtitle_encoding=subtitle_encoding,
-            subtitle_offset=float(self.subtitle_offset_spin.value()),
-            subtitle_style=getattr(self, 'subtitle_style_config', {})
-        )
-        
-        return config
+        # 路径转换会在__post_init__中自动处理
+        return OutputConfig(**self.collect_fields())
     
     def set_output_config(self, config: OutputConfig):
-        """设置输出配置"""
+        """设置输出配置（设置期间屏蔽控件信号，最后统一更新一次预览）"""
+        blockers = [QSignalBlocker(widget) for widget in (
+            self.format_combo, self.bitrate_slider, self.sample_rate_combo, self.channels_combo,
+            self.output_dir_edit, self.merge_check, self.merge_name_edit,
+            self.chapter_markers_check, self.chapter_interval_spin,
+            self.naming_combo, self.custom_name_edit, self.name_length_spin,
+            self.generate_subtitle_check, self.subtitle_format_combo,
+            self.subtitle_encoding_combo, self.subtitle_offset_spin,
+        )]
+        
         self.format_combo.setCurrentText(config.format.upper())
-        self.bitrate_slider.setValue(config.bitrate)
-        self.sample_rate_combo.setCurrentText(f"{config.sample_rate} Hz")
-        self.channels_combo.setCurrentText("立体声" if config.channels == 2 else "单声道")
-        self.output_dir_edit.setText(config.output_dir)
-        self.merge_check.setChecked(config.merge_files)
-        self.merge_name_edit.setText(config.merge_filename)
-        self.chapter_markers_check.setChecked(config.chapter_markers)
-        self.chapter_interval_spin.setValue(config.chapter_interval)
-        # 高级设置（已隐藏，跳过设置）
-        # self.normalize_check.setChecked(config.normalize)
-        # self.noise_reduction_check.setChecked(config.noise_reduction)
-        # self.concurrent_spin.setValue(config.concurrent_workers)
-        # self.cleanup_check.setChecked(config.cleanup_temp)
+        self.select_combo_data(self.sample_rate_combo, config.sample_rate)
+        self.select_combo_data(self.channels_combo, 2 if config.channels == 2 else 1)
+        
+        # 直接对应单个控件的配置项：(属性名, 设置方法, 默认值)
+        # 高级设置（标准化、降噪、并发数、清理临时文件）已隐藏，不在界面上设置
+        field_setters = (
+            ('bitrate', self.bitrate_slider.setValue, 128),
+            ('output_dir', self.output_dir_edit.setText, './output'),
+            ('merge_files', self.merge_check.setChecked, False),
+            ('merge_filename', self.merge_name_edit.setText, '完整音频'),
+            ('chapter_markers', self.chapter_markers_check.setChecked, True),
+            ('chapter_interval', self.chapter_interval_spin.setValue, 2),
+            ('custom_template', self.custom_name_edit.setText, '{chapter_num:02d}_{title}'),
+            ('name_length_limit', self.name_length_spin.setValue, 50),
+            ('generate_subtitle', self.generate_subtitle_check.setChecked, False),
+        )
+        for attr, setter, default in field_setters:
+            setter(getattr(config, attr, default))
         
-        # 文件命名设置
+        # 文件命名设置：将键值转换为显示文本，并据此显示/隐藏自定义模板
         naming_mode = getattr(config, 'naming_mode', 'chapter_number_title')
-        # 将键值转换为显示文本
-        naming_display_text = self.naming_options.get(naming_mode, '章节序号 + 标题')
+        naming_display_text = self.NAMING_OPTIONS.get(naming_mode, self.NAMING_OPTIONS['chapter_number_title'])
         self.naming_combo.setCurrentText(naming_display_text)
-        self.custom_name_edit.setText(getattr(config, 'custom_template', '{chapter_num:02d}_{title}'))
-        self.name_length_spin.setValue(getattr(config, 'name_length_limit', 50))
-        
-        # 根据命名模式设置自定义模板的显示状态
         self.on_naming_mode_changed(naming_display_text)
         
-        # 字幕设置
-        self.generate_subtitle_check.setChecked(getattr(config, 'generate_subtitle', False))
-        
-        # 设置字幕格式
+        # 字幕格式，并据此显示/隐藏字幕样式设置
         subtitle_format = getattr(config, 'subtitle_format', 'lrc')
-        if subtitle_format == 'lrc':
-            self.subtitle_format_combo.setCurrentText("LRC (歌词格式)")
-        elif subtitle_format == 'srt':
-            self.subtitle_format_combo.setCurrentText("SRT (通用字幕)")
-        elif subtitle_format == 'vtt':
-            self.subtitle_format_combo.setCurrentText("VTT (WebVTT)")
-        elif subtitle_format == 'ass':
-            self.subtitle_format_combo.setCurrentText("ASS (高级字幕)")
-        else:
-            self.subtitle_format_combo.setCurrentText("LRC (歌词格式)")
-        
-        # 根据字幕格式设置字幕样式的显示状态
-        self.update_subtitle_style_visibility(self.subtitle_format_combo.currentText())
+        if subtitle_format not in self.SUBTITLE_FORMAT_TEXT_KEYS:
+            subtitle_format = 'lrc'
+        self.select_combo_data(self.subtitle_format_combo, subtitle_format)
+        self.update_subtitle_style_visibility(self.subtitle_format_combo.currentIndex())
         
-        # 设置字幕编码
-        subtitle_encoding = getattr(config, 'subtitle_encoding', 'utf-8')
-        self.subtitle_encoding_combo.setCurrentText(subtitle_encoding.upper())
-        
-        # 设置时间偏移
+        # 字幕编码、时间偏移和样式
+        self.subtitle_encoding_combo.setCurrentText(getattr(config, 'subtitle_encoding', 'utf-8').upper())
         self.subtitle_offset_spin.setValue(int(getattr(config, 'subtitle_offset', 0.0)))
+        self.subtitle_style = SubtitleStyle.from_dict(getattr(config, 'subtitle_style', {}))
+        
+        for blocker in blockers:
+            blocker.unblock()
         
-        # 设置字幕样式
-        self.subtitle_style_config = getattr(config, 'subtitle_style', {})
+        # 补上被屏蔽的信号原本会触发的界面联动
+        self.update_encoder_options(self.format_combo.currentText())
+        self.bitrate_label.setText(f"{self.bitrate_slider.value()} kbps")
+        self.merge_name_edit.setEnabled(self.merge_check.isChecked())
         
+        self.preview_timer.stop()
         self.update_preview()
     
+    def notify_success(self, message_key: str, **kwargs):
+        """记录操作成功，并通过状态栏提示（不弹出阻塞对话框）"""
+        message = tr(f'output_settings.messages.{message_key}', **kwargs)
+        self.logger.info(message)
+        self.status_message.emit(message)
+    
+    def notify_error(self, message_key: str, **kwargs):
+        """记录并提示操作失败（消息文本只格式化一次）"""
+        message = tr(f'output_settings.messages.{message_key}', **kwargs)
+        self.logger.error(message)
+        QMessageBox.critical(self, tr('output_settings.messages.error'), message)
+    
     def load_config(self):
         """加载配置"""
         try:
-            self.current_output_config = self.config_service.load_output_config()
-            
-            # 更新UI
-            self.set_output_config(self.current_output_config)
-            
-            self.config_status_label.setText(f"{tr('output_settings.config_status')} {tr('output_settings.loaded')}")
-            self.config_status_label.setStyleSheet("color: green; font-size: 12px;")
-            
-            self.logger.info(tr('output_settings.messages.config_loaded'))
-            
+            self.on_config_loaded(self.config_service.load_output_config())
         except Exception as e:
-            self.logger.error(tr('output_settings.messages.load_failed', error=str(e)))
-            QMessageBox.critical(self, tr('output_settings.messages.error'), tr('output_settings.messages.load_failed', error=str(e)))
+            self.on_config_load_failed(str(e))
+    
+    def on_config_loaded(self, config: OutputConfig):
+        """配置读取完成，更新界面"""
+        self.current_output_config = config
+        
+        # 更新UI
+        self.set_output_config(self.current_output_config)
+        
+        self.config_status_key = 'loaded'
+        self.update_config_status_label()
+        self.config_status_label.setStyleSheet("color: green; font-size: 12px;")
+        
+        self.logger.info(tr('output_settings.messages.config_loaded'))
+    
+    def on_config_load_failed(self, error: str):
+        """配置读取失败"""
+        self.notify_error('load_failed', error=error)
     
     def save_config(self):
-        """保存配置"""
+        """保存配置（延迟写入，合并短时间内的多次保存）"""
+        self.save_timer.start()
+    
+    def flush_pending_save(self):
+        """立即执行尚未到期的延迟保存（关闭窗口、导出配置前调用）"""
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.write_config()
+    
+    def write_config(self):
+        """将当前界面配置写入配置文件"""
         try:
             # 更新当前配置
             self.current_output_config = self.get_output_config()
@@ -731,15 +884,14 @@ class OutputSettingsWidget(QWidget):
             # 保存到配置文件
             self.config_service.save_output_config(self.current_output_config)
             
-            self.config_status_label.setText(f"{tr('output_settings.config_status')} {tr('output_settings.saved')}")
+            self.config_status_key = 'saved'
+            self.update_config_status_label()
             self.config_status_label.setStyleSheet("color: green; font-size: 12px;")
             
-            QMessageBox.information(self, tr('output_settings.messages.success'), tr('output_settings.messages.config_saved'))
-            self.logger.info(tr('output_settings.messages.config_saved'))
+            self.notify_success('config_saved')
             
         except Exception as e:
-            self.logger.error(tr('output_settings.messages.save_failed', error=str(e)))
-            QMessageBox.critical(self, tr('output_settings.messages.error'), tr('output_settings.messages.save_failed', error=str(e)))
+            self.notify_error('save_failed', error=str(e))
     
     def export_config(self):
         """导出配置"""
@@ -747,18 +899,19 @@ class OutputSettingsWidget(QWidget):
             file_path, _ = QFileDialog.getSaveFileName(
                 self, 
                 tr('output_settings.export_config'), 
-                "output_config.ini",
-                "配置文件 (*.ini);;所有文件 (*)"
+                os.path.join(self.last_config_dir, "output_config.json"),
+                "配置文件 (*.json);;所有文件 (*)",
+                options=QFileDialog.Option.DontResolveSymlinks
             )
             
             if file_path:
+                self.last_config_dir = os.path.dirname(file_path)
+                self.flush_pending_save()
                 self.config_service.export_config(file_path)
-                QMessageBox.information(self, tr('output_settings.messages.success'), tr('output_settings.messages.config_exported', path=file_path))
-                self.logger.info(tr('output_settings.messages.config_exported', path=file_path))
+                self.notify_success('config_exported', path=file_path)
                 
         except Exception as e:
-            self.logger.error(tr('output_settings.messages.export_failed', error=str(e)))
-            QMessageBox.critical(self, tr('output_settings.messages.error'), tr('output_settings.messages.export_failed', error=str(e)))
+            self.notify_error('export_failed', error=str(e))
     
     def import_config(self):
         """导入配置"""
@@ -766,34 +919,36 @@ class OutputSettingsWidget(QWidget):
             file_path, _ = QFileDialog.getOpenFileName(
                 self, 
                 tr('output_settings.import_config'), 
-                "",
-                "配置文件 (*.ini);;所有文件 (*)"
+                self.last_config_dir,
+                "配置文件 (*.json);;所有文件 (*)",
+                options=QFileDialog.Option.DontResolveSymlinks
             )
             
             if file_path:
-                self.config_service.import_config(file_path)
-                # 重新加载配置
-                self.load_config()
-                QMessageBox.information(self, tr('output_settings.messages.success'), tr('output_settings.messages.config_imported', path=file_path))
-                self.logger.info(tr('output_settings.messages.config_imported', path=file_path))
+                self.last_config_dir = os.path.dirname(file_path)
+                imported_data = self.config_service.import_config(file_path)
+                # 直接用导入的数据更新界面；文件中没有输出设置时沿用合并后的配置
+                if 'output_settings' in imported_data:
+                    self.on_config_loaded(OutputConfig.from_dict(imported_data['output_settings']))
+                else:
+                    self.load_config()
+                self.notify_success('config_imported', path=file_path)
                 
         except Exception as e:
-            self.logger.error(tr('output_settings.messages.import_failed', error=str(e)))
-            QMessageBox.critical(self, tr('output_settings.messages.error'), tr('output_settings.messages.import_failed', error=str(e)))
-    
-    def update_subtitle_style_visibility(self, format_text):
-        """更新字幕样式设置的可见性"""
-        is_ass_format = "ASS" in format_text
-        self.subtitle_style_label.setVisible(is_ass_format)
-        self.subtitle_style_button.setVisible(is_ass_format)
+            self.notify_error('import_failed', error=str(e))
+    
+    def update_subtitle_style_visibility(self, index: int):
+        """更新字幕样式设置的可见性（仅ASS格式显示）"""
+        is_ass_format = self.subtitle_format_combo.itemData(index) == 'ass'
+        for widget in (self.subtitle_style_label, self.subtitle_style_button):
+            widget.setVisible(is_ass_format)
         self.subtitle_style_button.setEnabled(is_ass_format)
     
-    def open_subtitle_style_dialog(self):
-        """打开字幕样式设置对话框"""
-        from PyQt6.QtWidgets import QDialog, QDialogButtonBox
-        
+    def create_subtitle_style_dialog(self):
+        """创建字幕样式设置对话框（只创建一次，之后重复使用）"""
         dialog = QDialog(self)
-        dialog.setWindowTitle(tr('output_settings.subtitle_style_dialog'))
+        dialog.setWindowTitle(self.texts['subtitle_style_dialog'])
+        self.track_text(dialog.setWindowTitle, 'subtitle_style_dialog')
         dialog.setModal(True)
         dialog.resize(400, 300)
         
@@ -803,56 +958,55 @@ class OutputSettingsWidget(QWidget):
         form_layout = QFormLayout()
         
         # 字体设置
-        font_name_edit = QLineEdit("Arial")
-        font_size_spin = QSpinBox()
-        font_size_spin.setRange(8, 72)
-        font_size_spin.setValue(20)
-        
-        # 颜色设置
-        primary_color_edit = QLineEdit("&H00FFFFFF")
-        secondary_color_edit = QLineEdit("&H000000FF")
-        outline_color_edit = QLineEdit("&H00000000")
-        back_color_edit = QLineEdit("&H80000000")
+        self.style_font_name_edit = QLineEdit()
+        self.style_font_size_spin = self.create_spin_box(8, 72)
+        
+        # 颜色设置：只读的ASS颜色文本 + 颜色选择按钮（校验器用于识别配置中的无效颜色）
+        self.style_primary_color_edit = QLineEdit()
+        self.style_secondary_color_edit = QLineEdit()
+        self.style_outline_color_edit = QLineEdit()
+        self.style_back_color_edit = QLineEdit()
+        color_validator = QRegularExpressionValidator(ASS_COLOR_PATTERN, dialog)
+        color_fields = {}
+        for edit in (self.style_primary_color_edit, self.style_secondary_color_edit,
+                     self.style_outline_color_edit, self.style_back_color_edit):
+            edit.setValidator(color_validator)
+            edit.setReadOnly(True)
+            color_fields[edit] = self.create_color_field(edit)
         
         # 效果设置
-        bold_check = QCheckBox(tr('output_settings.bold'))
-        italic_check = QCheckBox(tr('output_settings.italic'))
-        underline_check = QCheckBox(tr('output_settings.underline'))
+        self.style_bold_check = QCheckBox(self.texts['bold'])
+        self.track_text(self.style_bold_check.setText, 'bold')
+        self.style_italic_check = QCheckBox(self.texts['italic'])
+        self.track_text(self.style_italic_check.setText, 'italic')
+        self.style_underline_check = QCheckBox(self.texts['underline'])
+        self.track_text(self.style_underline_check.setText, 'underline')
         
         # 对齐设置
-        alignment_combo = QComboBox()
-        alignment_combo.addItems([
-            tr('output_settings.bottom_left'), tr('output_settings.bottom_center'), tr('output_settings.bottom_right'),
-            tr('output_settings.top_left'), tr('output_settings.top_center'), tr('output_settings.top_right'),
-            tr('output_settings.left_center'), tr('output_settings.center'), tr('output_settings.right_center')
-        ])
-        alignment_combo.setCurrentText(tr('output_settings.bottom_center'))
+        self.style_alignment_combo = QComboBox()
+        for alignment, text_key in self.ALIGNMENT_TEXT_KEYS.items():
+            self.style_alignment_combo.addItem(self.texts[text_key], alignment)
+        self.track_combo_items(self.style_alignment_combo, tuple(self.ALIGNMENT_TEXT_KEYS.values()))
         
         # 边距设置
-        margin_l_spin = QSpinBox()
-        margin_l_spin.setRange(0, 100)
-        margin_l_spin.setValue(10)
-        margin_r_spin = QSpinBox()
-        margin_r_spin.setRange(0, 100)
-        margin_r_spin.setValue(10)
-        margin_v_spin = QSpinBox()
-        margin_v_spin.setRange(0, 100)
-        margin_v_spin.setValue(10)
+        self.style_margin_l_spin = self.create_spin_box(0, 100)
+        self.style_margin_r_spin = self.create_spin_box(0, 100)
+        self.style_margin_v_spin = self.create_spin_box(0, 100)
         
         # 添加到表单
-        form_layout.addRow(tr('output_settings.font_name'), font_name_edit)
-        form_layout.addRow(tr('output_settings.font_size'), font_size_spin)
-        form_layout.addRow(tr('output_settings.primary_color'), primary_color_edit)
-        form_layout.addRow(tr('output_settings.secondary_color'), secondary_color_edit)
-        form_layout.addRow(tr('output_settings.outline_color'), outline_color_edit)
-        form_layout.addRow(tr('output_settings.back_color'), back_color_edit)
-        form_layout.addRow("", bold_check)
-        form_layout.addRow("", italic_check)
-        form_layout.addRow("", underline_check)
-        form_layout.addRow(tr('output_settings.alignment'), alignment_combo)
-        form_layout.addRow(tr('output_settings.left_margin'), margin_l_spin)
-        form_layout.addRow(tr('output_settings.right_margin'), margin_r_spin)
-        form_layout.addRow(tr('output_settings.vertical_margin'), margin_v_spin)
+        self.add_form_row(form_layout, 'font_name', self.style_font_name_edit)
+        self.add_form_row(form_layout, 'font_size', self.style_font_size_spin)
+        self.add_form_row(form_layout, 'primary_color', color_fields[self.style_primary_color_edit])
+        self.add_form_row(form_layout, 'secondary_color', color_fields[self.style_secondary_color_edit])
+        self.add_form_row(form_layout, 'outline_color', color_fields[self.style_outline_color_edit])
+        self.add_form_row(form_layout, 'back_color', color_fields[self.style_back_color_edit])
+        form_layout.addRow("", self.style_bold_check)
+        form_layout.addRow("", self.style_italic_check)
+        form_layout.addRow("", self.style_underline_check)
+        self.add_form_row(form_layout, 'alignment', self.style_alignment_combo)
+        self.add_form_row(form_layout, 'left_margin', self.style_margin_l_spin)
+        self.add_form_row(form_layout, 'right_margin', self.style_margin_r_spin)
+        self.add_form_row(form_layout, 'vertical_margin', self.style_margin_v_spin)
         
         layout.addLayout(form_layout)
         
@@ -862,24 +1016,88 @@ class OutputSettingsWidget(QWidget):
         button_box.rejected.connect(dialog.reject)
         layout.addWidget(button_box)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # 保存样式设置
-            style_config = {
-                "fontname": font_name_edit.text(),
-                "fontsize": font_size_spin.value(),
-                "primarycolor": primary_color_edit.text(),
-                "secondarycolor": secondary_color_edit.text(),
-                "outlinecolor": outline_color_edit.text(),
-                "backcolor": back_color_edit.text(),
-                "bold": 1 if bold_check.isChecked() else 0,
-                "italic": 1 if italic_check.isChecked() else 0,
-                "underline": 1 if underline_check.isChecked() else 0,
-                "alignment": alignment_combo.currentIndex() + 1,
-                "margin_l": margin_l_spin.value(),
-                "margin_r": margin_r_spin.value(),
-                "margin_v": margin_v_spin.value()
-            }
-            
+        self.subtitle_style_dialog = dialog
+    
+    def create_color_field(self, edit: QLineEdit) -> QWidget:
+        """创建颜色字段：颜色文本 + 显示当前颜色的选择按钮"""
+        field = QWidget()
+        layout = QHBoxLayout(field)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(edit)
+        
+        button = QPushButton()
+        button.setFixedWidth(32)
+        button.clicked.connect(partial(self.choose_style_color, edit))
+        edit.textChanged.connect(partial(self.update_color_swatch, edit, button))
+        layout.addWidget(button)
+        return field
+    
+    def update_color_swatch(self, edit: QLineEdit, button: QPushButton):
+        """按颜色文本更新选择按钮的背景色"""
+        if edit.hasAcceptableInput():
+            button.setStyleSheet(f"background-color: {ass_to_qcolor(edit.text()).name()};")
+        else:
+            button.setStyleSheet("")
+    
+    def choose_style_color(self, edit: QLineEdit):
+        """打开颜色对话框选择颜色"""
+        initial = ass_to_qcolor(edit.text()) if edit.hasAcceptableInput() else QColor("white")
+        color = QColorDialog.getColor(
+            initial, self.subtitle_style_dialog, "",
+            QColorDialog.ColorDialogOption.ShowAlphaChannel
+        )
+        if color.isValid():
+            edit.setText(qcolor_to_ass(color))
+    
+    def get_style_color(self, key: str, edit: QLineEdit) -> str:
+        """读取颜色输入框，输入不完整时使用默认颜色"""
+        if edit.hasAcceptableInput():
+            return edit.text().upper()
+        return getattr(SubtitleStyle(), key)
+    
+    def set_subtitle_style_fields(self, style: SubtitleStyle):
+        """用字幕样式填充对话框控件"""
+        self.style_font_name_edit.setText(style.fontname)
+        self.style_font_size_spin.setValue(style.fontsize)
+        self.style_primary_color_edit.setText(style.primarycolor)
+        self.style_secondary_color_edit.setText(style.secondarycolor)
+        self.style_outline_color_edit.setText(style.outlinecolor)
+        self.style_back_color_edit.setText(style.backcolor)
+        self.style_bold_check.setChecked(bool(style.bold))
+        self.style_italic_check.setChecked(bool(style.italic))
+        self.style_underline_check.setChecked(bool(style.underline))
+        self.select_combo_data(self.style_alignment_combo, style.alignment)
+        self.style_margin_l_spin.setValue(style.margin_l)
+        self.style_margin_r_spin.setValue(style.margin_r)
+        self.style_margin_v_spin.setValue(style.margin_v)
+    
+    def get_subtitle_style_fields(self) -> SubtitleStyle:
+        """从对话框控件读取字幕样式"""
+        return SubtitleStyle(
+            fontname=self.style_font_name_edit.text(),
+            fontsize=self.style_font_size_spin.value(),
+            primarycolor=self.get_style_color("primarycolor", self.style_primary_color_edit),
+            secondarycolor=self.get_style_color("secondarycolor", self.style_secondary_color_edit),
+            outlinecolor=self.get_style_color("outlinecolor", self.style_outline_color_edit),
+            backcolor=self.get_style_color("backcolor", self.style_back_color_edit),
+            bold=1 if self.style_bold_check.isChecked() else 0,
+            italic=1 if self.style_italic_check.isChecked() else 0,
+            underline=1 if self.style_underline_check.isChecked() else 0,
+            alignment=self.style_alignment_combo.currentData(),
+            margin_l=self.style_margin_l_spin.value(),
+            margin_r=self.style_margin_r_spin.value(),
+            margin_v=self.style_margin_v_spin.value()
+        )
+    
+    def open_subtitle_style_dialog(self):
+        """打开字幕样式设置对话框"""
+        if self.subtitle_style_dialog is None:
+            self.create_subtitle_style_dialog()
+        
+        # 每次打开时按当前样式配置重置控件
+        self.set_subtitle_style_fields(self.subtitle_style)
+        
+        if self.subtitle_style_dialog.exec() == QDialog.DialogCode.Accepted:
             # 存储样式配置（这里可以保存到配置中）
-            self.subtitle_style_config = style_config
-            QMessageBox.information(self, tr('output_settings.messages.success'), tr('output_settings.messages.style_saved'))
+            self.subtitle_style = self.get_subtitle_style_fields()
+            self.notify_success('style_saved')
@@ -2,12 +2,10 @@
 设置界面
 """
 
-# 先导入 piper，避免 PyQt6 的兼容性问题
-try:
-    from piper import PiperVoice, SynthesisConfig
-    print("[OK] Piper TTS 在设置界面预加载成功")
-except Exception as e:
-    print(f"[WARN] Piper TTS 在设置界面预加载失败: {e}")
+# Piper TTS 由 utils.piper_preloader 在导入 PyQt6 之前统一预加载，这里不再重复导入
+
+from functools import lru_cache, partial
+from typing import Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
@@ -15,18 +13,170 @@ from PyQt6.QtWidgets import (
     QPushButton, QGroupBox, QFormLayout, QMessageBox,
     QTabWidget, QScrollArea, QFrame, QFileDialog,
     QTextEdit, QDialog, QDialogButtonBox, QListWidget,
-    QListWidgetItem, QInputDialog, QColorDialog, QGridLayout
+    QListWidgetItem, QInputDialog, QColorDialog, QGridLayout, QListView
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker, QTimer, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QFont, QColor
 
 from controllers.settings_controller import SettingsController
 from models.config_model import AppConfig
 from utils.log_manager import LogManager
+from utils.ui_config import UI_CONFIG_FILE, ui_config_lock, read_ui_config, write_ui_config
 from services.theme_service import theme_service
 from services.theme_config_service import theme_config_service
 from services.language_service import get_language_service, get_text as tr
 from services.tts_service import TTSServiceFactory
+from ui.lazy_list_model import LazyListModel
+
+
+# 字体选项：配置值 -> 文本键
+FONT_SIZE_KEYS = {"small": "settings.fonts.small", "medium": "settings.fonts.medium", "large": "settings.fonts.large"}
+FONT_WEIGHT_KEYS = {"normal": "settings.fonts.normal", "bold": "settings.fonts.bold"}
+
+# 字体下拉框各下标对应的配置值（与下拉框选项顺序一致）
+FONT_SIZE_OPTIONS = tuple(FONT_SIZE_KEYS)
+FONT_WEIGHT_OPTIONS = tuple(FONT_WEIGHT_KEYS)
+
+# 字体大小对应的磅值 - 增加差异使其更明显
+FONT_POINT_SIZES = {"small": 9, "medium": 12, "large": 16}
+
+
+# 主题按钮与预览组件的样式模板，占位符为主题颜色
+THEME_BUTTON_QSS = """
+QPushButton {{
+    background-color: {background};
+    color: {text};
+    border: 2px solid {primary};
+    border-radius: 5px;
+    padding: 8px 12px;
+    font-weight: bold;
+}}
+QPushButton:hover {{
+    background-color: {primary};
+    color: {background};
+}}
+QPushButton:checked {{
+    background-color: {primary};
+    color: {background};
+    border: 2px solid {text};
+}}
+"""
+PREVIEW_FRAME_QSS = """
+QFrame {{
+    background-color: {background};
+    border: 1px solid {primary};
+    border-radius: 5px;
+}}
+"""
+PREVIEW_BUTTON_QSS = """
+QPushButton {{
+    background-color: {primary};
+    color: {background};
+    border: 1px solid {primary};
+    border-radius: 3px;
+}}
+"""
+PREVIEW_EDIT_QSS = """
+QLineEdit {{
+    background-color: {background};
+    color: {text};
+    border: 1px solid {primary};
+    border-radius: 3px;
+}}
+"""
+PREVIEW_LABEL_QSS = """
+QLabel {{
+    color: {text};
+}}
+"""
+COLOR_BUTTON_QSS = "background-color: {color}; color: white;"
+
+# 主题缺少颜色时使用的默认值
+DEFAULT_THEME_COLORS = {"primary": "#0078d4", "background": "#ffffff", "text": "#000000"}
+
+
+def get_theme_colors(colors: dict) -> dict:
+    """补齐样式模板需要的主题颜色"""
+    return {name: colors.get(name, default) for name, default in DEFAULT_THEME_COLORS.items()}
+
+
+@lru_cache(maxsize=1)
+def get_preset_themes() -> tuple:
+    """获取预设主题列表 ((主题ID, 主题信息), ...)，进程内只构建一次，供各设置界面共用"""
+    themes = []
+    for theme_id in theme_config_service.get_available_themes():
+        theme_info = theme_config_service.get_theme_info(theme_id)
+        if theme_info:
+            themes.append((theme_id, theme_info))
+    return tuple(themes)
+
+
+@lru_cache(maxsize=64)
+def get_preset_theme_colors(theme_id: str) -> Optional[dict]:
+    """获取预设主题补齐后的颜色（预设主题运行期间不变，按主题缓存；返回值只读）"""
+    theme_config = theme_config_service.get_preset_theme_config(theme_id)
+    if theme_config and 'colors' in theme_config:
+        return get_theme_colors(theme_config['colors'])
+    return None
+
+
+def add_form_rows(layout: QFormLayout, rows, label_suffix: str = ":"):
+    """批量添加表单行 (标签文本键, 控件或布局)，文本键为 None 时不显示标签；添加期间暂停父组件刷新"""
+    parent = layout.parentWidget()
+    if parent is not None:
+        parent.setUpdatesEnabled(False)
+    try:
+        for key, field in rows:
+            layout.addRow(tr(key) + label_suffix if key else "", field)
+    finally:
+        if parent is not None:
+            parent.setUpdatesEnabled(True)
+
+
+def apply_style_sheet(widget, style: str):
+    """设置组件样式表，与当前样式相同时跳过，避免Qt重新解析样式"""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
+@lru_cache(maxsize=8)
+def get_font_labels(language: str) -> tuple:
+    """获取字体大小和粗细选项的显示文本（按选项顺序），每种语言只构建一次"""
+    size_labels = tuple(tr(key) for key in FONT_SIZE_KEYS.values())
+    weight_labels = tuple(tr(key) for key in FONT_WEIGHT_KEYS.values())
+    return size_labels, weight_labels
+
+
+class UIConfigSaveSignals(QObject):
+    """界面配置保存任务信号"""
+    
+    saved = pyqtSignal(dict, bool)  # 配置项, 是否写入了文件
+    failed = pyqtSignal(str)  # 错误信息
+
+
+class UIConfigSaveTask(QRunnable):
+    """界面配置保存任务（在线程池中执行，读取、合并并写回配置文件）"""
+    
+    def __init__(self, config_path: str, updates: dict):
+        super().__init__()
+        self.config_path = config_path
+        self.updates = updates
+        self.signals = UIConfigSaveSignals()
+    
+    def run(self):
+        """合并配置项并写回配置文件"""
+        try:
+            with ui_config_lock:
+                config = read_ui_config(self.config_path)
+                
+                # 配置项都未改变时不写文件
+                written = any(config.get(key) != value for key, value in self.updates.items())
+                if written:
+                    config = {**config, **self.updates}
+                    write_ui_config(config, self.config_path)
+            self.signals.saved.emit(self.updates, written)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class SettingsWidget(QWidget):
@@ -34,6 +184,26 @@ class SettingsWidget(QWidget):
     
     # 信号定义
     settings_changed = pyqtSignal(object)  # 设置改变信号
+    language_change_requested = pyqtSignal(str)  # 请求切换界面语言（语言代码）
+    
+    # 语言选择的合并间隔（毫秒），快速连续切换选项时只切换一次语言
+    LANGUAGE_DEBOUNCE_MS = 150
+    
+    # 标签页定义：(键, 标题翻译键)，顺序即显示顺序
+    TAB_SPECS = (
+        ("ui", "settings.title"),
+        ("audio", "settings.audio_settings"),
+        ("tts", "settings.tts_settings"),
+        ("advanced", "settings.advanced_settings"),
+    )
+    
+    # 自定义颜色按钮：颜色类型 -> 文本键
+    COLOR_TEXT_KEYS = {
+        "primary": "settings.colors.primary",
+        "background": "settings.colors.background",
+        "text": "settings.colors.text",
+        "tab_text": "settings.colors.tab_text",
+    }
     
     def __init__(self, settings_controller: SettingsController):
         super().__init__()
@@ -43,18 +213,44 @@ class SettingsWidget(QWidget):
         # 当前配置
         self.current_config = None
         
-        # 主窗口引用
-        self.main_window = None
+        # 语言切换定时器：连续的语言选择只在最后一次选择后切换
+        self.pending_language = None
+        self.language_timer = QTimer(self)
+        self.language_timer.setSingleShot(True)
+        self.language_timer.setInterval(self.LANGUAGE_DEBOUNCE_MS)
+        self.language_timer.timeout.connect(self.commit_language_change)
+        
+        # 主题按钮：主题ID -> 按钮（在 create_theme_buttons 中创建）
+        self.theme_buttons = {}
+        
+        # 自定义颜色：颜色类型 -> 颜色值
+        self.custom_colors = {}
+        
+        # 颜色对话框（首次选择颜色时创建）
+        self.color_dialog = None
+        
+        # 当前已应用并预览的预设主题
+        self.current_preview_theme = None
+        
+        # 字体预览用的字体：(磅值, 是否粗体) -> QFont
+        self.preview_fonts = {}
+        
+        # 字体选项和颜色按钮文本（随语言切换重建）
+        self.rebuild_font_labels()
+        self.rebuild_color_labels()
         
         # 初始化UI
         self.setup_ui()
         self.setup_connections()
         self.load_settings()
     
-    def set_main_window(self, main_window):
-        """设置主窗口引用"""
-        self.main_window = main_window
-        self.logger.info("主窗口引用已设置")
+    def rebuild_font_labels(self):
+        """按当前语言重建字体选项的显示文本"""
+        self.font_size_labels, self.font_weight_labels = get_font_labels(get_language_service().get_current_language())
+    
+    def rebuild_color_labels(self):
+        """按当前语言重建颜色按钮的文本"""
+        self.color_labels = {color_type: tr(key) for color_type, key in self.COLOR_TEXT_KEYS.items()}
     
     def setup_ui(self):
         """设置用户界面"""
@@ -67,21 +263,43 @@ class SettingsWidget(QWidget):
         title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
         layout.addWidget(title_label)
         
-        # 创建标签页
+        # 创建标签页（各标签页在首次切换到时才创建）
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # 界面设置标签页
-        self.create_ui_tab()
-        
-        # 音频设置标签页
-        self.create_audio_tab()
-        
-        # TTS设置标签页
-        self.create_tts_tab()
-        
-        # 高级设置标签页
-        self.create_advanced_tab()
+        # 标签页创建函数、配置加载函数和配置收集函数：键 -> 方法
+        self.tab_builders = {
+            "ui": self.create_ui_tab,
+            "audio": self.create_audio_tab,
+            "tts": self.create_tts_tab,
+            "advanced": self.create_advanced_tab,
+        }
+        self.tab_config_loaders = {
+            "ui": self.update_ui_tab_from_config,
+            "audio": self.update_audio_tab_from_config,
+            "tts": self.update_tts_tab_from_config,
+            "advanced": self.update_advanced_tab_from_config,
+        }
+        self.tab_config_collectors = {
+            "ui": self.update_config_from_ui_tab,
+            "audio": self.update_config_from_audio_tab,
+            "tts": self.update_config_from_tts_tab,
+            "advanced": self.update_config_from_advanced_tab,
+        }
+        
+        # 先添加空的占位页，真正的界面在 ensure_tab 中创建
+        self.tab_pages = {}
+        self.built_tabs = set()
+        for key, title_key in self.TAB_SPECS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_pages[key] = page
+            self.tab_widget.addTab(page, tr(title_key))
+        
+        # 界面设置标签页立即创建，其余在切换时创建
+        self.ensure_tab(self.TAB_SPECS[0][0])
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # 按钮区域
         button_layout = QHBoxLayout()
@@ -105,6 +323,24 @@ class SettingsWidget(QWidget):
         button_layout.addStretch()
         layout.addLayout(button_layout)
     
+    def on_tab_changed(self, index: int):
+        """标签页切换事件"""
+        if 0 <= index < len(self.TAB_SPECS):
+            self.ensure_tab(self.TAB_SPECS[index][0])
+    
+    def ensure_tab(self, key: str):
+        """确保标签页界面已创建，创建后立即填入当前配置"""
+        if key in self.built_tabs:
+            return
+        try:
+            widget = self.tab_builders[key]()
+            self.tab_pages[key].layout().addWidget(widget)
+            self.built_tabs.add(key)
+            if self.current_config:
+                self.tab_config_loaders[key]()
+        except Exception as e:
+            self.logger.error(f"创建设置标签页失败: {key}, 错误: {e}")
+    
     def create_ui_tab(self):
         """创建界面设置标签页"""
         widget = QFrame()
@@ -130,54 +366,39 @@ class SettingsWidget(QWidget):
         custom_group = QGroupBox(tr("settings.custom_settings"))
         custom_layout = QFormLayout(custom_group)
         
-        # 颜色自定义
+        # 颜色自定义：颜色类型 -> 按钮，按 COLOR_TEXT_KEYS 的顺序创建
         color_layout = QHBoxLayout()
-        self.primary_color_btn = QPushButton(tr("settings.colors.primary"))
-        self.primary_color_btn.clicked.connect(lambda: self.choose_color("primary"))
-        color_layout.addWidget(self.primary_color_btn)
-        
-        self.background_color_btn = QPushButton(tr("settings.colors.background"))
-        self.background_color_btn.clicked.connect(lambda: self.choose_color("background"))
-        color_layout.addWidget(self.background_color_btn)
-        
-        self.text_color_btn = QPushButton(tr("settings.colors.text"))
-        self.text_color_btn.clicked.connect(lambda: self.choose_color("text"))
-        color_layout.addWidget(self.text_color_btn)
-        
-        self.tab_color_btn = QPushButton(tr("settings.colors.tab_text"))
-        self.tab_color_btn.clicked.connect(lambda: self.choose_color("tab_text"))
-        color_layout.addWidget(self.tab_color_btn)
-        
-        custom_layout.addRow(tr("settings.colors.primary") + ":", color_layout)
+        self.color_buttons = {}
+        for color_type in self.COLOR_TEXT_KEYS:
+            button = QPushButton(self.color_labels[color_type])
+            button.clicked.connect(partial(self.choose_color, color_type))
+            color_layout.addWidget(button)
+            self.color_buttons[color_type] = button
         
         # 字体设置
         font_layout = QHBoxLayout()
         
         self.font_size_combo = QComboBox()
-        self.font_size_combo.addItems([
-            tr("settings.fonts.small"),
-            tr("settings.fonts.medium"),
-            tr("settings.fonts.large")
-        ])
-        self.font_size_combo.setCurrentText(tr("settings.fonts.medium"))
+        self.font_size_combo.addItems(self.font_size_labels)
+        self.font_size_combo.setCurrentIndex(FONT_SIZE_OPTIONS.index("medium"))
         font_layout.addWidget(QLabel(tr("settings.fonts.size") + ":"))
         font_layout.addWidget(self.font_size_combo)
         
         self.font_weight_combo = QComboBox()
-        self.font_weight_combo.addItems([
-            tr("settings.fonts.normal"),
-            tr("settings.fonts.bold")
-        ])
-        self.font_weight_combo.setCurrentText(tr("settings.fonts.normal"))
+        self.font_weight_combo.addItems(self.font_weight_labels)
+        self.font_weight_combo.setCurrentIndex(FONT_WEIGHT_OPTIONS.index("normal"))
         font_layout.addWidget(QLabel(tr("settings.fonts.weight") + ":"))
         font_layout.addWidget(self.font_weight_combo)
         
-        custom_layout.addRow(tr("settings.fonts.size") + ":", font_layout)
-        
         # 自定义主题按钮
         self.custom_theme_btn = QPushButton(tr("settings.apply_custom_theme"))
         self.custom_theme_btn.clicked.connect(self.apply_custom_theme)
-        custom_layout.addRow("", self.custom_theme_btn)
+        
+        add_form_rows(custom_layout, [
+            ("settings.colors.primary", color_layout),
+            ("settings.fonts.size", font_layout),
+            (None, self.custom_theme_btn),
+        ])
         
         layout.addWidget(custom_group)
         
@@ -196,7 +417,6 @@ class SettingsWidget(QWidget):
         self.window_height_spin.setRange(600, 1500)
         self.window_height_spin.setValue(800)
         size_layout.addWidget(self.window_height_spin)
-        window_layout.addRow(tr("settings.window_size"), size_layout)
         
         # 语言选择
         language_layout = QHBoxLayout()
@@ -207,10 +427,19 @@ class SettingsWidget(QWidget):
         language_service = get_language_service()
         supported_languages = language_service.get_supported_languages()
         
+        language_items = []
         for lang in supported_languages:
             info = language_service.get_language_info(lang)
             if info:
-                self.language_combo.addItem(f"{info['name']} ({lang})", lang)
+                language_items.append((f"{info['name']} ({lang})", lang))
+        
+        # 语言列表模型直接以 (显示文本, 语言代码) 列表为数据源，一次性设置给选择框
+        model = LazyListModel(language_items, self.language_combo)
+        
+        language_view = QListView()
+        language_view.setUniformItemSizes(True)
+        self.language_combo.setView(language_view)
+        self.language_combo.setModel(model)
         
         # 设置当前语言
         current_lang = language_service.get_current_language()
@@ -220,7 +449,12 @@ class SettingsWidget(QWidget):
         
         self.language_combo.currentIndexChanged.connect(self.on_language_changed)
         language_layout.addWidget(self.language_combo)
-        window_layout.addRow(tr("settings.language"), language_layout)
+        
+        # 窗口设置的标签没有冒号
+        add_form_rows(window_layout, [
+            ("settings.window_size", size_layout),
+            ("settings.language", language_layout),
+        ], label_suffix="")
         
         layout.addWidget(window_group)
         
@@ -230,29 +464,24 @@ class SettingsWidget(QWidget):
         # 加载当前设置
         self.load_ui_settings()
         
-        self.tab_widget.addTab(widget, tr("settings.title"))
+        return widget
     
     def create_theme_buttons(self):
         """创建主题选择按钮"""
         try:
-            # 获取可用主题
-            available_themes = theme_config_service.get_available_themes()
-            
             # 主题按钮映射
             self.theme_buttons = {}
             
-            for theme_id in available_themes:
-                theme_info = theme_config_service.get_theme_info(theme_id)
-                if theme_info:
-                    btn = QPushButton(theme_info['name'])
-                    btn.setCheckable(True)
-                    btn.clicked.connect(lambda checked, tid=theme_id: self.select_theme(tid))
-                    
-                    # 设置按钮样式
-                    self.set_theme_button_style(btn, theme_id)
-                    
-                    self.theme_buttons[theme_id] = btn
-                    self.theme_grid_layout.addWidget(btn)
+            for theme_id, theme_info in get_preset_themes():
+                btn = QPushButton(theme_info['name'])
+                btn.setCheckable(True)
+                btn.clicked.connect(lambda checked, tid=theme_id: self.select_theme(tid))
+                
+                # 设置按钮样式
+                self.set_theme_button_style(btn, theme_id)
+                
+                self.theme_buttons[theme_id] = btn
+                self.theme_grid_layout.addWidget(btn)
             
             # 添加自定义主题按钮
             custom_btn = QPushButton(tr("settings.custom"))
@@ -267,33 +496,9 @@ class SettingsWidget(QWidget):
     def set_theme_button_style(self, button, theme_id):
         """设置主题按钮样式"""
         try:
-            theme_config = theme_config_service.get_preset_theme_config(theme_id)
-            if theme_config and 'colors' in theme_config:
-                colors = theme_config['colors']
-                primary_color = colors.get('primary', '#0078d4')
-                background_color = colors.get('background', '#ffffff')
-                text_color = colors.get('text', '#000000')
-                
-                style = f"""
-                QPushButton {{
-                    background-color: {background_color};
-                    color: {text_color};
-                    border: 2px solid {primary_color};
-                    border-radius: 5px;
-                    padding: 8px 12px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: {primary_color};
-                    color: {background_color};
-                }}
-                QPushButton:checked {{
-                    background-color: {primary_color};
-                    color: {background_color};
-                    border: 2px solid {text_color};
-                }}
-                """
-                button.setStyleSheet(style)
+            colors = get_preset_theme_colors(theme_id)
+            if colors:
+                apply_style_sheet(button, THEME_BUTTON_QSS.format_map(colors))
                 
         except Exception as e:
             self.logger.error(f"设置主题按钮样式失败: {e}")
@@ -345,8 +550,8 @@ class SettingsWidget(QWidget):
         """设置主题相关信号连接"""
         try:
             # 字体设置变化
-            self.font_size_combo.currentTextChanged.connect(self.update_font_preview)
-            self.font_weight_combo.currentTextChanged.connect(self.update_font_preview)
+            self.font_size_combo.currentIndexChanged.connect(self.update_font_preview)
+            self.font_weight_combo.currentIndexChanged.connect(self.update_font_preview)
             
         except Exception as e:
             self.logger.error(f"设置主题连接失败: {e}")
@@ -354,13 +559,19 @@ class SettingsWidget(QWidget):
     def select_theme(self, theme_id):
         """选择主题"""
         try:
-            # 更新按钮状态
+            # 更新按钮状态（只改变状态不同的按钮）
             for tid, btn in self.theme_buttons.items():
-                btn.setChecked(tid == theme_id)
+                checked = tid == theme_id
+                if btn.isChecked() != checked:
+                    btn.setChecked(checked)
             
             # 应用主题
             if theme_id == 'custom':
+                self.current_preview_theme = None
                 self.show_custom_theme_options()
+            elif theme_id == self.current_preview_theme:
+                # 再次点击已应用的主题时无需重新应用和预览
+                return
             else:
                 self.apply_preset_theme(theme_id)
                 self.update_theme_preview(theme_id)
@@ -377,6 +588,7 @@ class SettingsWidget(QWidget):
             if success:
                 # 通过主题服务应用样式
                 theme_service.apply_theme(theme_id)
+                self.current_preview_theme = theme_id
                 self.logger.info(f"已应用预设主题: {theme_id}")
             else:
                 QMessageBox.warning(self, "警告", f"应用主题失败: {theme_id}")
@@ -388,9 +600,8 @@ class SettingsWidget(QWidget):
     def update_theme_preview(self, theme_id):
         """更新主题预览"""
         try:
-            theme_config = theme_config_service.get_preset_theme_config(theme_id)
-            if theme_config and 'colors' in theme_config:
-                colors = theme_config['colors']
+            colors = get_preset_theme_colors(theme_id)
+            if colors:
                 self.apply_preview_styles(colors)
                 
         except Exception as e:
@@ -399,45 +610,13 @@ class SettingsWidget(QWidget):
     def apply_preview_styles(self, colors):
         """应用预览样式"""
         try:
-            primary_color = colors.get('primary', '#0078d4')
-            background_color = colors.get('background', '#ffffff')
-            text_color = colors.get('text', '#000000')
-            
-            # 更新预览框架样式
-            self.preview_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {background_color};
-                    border: 1px solid {primary_color};
-                    border-radius: 5px;
-                }}
-            """)
-            
-            # 更新预览按钮样式
-            self.preview_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {primary_color};
-                    color: {background_color};
-                    border: 1px solid {primary_color};
-                    border-radius: 3px;
-                }}
-            """)
-            
-            # 更新预览输入框样式
-            self.preview_edit.setStyleSheet(f"""
-                QLineEdit {{
-                    background-color: {background_color};
-                    color: {text_color};
-                    border: 1px solid {primary_color};
-                    border-radius: 3px;
-                }}
-            """)
+            colors = get_theme_colors(colors)
             
-            # 更新预览标签样式
-            self.preview_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {text_color};
-                }}
-            """)
+            # 更新预览框架、按钮、输入框和标签样式
+            apply_style_sheet(self.preview_frame, PREVIEW_FRAME_QSS.format_map(colors))
+            apply_style_sheet(self.preview_button, PREVIEW_BUTTON_QSS.format_map(colors))
+            apply_style_sheet(self.preview_edit, PREVIEW_EDIT_QSS.format_map(colors))
+            apply_style_sheet(self.preview_label, PREVIEW_LABEL_QSS.format_map(colors))
             
         except Exception as e:
             self.logger.error(f"应用预览样式失败: {e}")
@@ -445,45 +624,43 @@ class SettingsWidget(QWidget):
     def choose_color(self, color_type):
         """选择颜色"""
         try:
-            color = QColorDialog.getColor()
-            if color.isValid():
-                color_hex = color.name()
+            # 颜色对话框只创建一次，各颜色按钮共用
+            if self.color_dialog is None:
+                self.color_dialog = QColorDialog(self)
+                self.color_dialog.setOption(QColorDialog.ColorDialogOption.DontUseNativeDialog, True)
+                self.color_dialog.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel, False)
+            
+            # 每次都重设初始颜色，避免沿用其他按钮上次选择的颜色（标签文字默认同文字颜色）
+            default_color = DEFAULT_THEME_COLORS.get(color_type, DEFAULT_THEME_COLORS["text"])
+            self.color_dialog.setCurrentColor(QColor(self.custom_colors.get(color_type, default_color)))
+            
+            if self.color_dialog.exec() == QDialog.DialogCode.Accepted:
+                color_hex = self.color_dialog.selectedColor().name()
                 
                 # 更新按钮文本显示颜色
-                if color_type == "primary":
-                    self.primary_color_btn.setText(f"{tr('settings.colors.primary')} #{color_hex}")
-                    self.primary_color_btn.setStyleSheet(f"background-color: {color_hex}; color: white;")
-                elif color_type == "background":
-                    self.background_color_btn.setText(f"{tr('settings.colors.background')} #{color_hex}")
-                    self.background_color_btn.setStyleSheet(f"background-color: {color_hex}; color: white;")
-                elif color_type == "text":
-                    self.text_color_btn.setText(f"{tr('settings.colors.text')} #{color_hex}")
-                    self.text_color_btn.setStyleSheet(f"background-color: {color_hex}; color: white;")
-                elif color_type == "tab_text":
-                    self.tab_color_btn.setText(f"{tr('settings.colors.tab_text')} #{color_hex}")
-                    self.tab_color_btn.setStyleSheet(f"background-color: {color_hex}; color: white;")
+                self.set_color_button(color_type, color_hex)
                 
                 # 存储颜色值
-                if not hasattr(self, 'custom_colors'):
-                    self.custom_colors = {}
                 self.custom_colors[color_type] = color_hex
                 
         except Exception as e:
             self.logger.error(f"选择颜色失败: {e}")
     
+    def set_color_button(self, color_type: str, color_hex: str):
+        """按颜色值更新颜色按钮的文本和样式"""
+        button = self.color_buttons[color_type]
+        button.setText(f"{self.color_labels[color_type]} #{color_hex}")
+        apply_style_sheet(button, COLOR_BUTTON_QSS.format(color=color_hex))
+    
     def apply_custom_theme(self):
         """应用自定义主题"""
         try:
-            if not hasattr(self, 'custom_colors'):
+            if not self.custom_colors:
                 QMessageBox.warning(self, tr("settings.messages.warning"), tr("settings.messages.warning"))
                 return
             
             # 获取字体设置
-            font_size_map = {tr("settings.fonts.small"): "small", tr("settings.fonts.medium"): "medium", tr("settings.fonts.large"): "large"}
-            font_weight_map = {tr("settings.fonts.normal"): "normal", tr("settings.fonts.bold"): "bold"}
-            
-            font_size = font_size_map.get(self.font_size_combo.currentText(), "medium")
-            font_weight = font_weight_map.get(self.font_weight_combo.currentText(), "normal")
+            font_size, font_weight = self.get_font_options()
             
             # 创建自定义主题配置
             custom_config = {
@@ -517,36 +694,25 @@ class SettingsWidget(QWidget):
             QMessageBox.critical(self, tr("settings.messages.error"), tr("settings.messages.error"))
     
     def save_font_settings_to_ui_config(self, font_size: str, font_weight: str):
-        """保存字体设置到UI配置文件"""
+        """保存字体设置到UI配置文件（文件读写在线程池中执行）"""
         try:
-            import json
-            import os
-            
-            # 字体大小映射 - 增加差异使其更明显
-            font_size_map = {'small': 9, 'medium': 12, 'large': 16}
-            actual_font_size = font_size_map.get(font_size, 12)
-            
-            # UI配置文件路径
-            ui_config_file = "configs/app/ui.json"
-            
-            # 确保目录存在
-            os.makedirs(os.path.dirname(ui_config_file), exist_ok=True)
-            
-            # 读取现有配置
-            config = {}
-            if os.path.exists(ui_config_file):
-                with open(ui_config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            
-            # 更新字体设置
-            config['font_size'] = actual_font_size
-            config['font_family'] = "Microsoft YaHei"  # 默认字体族
-            
-            # 保存配置
-            with open(ui_config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            actual_font_size = FONT_POINT_SIZES.get(font_size, 12)
+            updates = {
+                'font_size': actual_font_size,
+                'font_family': "Microsoft YaHei",  # 默认字体族
+            }
             
-            self.logger.info(f"已保存字体设置到UI配置: 大小={actual_font_size}, 粗细={font_weight}")
+            self.ui_config_save_task = UIConfigSaveTask(UI_CONFIG_FILE, updates)
+            self.ui_config_save_task.signals.saved.connect(
+                lambda saved, written: self.logger.info(
+                    f"已保存字体设置到UI配置: 大小={saved['font_size']}, 粗细={font_weight}" if written
+                    else "字体设置未改变，跳过写入UI配置"
+                )
+            )
+            self.ui_config_save_task.signals.failed.connect(
+                lambda error: self.logger.error(f"保存字体设置到UI配置失败: {error}")
+            )
+            QThreadPool.globalInstance().start(self.ui_config_save_task)
             
         except Exception as e:
             self.logger.error(f"保存字体设置到UI配置失败: {e}")
@@ -561,20 +727,29 @@ class SettingsWidget(QWidget):
         except Exception as e:
             self.logger.error(f"显示自定义主题选项失败: {e}")
     
-    def update_font_preview(self):
+    def get_font_options(self) -> tuple:
+        """按下拉框下标获取当前字体大小和粗细的配置值"""
+        size_index = self.font_size_combo.currentIndex()
+        weight_index = self.font_weight_combo.currentIndex()
+        font_size = FONT_SIZE_OPTIONS[size_index] if size_index >= 0 else "medium"
+        font_weight = FONT_WEIGHT_OPTIONS[weight_index] if weight_index >= 0 else "normal"
+        return font_size, font_weight
+    
+    def update_font_preview(self, index: int = -1):
         """更新字体预览"""
         try:
             # 获取当前字体设置
-            font_size_map = {tr("settings.fonts.small"): 9, tr("settings.fonts.medium"): 12, tr("settings.fonts.large"): 16}
-            font_weight_map = {tr("settings.fonts.normal"): "normal", tr("settings.fonts.bold"): "bold"}
-            
-            size = font_size_map.get(self.font_size_combo.currentText(), 12)
-            weight = font_weight_map.get(self.font_weight_combo.currentText(), "normal")
-            
-            # 更新预览组件字体
-            font = QFont()
-            font.setPointSize(size)
-            font.setBold(weight == "bold")
+            font_size, weight = self.get_font_options()
+            size = FONT_POINT_SIZES[font_size]
+            
+            # 更新预览组件字体（同一组合只创建一次）
+            key = (size, weight == "bold")
+            font = self.preview_fonts.get(key)
+            if font is None:
+                font = QFont()
+                font.setPointSize(size)
+                font.setBold(key[1])
+                self.preview_fonts[key] = font
             
             self.preview_button.setFont(font)
             self.preview_edit.setFont(font)
@@ -603,14 +778,18 @@ class SettingsWidget(QWidget):
                 # 加载自定义字体
                 fonts = custom_config.get('fonts', {})
                 if fonts:
-                    font_size_map = {"small": tr("settings.fonts.small"), "medium": tr("settings.fonts.medium"), "large": tr("settings.fonts.large")}
-                    font_weight_map = {"normal": tr("settings.fonts.normal"), "bold": tr("settings.fonts.bold")}
-                    
-                    size = font_size_map.get(fonts.get('size', 'medium'), tr("settings.fonts.medium"))
-                    weight = font_weight_map.get(fonts.get('weight', 'normal'), tr("settings.fonts.normal"))
+                    size = fonts.get('size', 'medium')
+                    weight = fonts.get('weight', 'normal')
+                    size_index = FONT_SIZE_OPTIONS.index(size if size in FONT_SIZE_OPTIONS else "medium")
+                    weight_index = FONT_WEIGHT_OPTIONS.index(weight if weight in FONT_WEIGHT_OPTIONS else "normal")
                     
-                    self.font_size_combo.setCurrentText(size)
-                    self.font_weight_combo.setCurrentText(weight)
+                    # 设置期间屏蔽信号，最后统一更新一次预览
+                    blockers = [QSignalBlocker(combo) for combo in (self.font_size_combo, self.font_weight_combo)]
+                    self.font_size_combo.setCurrentIndex(size_index)
+                    self.font_weight_combo.setCurrentIndex(weight_index)
+                    for blocker in blockers:
+                        blocker.unblock()
+                    self.update_font_preview()
             
         except Exception as e:
             self.logger.error(f"加载UI设置失败: {e}")
@@ -618,105 +797,62 @@ class SettingsWidget(QWidget):
     def update_custom_color_buttons(self):
         """更新自定义颜色按钮显示"""
         try:
-            if hasattr(self, 'custom_colors'):
-                colors = self.custom_colors
-                
-                if 'primary' in colors:
-                    self.primary_color_btn.setText(f"{tr('settings.colors.primary')} #{colors['primary']}")
-                    self.primary_color_btn.setStyleSheet(f"background-color: {colors['primary']}; color: white;")
-                
-                if 'background' in colors:
-                    self.background_color_btn.setText(f"{tr('settings.colors.background')} #{colors['background']}")
-                    self.background_color_btn.setStyleSheet(f"background-color: {colors['background']}; color: white;")
-                
-                if 'text' in colors:
-                    self.text_color_btn.setText(f"{tr('settings.colors.text')} #{colors['text']}")
-                    self.text_color_btn.setStyleSheet(f"background-color: {colors['text']}; color: white;")
-                
-                if 'tab_text' in colors:
-                    self.tab_color_btn.setText(f"{tr('settings.colors.tab_text')} #{colors['tab_text']}")
-                    self.tab_color_btn.setStyleSheet(f"background-color: {colors['tab_text']}; color: white;")
-                    
+            for color_type, color_hex in self.custom_colors.items():
+                if color_type in self.color_buttons:
+                    self.set_color_button(color_type, color_hex)
+            
         except Exception as e:
             self.logger.error(f"更新自定义颜色按钮失败: {e}")
     
     def on_language_changed(self, index):
-        """语言选择改变"""
+        """语言选择改变，请求切换界面语言"""
         try:
             # 获取选中的语言代码
             current_data = self.language_combo.currentData()
-            current_text = self.language_combo.currentText()
-            self.logger.info(f"语言选择改变 - 索引: {index}, 文本: {current_text}, 数据: {current_data}")
-            
             if current_data:
-                self.logger.info(f"开始语言切换: {current_data}")
-                language_service = get_language_service()
-                success = language_service.set_language(current_data)
-                if success:
-                    self.logger.info(f"语言切换成功: {current_data}")
-                    # 通知主窗口重新应用语言
-                    self.notify_main_window_language_changed(current_data)
-                    self.logger.info(f"语言切换完成: {current_data}")
-                else:
-                    self.logger.warning(f"语言切换失败: {current_data}")
+                self.pending_language = current_data
+                self.language_timer.start()
             else:
-                self.logger.warning(f"无法获取语言代码，索引: {index}, 文本: {current_text}")
+                self.logger.warning(f"无法获取语言代码，索引: {index}, 文本: {self.language_combo.currentText()}")
         except Exception as e:
             self.logger.error(f"语言切换失败: {e}")
     
-    def notify_main_window_language_changed(self, language):
-        """通知主窗口语言已改变"""
-        try:
-            self.logger.info(f"开始通知主窗口语言改变: {language}")
-            self.logger.info(f"主窗口引用存在: {self.main_window is not None}")
-            
-            if self.main_window and hasattr(self.main_window, 'apply_language'):
-                self.logger.info("使用主窗口引用通知语言改变")
-                # 更新主窗口的语言配置
-                if hasattr(self.main_window, 'app_config') and self.main_window.app_config:
-                    self.main_window.app_config.ui.language = language
-                
-                # 重新应用语言（这会重新创建菜单）
-                self.main_window.apply_language()
-                self.logger.info(f"已通知主窗口语言改变: {language}")
-            else:
-                # 如果主窗口引用不存在，尝试通过父窗口找到主窗口
-                parent = self.parent()
-                while parent and not hasattr(parent, 'apply_language'):
-                    parent = parent.parent()
-                
-                if parent and hasattr(parent, 'apply_language'):
-                    # 更新主窗口的语言配置
-                    if hasattr(parent, 'app_config') and parent.app_config:
-                        parent.app_config.ui.language = language
-                    
-                    # 重新应用语言（这会重新创建菜单）
-                    parent.apply_language()
-                    self.logger.info(f"已通过父窗口通知主窗口语言改变: {language}")
-                else:
-                    # 如果找不到主窗口，尝试通过全局方式通知
-                    self.logger.warning("未找到主窗口，尝试全局通知")
-                    self.notify_global_language_change(language)
-                
-        except Exception as e:
-            self.logger.error(f"通知主窗口语言改变失败: {e}")
+    def commit_language_change(self):
+        """合并间隔结束后请求切换到最后选择的语言"""
+        if self.pending_language:
+            self.logger.info(f"请求语言切换: {self.pending_language}")
+            self.language_change_requested.emit(self.pending_language)
+            self.pending_language = None
     
-    def notify_global_language_change(self, language):
-        """全局语言改变通知"""
+    def on_service_language_changed(self, language: str):
+        """界面语言已切换，更新本界面中随语言变化的选项文本"""
         try:
-            # 通过信号或其他方式通知全局语言改变
-            # 这里我们可以直接调用语言服务的全局更新
-            from services.language_service import get_language_service
-            language_service = get_language_service()
-            
-            # 触发语言改变信号
-            if hasattr(language_service, 'language_changed'):
-                language_service.language_changed.emit(language)
-            
-            self.logger.info(f"已发送全局语言改变通知: {language}")
-            
+            self.retranslate_font_options()
+            self.retranslate_color_buttons()
+            
+            # 语言由其他入口切换时同步选择框
+            index = self.language_combo.findData(language)
+            if index >= 0 and index != self.language_combo.currentIndex():
+                blocker = QSignalBlocker(self.language_combo)
+                self.language_combo.setCurrentIndex(index)
+                blocker.unblock()
         except Exception as e:
-            self.logger.error(f"全局语言改变通知失败: {e}")
+            self.logger.error(f"更新语言相关文本失败: {e}")
+    
+    def retranslate_font_options(self):
+        """按新语言原地更新字体下拉框文本（下标及其对应的配置值不变）"""
+        self.rebuild_font_labels()
+        for combo, labels in ((self.font_size_combo, self.font_size_labels),
+                              (self.font_weight_combo, self.font_weight_labels)):
+            for index, label in enumerate(labels):
+                combo.setItemText(index, label)
+    
+    def retranslate_color_buttons(self):
+        """重建颜色按钮文本，并按新语言更新按钮（已选颜色保留）"""
+        self.rebuild_color_labels()
+        for color_type, button in self.color_buttons.items():
+            button.setText(self.color_labels[color_type])
+        self.update_custom_color_buttons()
     
     def create_audio_tab(self):
         """创建音频设置标签页"""
@@ -732,19 +868,22 @@ class SettingsWidget(QWidget):
         # 默认格式
         self.audio_format_combo = QComboBox()
         self.audio_format_combo.addItems(["wav", "mp3", "ogg", "m4a"])
-        format_layout.addRow(tr("settings.default_format") + ":", self.audio_format_combo)
         
         # 采样率
         self.sample_rate_combo = QComboBox()
         self.sample_rate_combo.addItems(["8000", "16000", "22050", "44100", "48000"])
         self.sample_rate_combo.setCurrentText("44100")
-        format_layout.addRow(tr("settings.sample_rate") + ":", self.sample_rate_combo)
         
         # 比特率
         self.bitrate_spin = QSpinBox()
         self.bitrate_spin.setRange(64, 320)
         self.bitrate_spin.setValue(128)
-        format_layout.addRow(tr("settings.bitrate") + ":", self.bitrate_spin)
+        
+        add_form_rows(format_layout, [
+            ("settings.default_format", self.audio_format_combo),
+            ("settings.sample_rate", self.sample_rate_combo),
+            ("settings.bitrate", self.bitrate_spin),
+        ])
         
         layout.addWidget(format_group)
         
@@ -761,7 +900,6 @@ class SettingsWidget(QWidget):
         browse_output_button = QPushButton(tr("settings.browse"))
         browse_output_button.clicked.connect(self.browse_output_dir)
         output_layout.addWidget(browse_output_button)
-        file_layout.addRow(tr("settings.output_directory") + ":", output_layout)
         
         # 临时目录
         temp_layout = QHBoxLayout()
@@ -772,16 +910,20 @@ class SettingsWidget(QWidget):
         browse_temp_button = QPushButton(tr("settings.browse"))
         browse_temp_button.clicked.connect(self.browse_temp_dir)
         temp_layout.addWidget(browse_temp_button)
-        file_layout.addRow(tr("settings.temp_directory") + ":", temp_layout)
         
         # 自动清理临时文件
         self.auto_clean_checkbox = QCheckBox(tr("settings.auto_clean_temp_files"))
         self.auto_clean_checkbox.setChecked(True)
-        file_layout.addRow("", self.auto_clean_checkbox)
+        
+        add_form_rows(file_layout, [
+            ("settings.output_directory", output_layout),
+            ("settings.temp_directory", temp_layout),
+            (None, self.auto_clean_checkbox),
+        ])
         
         layout.addWidget(file_group)
         
-        self.tab_widget.addTab(widget, tr("settings.audio_settings"))
+        return widget
     
     def load_available_engines(self):
         """加载可用的TTS引擎"""
@@ -848,12 +990,15 @@ class SettingsWidget(QWidget):
         self.tts_engine_combo = QComboBox()
         self.load_available_engines()
         self.tts_engine_combo.currentTextChanged.connect(self.on_tts_engine_changed)
-        engine_layout.addRow(tr("settings.default_engine") + ":", self.tts_engine_combo)
         
         # 默认语音
         self.default_voice_edit = QLineEdit()
         self.default_voice_edit.setText("zh-CN-XiaoxiaoNeural")
-        engine_layout.addRow(tr("settings.default_voice") + ":", self.default_voice_edit)
+        
+        add_form_rows(engine_layout, [
+            ("settings.default_engine", self.tts_engine_combo),
+            ("settings.default_voice", self.default_voice_edit),
+        ])
         
         layout.addWidget(engine_group)
         
@@ -865,23 +1010,26 @@ class SettingsWidget(QWidget):
         self.default_rate_spin = QSpinBox()
         self.default_rate_spin.setRange(10, 300)
         self.default_rate_spin.setValue(100)
-        params_layout.addRow(tr("settings.default_rate") + ":", self.default_rate_spin)
         
         # 默认音调
         self.default_pitch_spin = QSpinBox()
         self.default_pitch_spin.setRange(-50, 50)
         self.default_pitch_spin.setValue(0)
-        params_layout.addRow(tr("settings.default_pitch") + ":", self.default_pitch_spin)
         
         # 默认音量
         self.default_volume_spin = QSpinBox()
         self.default_volume_spin.setRange(0, 100)
         self.default_volume_spin.setValue(100)
-        params_layout.addRow(tr("settings.default_volume") + ":", self.default_volume_spin)
+        
+        add_form_rows(params_layout, [
+            ("settings.default_rate", self.default_rate_spin),
+            ("settings.default_pitch", self.default_pitch_spin),
+            ("settings.default_volume", self.default_volume_spin),
+        ])
         
         layout.addWidget(params_group)
         
-        self.tab_widget.addTab(widget, tr("settings.tts_settings"))
+        return widget
     
     def create_advanced_tab(self):
         """创建高级设置标签页"""
@@ -898,17 +1046,20 @@ class SettingsWidget(QWidget):
         self.max_tasks_spin = QSpinBox()
         self.max_tasks_spin.setRange(1, 10)
         self.max_tasks_spin.setValue(2)
-        performance_layout.addRow(tr("settings.max_concurrent_tasks") + ":", self.max_tasks_spin)
         
         # 内存限制
         self.memory_limit_spin = QSpinBox()
         self.memory_limit_spin.setRange(256, 8192)
         self.memory_limit_spin.setValue(1024)
-        performance_layout.addRow(tr("settings.memory_limit") + ":", self.memory_limit_spin)
         
         # 硬件加速
         self.hardware_accel_checkbox = QCheckBox(tr("settings.enable_hardware_acceleration"))
-        performance_layout.addRow("", self.hardware_accel_checkbox)
+        
+        add_form_rows(performance_layout, [
+            ("settings.max_concurrent_tasks", self.max_tasks_spin),
+            ("settings.memory_limit", self.memory_limit_spin),
+            (None, self.hardware_accel_checkbox),
+        ])
         
         layout.addWidget(performance_group)
         
@@ -918,13 +1069,16 @@ class SettingsWidget(QWidget):
         
         # 调试模式
         self.debug_mode_checkbox = QCheckBox(tr("settings.debug_mode"))
-        debug_layout.addRow("", self.debug_mode_checkbox)
         
         # 日志级别
         self.log_level_combo = QComboBox()
         self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
         self.log_level_combo.setCurrentText("INFO")
-        debug_layout.addRow(tr("settings.log_level") + ":", self.log_level_combo)
+        
+        add_form_rows(debug_layout, [
+            (None, self.debug_mode_checkbox),
+            ("settings.log_level", self.log_level_combo),
+        ])
         
         layout.addWidget(debug_group)
         
@@ -936,18 +1090,21 @@ class SettingsWidget(QWidget):
         self.max_text_length_spin = QSpinBox()
         self.max_text_length_spin.setRange(1000, 10000000)
         self.max_text_length_spin.setValue(1000000)
-        text_layout.addRow(tr("settings.max_text_length") + ":", self.max_text_length_spin)
         
         # 自动分割长度
         self.auto_split_length_spin = QSpinBox()
         self.auto_split_length_spin.setRange(500, 10000)
         self.auto_split_length_spin.setValue(2000)
-        text_layout.addRow(tr("settings.auto_split_length") + ":", self.auto_split_length_spin)
         
         # 自动检测章节
         self.auto_detect_chapters_checkbox = QCheckBox(tr("settings.auto_detect_chapters"))
         self.auto_detect_chapters_checkbox.setChecked(True)
-        text_layout.addRow("", self.auto_detect_chapters_checkbox)
+        
+        add_form_rows(text_layout, [
+            ("settings.max_text_length", self.max_text_length_spin),
+            ("settings.auto_split_length", self.auto_split_length_spin),
+            (None, self.auto_detect_chapters_checkbox),
+        ])
         
         layout.addWidget(text_group)
         
@@ -987,11 +1144,12 @@ class SettingsWidget(QWidget):
         
         layout.addWidget(chapter_group)
         
-        self.tab_widget.addTab(widget, tr("settings.advanced_settings"))
+        return widget
     
     def setup_connections(self):
         """设置信号槽连接"""
-        # 语言改变时立即应用（已在create_ui_tab中连接）
+        # 语言选择框已在create_ui_tab中连接；语言切换完成后更新本界面的选项文本
+        get_language_service().language_changed.connect(self.on_service_language_changed)
     
     def load_settings(self):
         """加载设置"""
@@ -1008,135 +1166,151 @@ class SettingsWidget(QWidget):
             QMessageBox.critical(self, tr("settings.messages.error"), tr("settings.messages.load_settings_failed", error=str(e)))
     
     def update_ui_from_config(self):
-        """从配置更新UI"""
+        """从配置更新UI（只更新已创建的标签页）"""
         try:
             if not self.current_config:
                 return
             
-            # 界面设置
-            # 主题设置通过新的主题配置服务处理
-            current_theme = theme_config_service.get_current_theme()
-            if hasattr(self, 'theme_buttons') and current_theme in self.theme_buttons:
-                self.theme_buttons[current_theme].setChecked(True)
-            
-            # 设置语言选择框（使用语言代码）
-            if hasattr(self.current_config, 'language') and self.current_config.language:
-                # 如果配置中的语言是显示名称格式，提取语言代码
-                config_language = self.current_config.language
-                
-                # 确保 config_language 是字符串类型
-                if isinstance(config_language, int):
-                    # 如果是整数，使用默认语言
-                    config_language = "zh-CN"
-                    self.logger.warning(f"配置中的语言是整数类型: {self.current_config.language}，使用默认语言: zh-CN")
-                elif isinstance(config_language, str):
-                    # 提取语言代码（如 "简体中文 (zh-CN)" -> "zh-CN"）
-                    if "(" in config_language and ")" in config_language:
-                        config_language = config_language.split("(")[-1].split(")")[0]
-                else:
-                    # 其他类型，使用默认语言
-                    config_language = "zh-CN"
-                    self.logger.warning(f"配置中的语言类型不支持: {type(config_language)}，使用默认语言: zh-CN")
-                
-                # 找到对应的索引
-                current_index = self.language_combo.findData(config_language)
-                if current_index >= 0:
-                    self.language_combo.setCurrentIndex(current_index)
-            self.window_width_spin.setValue(self.current_config.window_width)
-            self.window_height_spin.setValue(self.current_config.window_height)
-            # 窗口位置设置已移除，不再需要设置
-            
-            # 音频设置
-            self.audio_format_combo.setCurrentText(self.current_config.default_audio_format)
-            self.sample_rate_combo.setCurrentText(str(self.current_config.default_sample_rate))
-            self.bitrate_spin.setValue(self.current_config.default_bitrate)
-            self.output_dir_edit.setText(self.current_config.default_output_dir)
-            self.temp_dir_edit.setText(self.current_config.temp_dir)
-            self.auto_clean_checkbox.setChecked(self.current_config.auto_clean_temp)
-            
-            # TTS设置
-            # 临时断开信号连接，避免在加载时触发保存
-            self.tts_engine_combo.currentTextChanged.disconnect()
-            self.tts_engine_combo.setCurrentText(self.current_config.default_tts_engine)
-            # 根据引擎设置默认语音
-            clean_engine = self.current_config.default_tts_engine.replace(" ✓", "").replace(" ✗", "")
-            default_voice = self._get_default_voice_for_engine(clean_engine)
-            self.default_voice_edit.setText(default_voice)
-            # 重新连接信号
-            self.tts_engine_combo.currentTextChanged.connect(self.on_tts_engine_changed)
-            self.default_rate_spin.setValue(int(self.current_config.default_rate * 100))
-            self.default_pitch_spin.setValue(int(self.current_config.default_pitch))
-            self.default_volume_spin.setValue(int(self.current_config.default_volume * 100))
-            
-            # 高级设置
-            self.max_tasks_spin.setValue(self.current_config.max_concurrent_tasks)
-            self.memory_limit_spin.setValue(self.current_config.memory_limit_mb)
-            self.hardware_accel_checkbox.setChecked(self.current_config.enable_hardware_acceleration)
-            self.debug_mode_checkbox.setChecked(self.current_config.debug_mode)
-            self.log_level_combo.setCurrentText(self.current_config.log_level)
-            self.max_text_length_spin.setValue(self.current_config.max_text_length)
-            self.auto_split_length_spin.setValue(self.current_config.auto_split_length)
-            self.auto_detect_chapters_checkbox.setChecked(self.current_config.auto_detect_chapters)
+            for key in self.built_tabs:
+                self.tab_config_loaders[key]()
             
         except Exception as e:
             self.logger.error(f"更新UI失败: {e}")
     
+    def update_ui_tab_from_config(self):
+        """从配置更新界面设置标签页"""
+        # 主题设置通过新的主题配置服务处理
+        current_theme = theme_config_service.get_current_theme()
+        if current_theme in self.theme_buttons:
+            self.theme_buttons[current_theme].setChecked(True)
+        
+        # 设置语言选择框（使用语言代码）
+        if hasattr(self.current_config, 'language') and self.current_config.language:
+            # 如果配置中的语言是显示名称格式，提取语言代码
+            config_language = self.current_config.language
+            
+            # 确保 config_language 是字符串类型
+            if isinstance(config_language, int):
+                # 如果是整数，使用默认语言
+                config_language = "zh-CN"
+                self.logger.warning(f"配置中的语言是整数类型: {self.current_config.language}，使用默认语言: zh-CN")
+            elif isinstance(config_language, str):
+                # 提取语言代码（如 "简体中文 (zh-CN)" -> "zh-CN"）
+                if "(" in config_language and ")" in config_language:
+                    config_language = config_language.split("(")[-1].split(")")[0]
+            else:
+                # 其他类型，使用默认语言
+                config_language = "zh-CN"
+                self.logger.warning(f"配置中的语言类型不支持: {type(config_language)}，使用默认语言: zh-CN")
+            
+            # 找到对应的索引（只同步选择框，不触发语言切换）
+            current_index = self.language_combo.findData(config_language)
+            if current_index >= 0:
+                blocker = QSignalBlocker(self.language_combo)
+                self.language_combo.setCurrentIndex(current_index)
+                blocker.unblock()
+        self.window_width_spin.setValue(self.current_config.window_width)
+        self.window_height_spin.setValue(self.current_config.window_height)
+        # 窗口位置设置已移除，不再需要设置
+    
+    def update_audio_tab_from_config(self):
+        """从配置更新音频设置标签页"""
+        self.audio_format_combo.setCurrentText(self.current_config.default_audio_format)
+        self.sample_rate_combo.setCurrentText(str(self.current_config.default_sample_rate))
+        self.bitrate_spin.setValue(self.current_config.default_bitrate)
+        self.output_dir_edit.setText(self.current_config.default_output_dir)
+        self.temp_dir_edit.setText(self.current_config.temp_dir)
+        self.auto_clean_checkbox.setChecked(self.current_config.auto_clean_temp)
+    
+    def update_tts_tab_from_config(self):
+        """从配置更新TTS设置标签页"""
+        # 临时断开信号连接，避免在加载时触发保存
+        self.tts_engine_combo.currentTextChanged.disconnect()
+        self.tts_engine_combo.setCurrentText(self.current_config.default_tts_engine)
+        # 根据引擎设置默认语音
+        clean_engine = self.current_config.default_tts_engine.replace(" ✓", "").replace(" ✗", "")
+        default_voice = self._get_default_voice_for_engine(clean_engine)
+        self.default_voice_edit.setText(default_voice)
+        # 重新连接信号
+        self.tts_engine_combo.currentTextChanged.connect(self.on_tts_engine_changed)
+        self.default_rate_spin.setValue(int(self.current_config.default_rate * 100))
+        self.default_pitch_spin.setValue(int(self.current_config.default_pitch))
+        self.default_volume_spin.setValue(int(self.current_config.default_volume * 100))
+    
+    def update_advanced_tab_from_config(self):
+        """从配置更新高级设置标签页"""
+        self.max_tasks_spin.setValue(self.current_config.max_concurrent_tasks)
+        self.memory_limit_spin.setValue(self.current_config.memory_limit_mb)
+        self.hardware_accel_checkbox.setChecked(self.current_config.enable_hardware_acceleration)
+        self.debug_mode_checkbox.setChecked(self.current_config.debug_mode)
+        self.log_level_combo.setCurrentText(self.current_config.log_level)
+        self.max_text_length_spin.setValue(self.current_config.max_text_length)
+        self.auto_split_length_spin.setValue(self.current_config.auto_split_length)
+        self.auto_detect_chapters_checkbox.setChecked(self.current_config.auto_detect_chapters)
+    
     def update_config_from_ui(self):
-        """从UI更新配置"""
+        """从UI更新配置（未创建的标签页保持配置原值）"""
         try:
             if not self.current_config:
                 return
             
-            # 界面设置
             # 主题设置通过新的主题配置服务处理
             current_theme = theme_config_service.get_current_theme()
             self.current_config.theme = current_theme
             
-            # 获取当前选中的语言代码
-            current_data = self.language_combo.currentData()
-            if current_data:
-                # 获取语言显示名称
-                language_service = get_language_service()
-                lang_info = language_service.language_config.get("language_info", {}).get(current_data, {})
-                lang_name = lang_info.get("name", current_data)
-                language_display = f"{lang_name} ({current_data})"
-                self.current_config.language = language_display
-            else:
-                self.current_config.language = "简体中文 (zh-CN)"
-            self.current_config.window_width = self.window_width_spin.value()
-            self.current_config.window_height = self.window_height_spin.value()
-            # 窗口位置设置已移除，使用默认值
-            self.current_config.window_x = 100
-            self.current_config.window_y = 100
-            
-            # 音频设置
-            self.current_config.default_audio_format = self.audio_format_combo.currentText()
-            self.current_config.default_sample_rate = int(self.sample_rate_combo.currentText())
-            self.current_config.default_bitrate = self.bitrate_spin.value()
-            self.current_config.default_output_dir = self.output_dir_edit.text()
-            self.current_config.temp_dir = self.temp_dir_edit.text()
-            self.current_config.auto_clean_temp = self.auto_clean_checkbox.isChecked()
-            
-            # TTS设置
-            self.current_config.default_tts_engine = self.tts_engine_combo.currentText()
-            self.current_config.default_voice = self.default_voice_edit.text()
-            self.current_config.default_rate = self.default_rate_spin.value() / 100.0
-            self.current_config.default_pitch = self.default_pitch_spin.value()
-            self.current_config.default_volume = self.default_volume_spin.value() / 100.0
-            
-            # 高级设置
-            self.current_config.max_concurrent_tasks = self.max_tasks_spin.value()
-            self.current_config.memory_limit_mb = self.memory_limit_spin.value()
-            self.current_config.enable_hardware_acceleration = self.hardware_accel_checkbox.isChecked()
-            self.current_config.debug_mode = self.debug_mode_checkbox.isChecked()
-            self.current_config.log_level = self.log_level_combo.currentText()
-            self.current_config.max_text_length = self.max_text_length_spin.value()
-            self.current_config.auto_split_length = self.auto_split_length_spin.value()
-            self.current_config.auto_detect_chapters = self.auto_detect_chapters_checkbox.isChecked()
+            for key in self.built_tabs:
+                self.tab_config_collectors[key]()
             
         except Exception as e:
             self.logger.error(f"更新配置失败: {e}")
     
+    def update_config_from_ui_tab(self):
+        """从界面设置标签页更新配置"""
+        # 获取当前选中的语言代码
+        current_data = self.language_combo.currentData()
+        if current_data:
+            # 获取语言显示名称
+            language_service = get_language_service()
+            lang_info = language_service.language_config.get("language_info", {}).get(current_data, {})
+            lang_name = lang_info.get("name", current_data)
+            language_display = f"{lang_name} ({current_data})"
+            self.current_config.language = language_display
+        else:
+            self.current_config.language = "简体中文 (zh-CN)"
+        self.current_config.window_width = self.window_width_spin.value()
+        self.current_config.window_height = self.window_height_spin.value()
+        # 窗口位置设置已移除，使用默认值
+        self.current_config.window_x = 100
+        self.current_config.window_y = 100
+    
+    def update_config_from_audio_tab(self):
+        """从音频设置标签页更新配置"""
+        self.current_config.default_audio_format = self.audio_format_combo.currentText()
+        self.current_config.default_sample_rate = int(self.sample_rate_combo.currentText())
+        self.current_config.default_bitrate = self.bitrate_spin.value()
+        self.current_config.default_output_dir = self.output_dir_edit.text()
+        self.current_config.temp_dir = self.temp_dir_edit.text()
+        self.current_config.auto_clean_temp = self.auto_clean_checkbox.isChecked()
+    
+    def update_config_from_tts_tab(self):
+        """从TTS设置标签页更新配置"""
+        self.current_config.default_tts_engine = self.tts_engine_combo.currentText()
+        self.current_config.default_voice = self.default_voice_edit.text()
+        self.current_config.default_rate = self.default_rate_spin.value() / 100.0
+        self.current_config.default_pitch = self.default_pitch_spin.value()
+        self.current_config.default_volume = self.default_volume_spin.value() / 100.0
+    
+    def update_config_from_advanced_tab(self):
+        """从高级设置标签页更新配置"""
+        self.current_config.max_concurrent_tasks = self.max_tasks_spin.value()
+        self.current_config.memory_limit_mb = self.memory_limit_spin.value()
+        self.current_config.enable_hardware_acceleration = self.hardware_accel_checkbox.isChecked()
+        self.current_config.debug_mode = self.debug_mode_checkbox.isChecked()
+        self.current_config.log_level = self.log_level_combo.currentText()
+        self.current_config.max_text_length = self.max_text_length_spin.value()
+        self.current_config.auto_split_length = self.auto_split_length_spin.value()
+        self.current_config.auto_detect_chapters = self.auto_detect_chapters_checkbox.isChecked()
+    
     def browse_output_dir(self):
         """浏览输出目录"""
         try:
@@ -1254,27 +1428,6 @@ class SettingsWidget(QWidget):
         except Exception as e:
             self.logger.error(f"主题改变处理失败: {e}")
     
-    def on_language_changed(self, language: str):
-        """语言改变事件"""
-        try:
-            if not self.current_config:
-                return
-            
-            # 更新配置
-            self.current_config.language = language
-            
-            # 立即保存配置
-            self.settings_controller.save_settings(self.current_config)
-            
-            # 应用语言（这会自动同步到主配置文件）
-            from services.language_service import get_language_service
-            get_language_service().set_language(language)
-            
-            self.logger.info(f"语言已更改为: {language}")
-            
-        except Exception as e:
-            self.logger.error(f"语言改变处理失败: {e}")
-    
     def on_tts_engine_changed(self, engine: str):
         """TTS引擎改变事件"""
         try:
@@ -1671,9 +1671,9 @@ class TextProcessorWidget(QWidget):
     def _try_load_initial_configs(self):
         """尝试加载初始配置"""
         try:
-            # 尝试从配置服务加载输出配置
+            # 尝试从共享配置服务加载输出配置（配置文件只读取一次）
             from services.json_config_service import JsonConfigService
-            config_service = JsonConfigService()
+            config_service = JsonConfigService.instance()
             
             # 加载输出配置
             output_config = config_service.load_output_config()
@@ -0,0 +1,51 @@
+"""
+图标工具模块
+提供进程内共享的图标缓存，同一个SVG只加载和光栅化一次
+"""
+
+from typing import Iterable
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QIcon
+
+
+# 图标资源目录
+ICON_DIR = "resources/icons"
+
+# 图标缓存：文件名 -> QIcon
+_icon_cache = {}
+
+
+def get_icon(name: str) -> QIcon:
+    """
+    获取共享图标
+
+    首次请求时从图标目录加载，之后所有调用方共用同一个QIcon实例，
+    从而共享其内部的像素图缓存。
+
+    Args:
+        name: 图标文件名，例如 "upload.svg"
+
+    Returns:
+        QIcon: 共享的图标实例
+    """
+    icon = _icon_cache.get(name)
+    if icon is None:
+        icon = QIcon(f"{ICON_DIR}/{name}")
+        _icon_cache[name] = icon
+    return icon
+
+
+def prewarm_icons(names: Iterable[str], size: QSize):
+    """
+    预先按指定尺寸渲染共享图标
+
+    SVG图标在第一次绘制时才会光栅化；启动时提前渲染一次，
+    渲染结果保存在共享QIcon的像素图缓存中，之后显示时直接复用。
+
+    Args:
+        names: 图标文件名列表
+        size: 渲染尺寸，通常为工具栏的图标尺寸
+    """
+    for name in names:
+        get_icon(name).pixmap(size)
@@ -0,0 +1,65 @@
+"""
+界面配置文件工具模块
+读写 configs/app/ui.json（字体等界面设置），进程内共享一份按文件修改时间失效的缓存
+"""
+
+import json
+import os
+import threading
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# 界面配置文件（字体设置）
+UI_CONFIG_FILE = "configs/app/ui.json"
+
+# 界面配置读写锁：读取-合并-写回需要整体持有，因此使用可重入锁
+ui_config_lock = threading.RLock()
+
+# 界面配置缓存：路径 -> ((修改时间, 大小), 配置)，只在 ui_config_lock 内访问
+_ui_config_cache = {}
+
+
+def read_ui_config(path: str = UI_CONFIG_FILE) -> dict:
+    """
+    读取界面配置
+
+    文件未被改动时直接返回内存中的配置（调用方不要修改返回的字典），
+    文件不存在时返回空字典。可用时使用 orjson 解析。
+    """
+    with ui_config_lock:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return {}
+
+        source_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _ui_config_cache.get(path)
+        if cached and cached[0] == source_key:
+            return cached[1]
+
+        if ORJSON_AVAILABLE:
+            with open(path, 'rb') as f:
+                config = orjson.loads(f.read())
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        _ui_config_cache[path] = (source_key, config)
+        return config
+
+
+def write_ui_config(config: dict, path: str = UI_CONFIG_FILE):
+    """写入界面配置：先写临时文件再整体替换，写入中断时不会损坏原文件"""
+    with ui_config_lock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+        stat = os.stat(path)
+        _ui_config_cache[path] = ((stat.st_mtime_ns, stat.st_size), config)